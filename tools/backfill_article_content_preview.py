@@ -0,0 +1,52 @@
+# Script:
+#
+# fills in article.content_preview for the articles that were
+# saved before the column was added; the preview is the beginning
+# of the content (see Article._set_content)
+#
+# the articles are updated in batches of consecutive ids, with a commit
+# after each batch, so the script can be interrupted and run again
+#
+# call like this:
+#
+#      python -m tools.backfill_article_content_preview [batch_size]
+#
+import sys
+
+from sqlalchemy import text, func
+
+from zeeguu.api.app import create_app
+from zeeguu.core.model import db, Article
+from zeeguu.core.model.article import MAX_CHAR_COUNT_IN_SUMMARY
+
+app = create_app()
+app.app_context().push()
+
+BATCH_SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+# LEFT counts characters, not bytes, like the slicing in Python does
+BACKFILL_BATCH = """
+    UPDATE article
+    SET content_preview = LEFT(content, :preview_length)
+    WHERE id >= :first_id
+        AND id < :first_id + :batch_size
+        AND content_preview IS NULL
+        AND content IS NOT NULL
+"""
+
+max_id = db.session.query(func.max(Article.id)).scalar() or 0
+print(f"backfilling the content preview of the articles up to id {max_id}...")
+
+for first_id in range(1, max_id + 1, BATCH_SIZE):
+    result = db.session.execute(
+        text(BACKFILL_BATCH),
+        {
+            "first_id": first_id,
+            "batch_size": BATCH_SIZE,
+            "preview_length": MAX_CHAR_COUNT_IN_SUMMARY,
+        },
+    )
+    db.session.commit()
+    print(f"ids {first_id}-{first_id + BATCH_SIZE - 1}: {result.rowcount} articles")
+
+print("done.")
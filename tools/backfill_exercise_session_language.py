@@ -0,0 +1,52 @@
+# Script:
+#
+# fills in user_exercise_session.language_id for the sessions that
+# were recorded before the column was added; the language of a session
+# is the language of the word practiced in its first exercise, like for
+# the sessions that are tagged when their first exercise is recorded
+#
+# the sessions are updated in batches of consecutive ids, with a commit
+# after each batch, so the script can be interrupted and run again
+#
+# call like this:
+#
+#      python -m tools.backfill_exercise_session_language [batch_size]
+#
+import sys
+
+from sqlalchemy import text, func
+
+from zeeguu.api.app import create_app
+from zeeguu.core.model import db, UserExerciseSession
+
+app = create_app()
+app.app_context().push()
+
+BATCH_SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+BACKFILL_BATCH = """
+    UPDATE user_exercise_session
+    SET language_id = (SELECT uw.language_id
+                        FROM exercise e
+                        INNER JOIN bookmark_exercise_mapping bem ON e.id = bem.exercise_id
+                        INNER JOIN bookmark b ON bem.bookmark_id = b.id
+                        INNER JOIN user_word uw ON b.origin_id = uw.id
+                        WHERE e.session_id = user_exercise_session.id
+                        ORDER BY e.time, e.id, b.id
+                        LIMIT 1)
+    WHERE id >= :first_id
+        AND id < :first_id + :batch_size
+        AND language_id IS NULL
+"""
+
+max_id = db.session.query(func.max(UserExerciseSession.id)).scalar() or 0
+print(f"backfilling the language of the exercise sessions up to id {max_id}...")
+
+for first_id in range(1, max_id + 1, BATCH_SIZE):
+    result = db.session.execute(
+        text(BACKFILL_BATCH), {"first_id": first_id, "batch_size": BATCH_SIZE}
+    )
+    db.session.commit()
+    print(f"ids {first_id}-{first_id + BATCH_SIZE - 1}: {result.rowcount} sessions")
+
+print("done.")
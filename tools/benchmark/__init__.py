@@ -0,0 +1,14 @@
+"""
+
+Benchmark harness for the hottest API endpoints.
+
+Generates a synthetic dataset (users, articles, bookmarks, schedules,
+exercises, activity events) and drives the endpoints through the
+Flask test client; ES and the translators are replaced by local
+stand-ins, so no network is needed.
+
+Run from the root of the repo:
+
+    python -m tools.benchmark.run_benchmark --users 10 --bookmarks-per-user 500
+
+"""
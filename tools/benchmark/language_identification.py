@@ -0,0 +1,86 @@
+"""
+
+Benchmark of the language identification of the pages that the browser
+extension sends to /is_article_language_supported: the LanguageIdentifier
+(a sample of the text of the page, with and without its cache) compared
+with langdetect on the whole text of the page, as it was done before
+
+Run from the root of the repo:
+
+    python -m tools.benchmark.language_identification
+    python -m tools.benchmark.language_identification --pages path/to/saved/pages --repeat 20
+
+"""
+
+import argparse
+import os
+import re
+import time
+
+from langdetect import DetectorFactory, detect
+
+from zeeguu.core.content_quality.language_identification import LanguageIdentifier
+from zeeguu.core.model.article import HTML_TAG_CLEANR
+
+SAVED_PAGES = os.path.join("zeeguu", "core", "test", "test_data")
+
+
+def _load_pages(folder):
+    pages = {}
+    for file_name in sorted(os.listdir(folder)):
+        if file_name.endswith(".html"):
+            with open(os.path.join(folder, file_name), encoding="utf-8") as f:
+                pages[file_name] = f.read()
+    return pages
+
+
+def _full_text_detect(html_content):
+    return detect(re.sub(HTML_TAG_CLEANR, "", html_content))
+
+
+def _ms_per_page(identify, pages, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html_content in pages.values():
+            identify(html_content)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(pages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument(
+        "--pages", default=SAVED_PAGES, help="a folder with saved .html pages"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="how many times each page is timed"
+    )
+    args = parser.parse_args()
+
+    pages = _load_pages(args.pages)
+    print(
+        f"{len(pages)} pages, {sum(map(len, pages.values())) // len(pages)} chars on average"
+    )
+
+    # such that the full text detection is deterministic too
+    DetectorFactory.seed = 0
+    uncached = LanguageIdentifier(cache_size=0)
+    cached = LanguageIdentifier()
+
+    print(f"{'page':<32} {'full text':>10} {'sampled':>10}")
+    for file_name, html_content in pages.items():
+        print(
+            f"{file_name:<32} {_full_text_detect(html_content):>10} {str(uncached.language_of_html(html_content)):>10}"
+        )
+
+    print()
+    print(f"{'identification':<32} {'ms/page':>10}")
+    for name, identify in [
+        ("full text", _full_text_detect),
+        ("sampled", uncached.language_of_html),
+        ("sampled, cached", cached.language_of_html),
+    ]:
+        print(f"{name:<32} {_ms_per_page(identify, pages, args.repeat):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
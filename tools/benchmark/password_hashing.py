@@ -0,0 +1,55 @@
+"""
+
+Micro-benchmark of the password hashers: how many logins (i.e. password
+verifications) per second one core can do with each of them, compared
+with the legacy password_hash
+
+Run from the root of the repo:
+
+    python -m tools.benchmark.password_hashing --seconds 3
+
+"""
+
+import argparse
+import os
+import time
+
+from zeeguu.core.util import password_hash
+from zeeguu.core.util.password import PASSWORD_HASHERS, verify_password
+
+PASSWORD = "correct horse battery staple"
+
+
+def _logins_per_second(encoded, salt, seconds):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        assert verify_password(PASSWORD, salt, encoded)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument(
+        "--seconds", type=float, default=2, help="how long to time each hasher"
+    )
+    args = parser.parse_args()
+
+    salt = os.urandom(32)
+    hashes = {"legacy (1000 x sha1)": password_hash(PASSWORD, salt)}
+    for scheme, hasher in PASSWORD_HASHERS.items():
+        hashes[scheme] = hasher.encode(PASSWORD, salt)
+
+    print(f"{'hasher':<32} {'logins/s':>10} {'ms/login':>10}")
+    for name, encoded in hashes.items():
+        if "$" in encoded:
+            name = encoded.rsplit("$", 1)[0]
+        logins_per_second = _logins_per_second(encoded, salt, args.seconds)
+        print(
+            f"{name:<32} {logins_per_second:>10.1f} {1000 / logins_per_second:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+
+Drives the hottest endpoints through the Flask test client against
+a synthetic dataset and reports, per endpoint, the p50/p95 latency
+and the number of SQL statements per request.
+
+By default everything runs in an in-memory sqlite DB. With
+--configured-db the app is created with the config from ZEEGUU_CONFIG;
+point that to a scratch MySQL DB: the synthetic data is not removed.
+
+Examples:
+
+    python -m tools.benchmark.run_benchmark
+    python -m tools.benchmark.run_benchmark --users 5 --bookmarks-per-user 1000 --requests 100
+    python -m tools.benchmark.run_benchmark --es-latency-ms 30 --json results.json
+
+"""
+
+import argparse
+import json
+import math
+import random
+import time
+from datetime import datetime
+
+from tools.benchmark.stand_ins import local_external_services
+from tools.benchmark.synthetic_data import (
+    generate_dataset,
+    LEARNED_LANGUAGE,
+    NATIVE_LANGUAGE,
+)
+from zeeguu.core.constants import EVENT_USER_SCROLL
+from zeeguu.core.util.encoding import datetime_to_json
+
+
+def _recommended(client, dataset, i):
+    return client.get(f"/user_articles/recommended?session={_session(dataset, i)}")
+
+
+def _bookmarks_in_pipeline(client, dataset, i):
+    return client.get(f"/bookmarks_in_pipeline?session={_session(dataset, i)}")
+
+
+def _top_bookmarks_to_study(client, dataset, i):
+    return client.get(f"/top_bookmarks_to_study?session={_session(dataset, i)}")
+
+
+def _get_one_translation(client, dataset, i):
+    # mostly words that the user did not translate before;
+    # sometimes one they did, which takes the own-past-translation path
+    word = random.choice(dataset.vocabulary)
+    if random.random() < 0.8:
+        word += str(i)
+    return client.post(
+        f"/get_one_translation/{LEARNED_LANGUAGE}/{NATIVE_LANGUAGE}"
+        f"?session={_session(dataset, i)}",
+        data=dict(
+            word=word,
+            context=f"Das ist ein Satz mit {word} in der Mitte.",
+            articleID=random.choice(dataset.article_ids),
+        ),
+    )
+
+
+def _upload_user_activity_data(client, dataset, i):
+    return client.post(
+        f"/upload_user_activity_data?session={_session(dataset, i)}",
+        data=dict(
+            time=datetime_to_json(datetime.now()),
+            event=EVENT_USER_SCROLL,
+            value="",
+            extra_data="{}",
+            article_id=random.choice(dataset.article_ids),
+        ),
+    )
+
+
+SCENARIOS = {
+    "/user_articles/recommended": _recommended,
+    "/bookmarks_in_pipeline": _bookmarks_in_pipeline,
+    "/top_bookmarks_to_study": _top_bookmarks_to_study,
+    "/get_one_translation": _get_one_translation,
+    "/upload_user_activity_data": _upload_user_activity_data,
+}
+
+
+def _session(dataset, i):
+    return dataset.session_uuids[i % len(dataset.session_uuids)]
+
+
+def percentile(values, p):
+    """
+    nearest-rank percentile; exact, unlike the bucketed
+    estimates of the instrumentation histograms
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class ScenarioResult:
+    def __init__(self, name):
+        self.name = name
+        self.latencies_ms = []
+        self.sql_counts = []
+        self.errors = 0
+
+    def as_dictionary(self):
+        return dict(
+            endpoint=self.name,
+            requests=len(self.latencies_ms),
+            errors=self.errors,
+            p50_ms=round(percentile(self.latencies_ms, 50), 1),
+            p95_ms=round(percentile(self.latencies_ms, 95), 1),
+            max_ms=round(max(self.latencies_ms), 1),
+            p50_sql=percentile(self.sql_counts, 50),
+            p95_sql=percentile(self.sql_counts, 95),
+            max_sql=max(self.sql_counts),
+        )
+
+
+def run_scenario(client, sql_counts, dataset, name, scenario, requests, warmup):
+    result = ScenarioResult(name)
+
+    for i in range(warmup + requests):
+        sql_counts.clear()
+        start = time.perf_counter()
+        response = scenario(client, dataset, i)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if i < warmup:
+            continue
+
+        if response.status_code != 200:
+            result.errors += 1
+        result.latencies_ms.append(elapsed_ms)
+        result.sql_counts.append(sql_counts[0] if sql_counts else 0)
+
+    return result
+
+
+def print_table(results):
+    columns = [
+        "endpoint",
+        "requests",
+        "errors",
+        "p50_ms",
+        "p95_ms",
+        "max_ms",
+        "p50_sql",
+        "p95_sql",
+        "max_sql",
+    ]
+    rows = [[str(each.as_dictionary()[c]) for c in columns] for each in results]
+    widths = [max(len(c), *(len(r[i]) for r in rows)) for i, c in enumerate(columns)]
+
+    print()
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(v.ljust(w) for v, w in zip(row, widths)))
+    print()
+
+
+def _create_app(configured_db):
+    from zeeguu.api.app import create_app
+
+    app = create_app(testing=not configured_db)
+    app.config["INSTRUMENT_REQUESTS"] = True
+    return app
+
+
+def _record_sql_counts(app):
+    # registered after the instrumentation hooks; Flask calls the
+    # after_request functions in reverse order, so at this point
+    # the metrics of the request are still available
+    from zeeguu.core.instrumentation import current_request_metrics
+
+    sql_counts = []
+
+    @app.after_request
+    def _remember_sql_count(response):
+        metrics = current_request_metrics()
+        if metrics is not None:
+            sql_counts.append(metrics.sql_count)
+        return response
+
+    return sql_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument("--bookmarks-per-user", type=int, default=300)
+    parser.add_argument("--exercises-per-bookmark", type=int, default=3)
+    parser.add_argument("--events-per-user", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--es-latency-ms", type=int, default=0)
+    parser.add_argument("--translator-latency-ms", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=SCENARIOS.keys(),
+        help="run only the given endpoint(s)",
+    )
+    parser.add_argument("--configured-db", action="store_true")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    app = _create_app(args.configured_db)
+    sql_counts = _record_sql_counts(app)
+
+    with app.app_context():
+        from zeeguu.core.model import db
+
+        db.create_all()
+
+        print("generating the synthetic dataset...")
+        dataset = generate_dataset(
+            db.session,
+            user_count=args.users,
+            article_count=args.articles,
+            bookmarks_per_user=args.bookmarks_per_user,
+            exercises_per_bookmark=args.exercises_per_bookmark,
+            events_per_user=args.events_per_user,
+            seed=args.seed,
+        )
+        db.session.remove()
+
+        results = []
+        with local_external_services(
+            args.es_latency_ms, args.translator_latency_ms
+        ), app.test_client() as client:
+            for name, scenario in SCENARIOS.items():
+                if args.only and name not in args.only:
+                    continue
+                print(f"benchmarking {name}...")
+                results.append(
+                    run_scenario(
+                        client,
+                        sql_counts,
+                        dataset,
+                        name,
+                        scenario,
+                        args.requests,
+                        args.warmup,
+                    )
+                )
+
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                dict(
+                    parameters=vars(args),
+                    results=[each.as_dictionary() for each in results],
+                ),
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
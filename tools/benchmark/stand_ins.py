@@ -0,0 +1,107 @@
+"""
+
+Local replacements for the external services, such that the
+benchmark measures our code and not the network:
+
+ - LocalElasticsearch answers the recommender queries from the DB
+ - fake_translation answers like the translators would
+
+Both can simulate the latency of the real service.
+
+"""
+
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest import mock
+
+from zeeguu.core.instrumentation import external_call
+from zeeguu.core.model import Article, Language
+
+
+class LocalElasticsearch:
+    """
+    Answers es.search with the most recent articles in the language
+    that the query asks for; the rest of the query (topics, difficulty,
+    decay functions) is ignored.
+    """
+
+    latency_ms = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def search(self, index=None, body=None, **kwargs):
+        _simulate_latency(self.latency_ms)
+        body = body or {}
+
+        query = Article.query.filter_by(broken=0)
+        language_name = _find_value_for_key(body, "language")
+        if language_name:
+            query = query.join(Language).filter(Language.name == language_name)
+
+        ids = [
+            each.id
+            for each in query.order_by(Article.published_time.desc())
+            .offset(int(body.get("from", 0)))
+            .limit(int(body.get("size", 10)))
+            .with_entities(Article.id)
+        ]
+
+        return {
+            "hits": {
+                "total": {"value": len(ids)},
+                "hits": [dict(_id=each, _score=1.0) for each in ids],
+            }
+        }
+
+
+def fake_translation(latency_ms=0):
+    def get_next_results(data, exclude_services=[], exclude_results=[], **kwargs):
+        with external_call("translator"):
+            _simulate_latency(latency_ms)
+        return SimpleNamespace(
+            translations=[
+                dict(
+                    translation=f"{data['word']}-{data['to_lang_code']}",
+                    quality=90,
+                    service_name="Benchmark",
+                )
+            ]
+        )
+
+    return get_next_results
+
+
+@contextmanager
+def local_external_services(es_latency_ms=0, translator_latency_ms=0):
+    LocalElasticsearch.latency_ms = es_latency_ms
+    with mock.patch(
+        "zeeguu.core.content_recommender.elastic_recommender.Elasticsearch",
+        LocalElasticsearch,
+    ), mock.patch(
+        "zeeguu.api.endpoints.translation.get_next_results",
+        fake_translation(translator_latency_ms),
+    ):
+        yield
+
+
+def _simulate_latency(ms):
+    if ms:
+        time.sleep(ms / 1000)
+
+
+def _find_value_for_key(nested, key):
+    if isinstance(nested, dict):
+        for k, v in nested.items():
+            if k == key and isinstance(v, str):
+                return v
+            found = _find_value_for_key(v, key)
+            if found:
+                return found
+    elif isinstance(nested, list):
+        for each in nested:
+            found = _find_value_for_key(each, key)
+            if found:
+                return found
+    return None
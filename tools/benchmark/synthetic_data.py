@@ -0,0 +1,304 @@
+"""
+
+Populates the DB with a synthetic dataset that has the shape of the
+production data: every user has hundreds of bookmarks, most of them
+in the scheduler, each with a history of exercises, and a long log
+of reading activity events.
+
+The generation is seeded, so two runs with the same parameters
+produce the same dataset.
+
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from faker import Faker
+
+from zeeguu.core.constants import (
+    EVENT_OPEN_ARTICLE,
+    EVENT_ARTICLE_FOCUSED,
+    EVENT_ARTICLE_LOST_FOCUS,
+    EVENT_USER_SCROLL,
+    EVENT_TRANSLATE_TEXT,
+    EVENT_ARTICLE_CLOSED,
+)
+from zeeguu.core.model import (
+    Article,
+    Bookmark,
+    DailyLearnerActivity,
+    Exercise,
+    ExerciseOutcome,
+    ExerciseSource,
+    Feed,
+    Language,
+    Session,
+    Text,
+    Url,
+    User,
+    UserActivityData,
+    UserExerciseSession,
+    UserWord,
+)
+from zeeguu.core.model.learning_cycle import LearningCycle
+from zeeguu.core.word_scheduling import TwoLearningCyclesPerWord, ONE_DAY
+
+LEARNED_LANGUAGE = "de"
+NATIVE_LANGUAGE = "en"
+
+EXERCISE_SOURCES = ["Recognize", "Multiple_Choice", "Translate_L2_to_L1", "Audio"]
+EXERCISE_OUTCOMES = [
+    ExerciseOutcome.CORRECT,
+    ExerciseOutcome.CORRECT,
+    ExerciseOutcome.CORRECT,
+    ExerciseOutcome.WRONG,
+    ExerciseOutcome.TYPO,
+    ExerciseOutcome.SHOW_SOLUTION,
+    ExerciseOutcome.ASKED_FOR_HINT,
+]
+
+READING_EVENTS = [
+    EVENT_ARTICLE_FOCUSED,
+    EVENT_ARTICLE_LOST_FOCUS,
+    EVENT_USER_SCROLL,
+    EVENT_USER_SCROLL,
+    EVENT_USER_SCROLL,
+    EVENT_TRANSLATE_TEXT,
+    EVENT_ARTICLE_CLOSED,
+]
+
+COOLING_INTERVALS = [0, ONE_DAY, 2 * ONE_DAY, 4 * ONE_DAY, 8 * ONE_DAY]
+
+# share of the bookmarks of a user that ...
+SCHEDULED_SHARE = 0.6  # ... are in the pipeline
+LEARNED_SHARE = 0.1  # ... have been learned already
+
+DAYS_OF_HISTORY = 90
+
+
+@dataclass
+class SyntheticDataset:
+    user_ids: list = field(default_factory=list)
+    session_uuids: list = field(default_factory=list)
+    article_ids: list = field(default_factory=list)
+    vocabulary: list = field(default_factory=list)
+
+
+def generate_dataset(
+    session,
+    user_count=10,
+    article_count=300,
+    bookmarks_per_user=300,
+    exercises_per_bookmark=3,
+    events_per_user=200,
+    vocabulary_size=3000,
+    seed=42,
+):
+    """
+    :return: SyntheticDataset with the ids that the benchmark needs
+    to build its requests
+    """
+    random.seed(seed)
+    Faker.seed(seed)
+    faker_de = Faker("de_DE")
+    faker_en = Faker("en_US")
+
+    learned_language = Language.find_or_create(LEARNED_LANGUAGE)
+    native_language = Language.find_or_create(NATIVE_LANGUAGE)
+
+    dataset = SyntheticDataset()
+
+    articles = _generate_articles(session, faker_de, learned_language, article_count)
+    dataset.article_ids = [each.id for each in articles]
+
+    origins, translations = _generate_vocabulary(
+        session,
+        faker_de,
+        faker_en,
+        learned_language,
+        native_language,
+        vocabulary_size,
+    )
+    dataset.vocabulary = [each.word for each in origins]
+
+    sources = [ExerciseSource.find_or_create(session, s) for s in EXERCISE_SOURCES]
+    outcomes = {
+        o: ExerciseOutcome.find_or_create(session, o) for o in EXERCISE_OUTCOMES
+    }
+
+    for i in range(user_count):
+        user = User(
+            f"benchmark_{seed}_{i}@zeeguu.test",
+            faker_en.name(),
+            "benchmark",
+            learned_language=learned_language,
+            native_language=native_language,
+        )
+        session.add(user)
+        session.flush()
+        user.create_default_user_preference()
+        user.set_learned_language(LEARNED_LANGUAGE, session=session)
+        user.set_learned_language_level(LEARNED_LANGUAGE, "3", session=session)
+
+        user_session = Session.create_for_user(user)
+        session.add(user_session)
+        session.commit()
+
+        _generate_bookmarks_and_exercises(
+            session,
+            user,
+            articles,
+            origins,
+            translations,
+            sources,
+            outcomes,
+            min(bookmarks_per_user, len(origins)),
+            exercises_per_bookmark,
+        )
+        _generate_activity(session, user, articles, events_per_user)
+        session.commit()
+
+        dataset.user_ids.append(user.id)
+        dataset.session_uuids.append(user_session.uuid)
+        print(f"generated data for user {i + 1}/{user_count}")
+
+    # the data above is inserted directly, not through the code
+    # that keeps the daily aggregates up to date
+    DailyLearnerActivity.rebuild(session)
+
+    return dataset
+
+
+def _random_past_time(days=DAYS_OF_HISTORY):
+    return datetime.now() - timedelta(minutes=random.randint(0, days * ONE_DAY))
+
+
+def _generate_articles(session, faker, language, count):
+    feed_url = Url.find_or_create(session, "https://benchmark.zeeguu.test/rss")
+    feed = Feed(feed_url, "Benchmark Feed", "Synthetic articles", language=language)
+    session.add(feed)
+
+    articles = []
+    for i in range(count):
+        url = Url.find_or_create(
+            session, f"https://benchmark.zeeguu.test/articles/{i}", ""
+        )
+        content = "\n\n".join(faker.paragraphs(nb=random.randint(4, 12)))
+        article = Article(
+            url,
+            faker.sentence(nb_words=6),
+            faker.name(),
+            content,
+            None,
+            _random_past_time(days=30),
+            feed,
+            language,
+        )
+        session.add(article)
+        articles.append(article)
+    session.commit()
+    return articles
+
+
+def _generate_vocabulary(session, faker_de, faker_en, learned, native, size):
+    # words are unique per language in the user_word table
+    origin_words = list(dict.fromkeys(faker_de.words(nb=size)))
+    translation_words = list(dict.fromkeys(faker_en.words(nb=size)))
+
+    origins = [UserWord(w, learned) for w in origin_words]
+    translations = [UserWord(w, native) for w in translation_words]
+    session.add_all(origins + translations)
+    session.commit()
+    return origins, translations
+
+
+def _generate_bookmarks_and_exercises(
+    session,
+    user,
+    articles,
+    origins,
+    translations,
+    sources,
+    outcomes,
+    bookmark_count,
+    exercises_per_bookmark,
+):
+    exercise_sessions = {}
+
+    for origin in random.sample(origins, bookmark_count):
+        article = random.choice(articles)
+        context = " ".join(
+            [*article.content.split()[:6], origin.word, *article.content.split()[6:9]]
+        )
+        text = Text(context, origin.language, article.url, article)
+        # the Bookmark constructor looks for other bookmarks in the same text
+        session.add(text)
+        session.flush()
+
+        bookmark = Bookmark(
+            origin,
+            random.choice(translations),
+            user,
+            text,
+            _random_past_time(),
+            learning_cycle=LearningCycle.RECEPTIVE,
+        )
+        session.add(bookmark)
+
+        dice = random.random()
+        if dice < LEARNED_SHARE:
+            bookmark.learned_time = _random_past_time(days=10)
+        elif dice < LEARNED_SHARE + SCHEDULED_SHARE:
+            schedule = TwoLearningCyclesPerWord(bookmark)
+            schedule.cooling_interval = random.choice(COOLING_INTERVALS)
+            schedule.consecutive_correct_answers = random.randint(0, 4)
+            schedule.next_practice_time = datetime.now() + timedelta(
+                minutes=random.randint(-5 * ONE_DAY, 10 * ONE_DAY)
+            )
+            session.add(schedule)
+        else:
+            continue
+
+        for _ in range(random.randint(1, 2 * exercises_per_bookmark)):
+            time = _random_past_time()
+            day = time.date()
+            if day not in exercise_sessions:
+                exercise_session = UserExerciseSession(
+                    user.id, time, time + timedelta(minutes=10)
+                )
+                session.add(exercise_session)
+                session.flush()
+                exercise_sessions[day] = exercise_session
+
+            exercise = Exercise(
+                outcomes[random.choice(EXERCISE_OUTCOMES)],
+                random.choice(sources),
+                random.randint(500, 15000),
+                time,
+                exercise_sessions[day].id,
+            )
+            bookmark.add_new_exercise(exercise)
+            session.add(exercise)
+
+
+def _generate_activity(session, user, articles, event_count):
+    article = random.choice(articles)
+    for _ in range(event_count):
+        if random.random() < 0.05:
+            article = random.choice(articles)
+            event = EVENT_OPEN_ARTICLE
+        else:
+            event = random.choice(READING_EVENTS)
+
+        session.add(
+            UserActivityData(
+                user,
+                _random_past_time(),
+                event,
+                "",
+                "{}",
+                has_article_id=True,
+                article_id=article.id,
+            )
+        )
@@ -0,0 +1,28 @@
+"""
+
+Compiles the word lists in zeeguu/core/word_filter/data into the
+lexicon files that the word filters memory map (see word_filter/lexicon.py)
+
+Must be run again every time one of the lists changes; until then,
+every process builds the changed lexicon in its own memory
+
+    python -m tools.compile_lexicons
+
+"""
+
+from zeeguu.core.word_filter.lexicon import Lexicon, save_lexicon
+from zeeguu.core.word_filter.profanity_filter import (
+    PATH_TO_BAD_WORDS_LEXICON,
+    load_bad_words,
+)
+from zeeguu.core.word_filter.proper_noun_filter import (
+    PATH_TO_PROPER_NAMES_LEXICON,
+    load_proper_name_list,
+)
+
+for path, load_words in [
+    (PATH_TO_BAD_WORDS_LEXICON, load_bad_words),
+    (PATH_TO_PROPER_NAMES_LEXICON, load_proper_name_list),
+]:
+    save_lexicon(load_words(), path)
+    print(f"{path}: {len(Lexicon.open(path))} words")
@@ -0,0 +1,47 @@
+# Script:
+#
+# deletes the sessions that were not used for more than
+# DAYS_BEFORE_EXPIRE days; the API would not accept them anymore
+# anyway (see zeeguu/api/endpoints/sessions.py)
+#
+# the sessions are deleted in batches, with a commit after
+# each batch, so the table is never locked for long
+#
+# call like this:
+#
+#      python -m tools.delete_expired_sessions [batch_size]
+#
+import sys
+from datetime import datetime, timedelta
+
+from zeeguu.api.app import create_app
+from zeeguu.api.endpoints.sessions import DAYS_BEFORE_EXPIRE
+from zeeguu.core.model import db, Session
+
+app = create_app()
+app.app_context().push()
+
+BATCH_SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+# is_session_too_old counts whole days
+expired_before = datetime.now() - timedelta(days=DAYS_BEFORE_EXPIRE + 1)
+print(f"deleting the sessions last used before {expired_before}...")
+
+deleted_count = 0
+while True:
+    ids = [
+        id
+        for (id,) in db.session.query(Session.id)
+        .filter(Session.last_use < expired_before)
+        .limit(BATCH_SIZE)
+    ]
+    if not ids:
+        break
+    db.session.query(Session).filter(Session.id.in_(ids)).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+    deleted_count += len(ids)
+    print(f"{deleted_count} sessions deleted")
+
+print("done.")
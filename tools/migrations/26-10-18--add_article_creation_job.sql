@@ -0,0 +1,22 @@
+/*
+ Articles requested with /find_or_create_article with async that are
+ created in the background; the clients poll /article_creation_job/<id>
+ */
+CREATE TABLE `article_creation_job` (
+    `id` INT NOT NULL AUTO_INCREMENT,
+    `url` VARCHAR(2083) NOT NULL,
+    `html_content` MEDIUMTEXT NULL,
+    `title` VARCHAR(512) NULL,
+    `authors` VARCHAR(512) NULL,
+    `user_id` INT NULL,
+    `status` VARCHAR(32) NOT NULL,
+    `error` VARCHAR(512) NULL,
+    `article_id` INT NULL,
+    `created_at` DATETIME NOT NULL,
+    `finished_at` DATETIME NULL,
+    PRIMARY KEY (`id`),
+    INDEX `article_creation_job_status_created_at` (`status`, `created_at`),
+    INDEX `article_creation_job_url` (`url`(255)),
+    CONSTRAINT `article_creation_job_user_fk` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`),
+    CONSTRAINT `article_creation_job_article_fk` FOREIGN KEY (`article_id`) REFERENCES `article` (`id`)
+) COLLATE = utf8_bin;
@@ -0,0 +1,21 @@
+/*
+ The queue of the jobs that the API hands off to be done
+ by tools/run_background_jobs.py (e.g. sending emails)
+ */
+CREATE TABLE `background_job` (
+    `id` INT NOT NULL AUTO_INCREMENT,
+    `task` VARCHAR(64) NOT NULL,
+    `payload` MEDIUMTEXT NOT NULL,
+    `idempotency_key` VARCHAR(255) NULL,
+    `status` VARCHAR(32) NOT NULL,
+    `attempts` INT NOT NULL DEFAULT 0,
+    `max_attempts` INT NOT NULL,
+    `last_error` VARCHAR(512) NULL,
+    `created_at` DATETIME NOT NULL,
+    `run_after` DATETIME NOT NULL,
+    `started_at` DATETIME NULL,
+    `finished_at` DATETIME NULL,
+    PRIMARY KEY (`id`),
+    UNIQUE INDEX `background_job_idempotency_key` (`idempotency_key`),
+    INDEX `background_job_status_run_after` (`status`, `run_after`)
+) COLLATE = utf8_bin;
@@ -0,0 +1,17 @@
+/*
+ The beginning of the content of an article; what the lists of
+ articles show as its summary. Set whenever the content is set.
+
+ The lists of articles can thus be built without loading the
+ content and the htmlContent of every article.
+
+ After running this, fill in the column for the existing articles with:
+
+     python -m tools.backfill_article_content_preview
+ */
+ALTER TABLE
+    `article`
+ADD
+    COLUMN `content_preview` VARCHAR(300) NULL
+AFTER
+    `summary`;
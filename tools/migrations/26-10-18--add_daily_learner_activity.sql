@@ -0,0 +1,23 @@
+/*
+ Per user, language, and day aggregates of the learner activity,
+ read by the activity statistics instead of the raw sessions and bookmarks.
+
+ After creating the table, fill it in with:
+
+     python -m tools.rebuild_daily_learner_activity
+ */
+CREATE TABLE `daily_learner_activity` (
+    `id` INT NOT NULL AUTO_INCREMENT,
+    `user_id` INT NOT NULL,
+    `language_id` INT NULL,
+    `day` DATE NOT NULL,
+    `reading_ms` INT NOT NULL DEFAULT 0,
+    `exercise_ms` INT NOT NULL DEFAULT 0,
+    `bookmarks_created` INT NOT NULL DEFAULT 0,
+    `exercises_done` INT NOT NULL DEFAULT 0,
+    `words_learned` INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (`id`),
+    UNIQUE INDEX `daily_learner_activity_user_language_day` (`user_id`, `language_id`, `day`),
+    CONSTRAINT `daily_learner_activity_user_fk` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`),
+    CONSTRAINT `daily_learner_activity_language_fk` FOREIGN KEY (`language_id`) REFERENCES `language` (`id`)
+) COLLATE = utf8_bin;
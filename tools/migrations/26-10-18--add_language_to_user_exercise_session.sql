@@ -0,0 +1,21 @@
+/*
+ The language of the exercises in an exercise session; set when the
+ first exercise of the session is recorded.
+
+ The statistics for a language can thus look only at the sessions of
+ a user instead of at all the exercises in the language.
+
+ After running this, fill in the column for the existing sessions with:
+
+     python -m tools.backfill_exercise_session_language
+ */
+ALTER TABLE
+    `user_exercise_session`
+ADD
+    COLUMN `language_id` INT NULL
+AFTER
+    `user_id`,
+ADD
+    CONSTRAINT `user_exercise_session_language_fk` FOREIGN KEY (`language_id`) REFERENCES `language` (`id`),
+ADD
+    INDEX `user_exercise_session_user_language_start` (`user_id`, `language_id`, `start_time`);
@@ -0,0 +1,71 @@
+# Script:
+#
+# synthesizes the speech for the most bookmarked words of a language,
+# such that the learners find them in the audio cache already
+#
+# call like this for the 1000 most bookmarked German words:
+#
+#      python -m tools.pregenerate_speech de 1000
+#
+# or for all the languages that can be learned:
+#
+#      python -m tools.pregenerate_speech all 1000
+#
+# if the files in the cache were changed by hand, first run:
+#
+#      python -m tools.pregenerate_speech --rebuild-manifest
+#
+import argparse
+
+from sqlalchemy import func
+
+from zeeguu.api.app import create_app
+from zeeguu.core.model import db, Bookmark, Language, UserWord
+from zeeguu.core.text_to_speech import audio_cache
+
+parser = argparse.ArgumentParser(description="Pre-generate the speech of words")
+parser.add_argument("language", nargs="?", help="language code or 'all'")
+parser.add_argument("count", nargs="?", type=int, default=1000)
+parser.add_argument("--rebuild-manifest", action="store_true")
+args = parser.parse_args()
+
+app = create_app()
+app.app_context().push()
+
+cache = audio_cache()
+
+
+def most_bookmarked_words(language, count):
+    return [
+        word
+        for (word, _) in db.session.query(UserWord.word, func.count(Bookmark.id))
+        .join(Bookmark, Bookmark.origin_id == UserWord.id)
+        .filter(UserWord.language_id == language.id)
+        .group_by(UserWord.word)
+        .order_by(func.count(Bookmark.id).desc())
+        .limit(count)
+    ]
+
+
+def pregenerate(language, count):
+    words = most_bookmarked_words(language, count)
+    synthesized = 0
+    for word in words:
+        if cache.cached_path(word, language.code):
+            continue
+        try:
+            cache.path_for(word, language.code)
+            synthesized += 1
+        except Exception as e:
+            print(f"failed to synthesize {word}: {e}")
+    print(f"{language.code}: {len(words)} words, {synthesized} newly synthesized")
+
+
+if args.rebuild_manifest:
+    print(f"{cache.rebuild_manifest()} files in the manifest")
+
+if args.language == "all":
+    for each in Language.available_languages():
+        pregenerate(each, args.count)
+elif args.language:
+    pregenerate(Language.find(args.language), args.count)
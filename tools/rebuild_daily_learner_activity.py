@@ -0,0 +1,39 @@
+# Script:
+#
+# recomputes the daily_learner_activity aggregates from the
+# reading and exercise sessions, bookmarks, and exercises
+#
+# the counters are normally kept up to date as the activity is saved;
+# run this once after creating the table, and periodically (e.g. nightly,
+# for the last few days) to correct for anything that was not recorded
+#
+# call like this to rebuild everything:
+#
+#      python -m tools.rebuild_daily_learner_activity
+#
+# or only the last two days, or only one user:
+#
+#      python -m tools.rebuild_daily_learner_activity --days 2
+#      python -m tools.rebuild_daily_learner_activity --user-id 534
+#
+import argparse
+from datetime import datetime, timedelta
+
+from zeeguu.api.app import create_app
+from zeeguu.core.model import db, DailyLearnerActivity
+
+parser = argparse.ArgumentParser(description="Rebuild the daily learner activity")
+parser.add_argument("--days", type=int, help="only the last given number of days")
+parser.add_argument("--user-id", type=int, help="only the given user")
+args = parser.parse_args()
+
+app = create_app()
+app.app_context().push()
+
+since = None
+if args.days is not None:
+    since = datetime.now() - timedelta(days=args.days)
+
+print(f"rebuilding the daily learner activity (user: {args.user_id}, since: {since})")
+row_count = DailyLearnerActivity.rebuild(db.session, args.user_id, since)
+print(f"done: {row_count} user-language-days.")
@@ -4,6 +4,7 @@ from zeeguu.core.model.article_topic_map import TopicOriginType
 from tools.crawl_summary.crawl_report import CrawlReport
 import seaborn as sns
 from data_extractor import DataExtractor
+from report_cache import ReportCache
 from sqlalchemy import create_engine
 import datetime
 import os
@@ -412,6 +413,28 @@ def generate_exercise_activity(exercise_activity_df, lang=""):
     return save_fig_params(filename)
 
 
+def generate_daily_activity_plot(daily_activity_df, column, title, ylabel):
+    filename = f"daily_{column}_plot_{date_str}_d{DAYS_FOR_REPORT}.png"
+    ax = plt.subplot(111)
+    sns.lineplot(data=daily_activity_df, x="day", y=column, hue="Language")
+    plt.title(title)
+    set_legend_to_right_side(ax)
+    plt.xticks(rotation=35, ha="right")
+    plt.ylabel(ylabel)
+    return save_fig_params(filename)
+
+
+def generate_daily_activity(daily_activity_df):
+    if daily_activity_df.empty:
+        return "<p><b>No activity in this period</b></p>"
+    return f"""
+        <img src="{generate_daily_activity_plot(daily_activity_df, "articles", "Articles Crawled per Day", "Total Articles")}" />
+        <img src="{generate_daily_activity_plot(daily_activity_df, "bookmarks", "Bookmarks per Day", "Total Bookmarks")}" />
+        <img src="{generate_daily_activity_plot(daily_activity_df, "reading_time", "Reading Time per Day", "Total Reading time (mins)")}" />
+        <img src="{generate_daily_activity_plot(daily_activity_df, "exercise_time", "Exercise Time per Day", "Total Exercise time (mins)")}" />
+        """
+
+
 def print_descriptive_stats(df, title, precision=2):
     print(f"############## {title} Descriptive Stats ##############")
     print(df.describe().round(precision).to_string())
@@ -537,7 +560,20 @@ def generate_html_page():
     total_unique_articles_opened_by_users = (
         user_reading_time_df.Language.value_counts().reset_index()["count"].sum()
     )
-    exercise_activity_df = data_extractor.get_exercise_type_activity()
+    if INCREMENTAL:
+        # the per-day aggregates of the days before the last report are
+        # in the cache; only the rows added since then are read
+        report_cache = ReportCache(
+            os.path.join(FOLDER_FOR_REPORT_OUTPUT, "report_cache.sqlite"),
+            db_connection,
+        )
+        report_cache.update(DAYS_FOR_REPORT)
+        exercise_activity_df = report_cache.exercise_type_activity(
+            language_df, DAYS_FOR_REPORT
+        )
+        daily_activity_df = report_cache.daily_activity(language_df, DAYS_FOR_REPORT)
+    else:
+        exercise_activity_df = data_extractor.get_exercise_type_activity()
     top_subscribed_searches = data_extractor.get_top_search_subscriptions()
     top_filtered_searches = data_extractor.get_top_search_filters()
     newly_added_search_subscriptions = data_extractor.get_added_search_subscriptions()
@@ -661,6 +697,11 @@ def generate_html_page():
         <img src="{generate_topic_reading_time(topic_reading_time_df)}" />
         <img src="{generate_bookmarks_by_language_plot(bookmark_df)}" />
         """
+    if INCREMENTAL:
+        result += f"""
+        <h2>Daily Activity</h2>
+        {generate_daily_activity(daily_activity_df)}
+        """
     result += f"""
             <p><a href="#removed-articles">Removed Sents Table</a><p>
             <p><a href="#new-url-keywords">New keywords without topics</a><p>
@@ -712,8 +753,14 @@ if __name__ == "__main__":
         help="Number of days from the current date that will be cnsidered for the report.",
         type=int,
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep the per-day activity in a cache in the reports folder, and only read the activity since the last report.",
+    )
     args = parser.parse_args()
     DAYS_FOR_REPORT = args.number_of_days
+    INCREMENTAL = args.incremental
     print(
         f"## Reporting for the last {DAYS_FOR_REPORT} days, today is: {datetime.datetime.now()}"
     )
@@ -0,0 +1,349 @@
+import datetime
+import math
+import sqlite3
+
+import pandas as pd
+from sqlalchemy import text
+
+from data_extractor import ms_to_mins
+
+# the rows are read in ranges of this many ids
+CHUNK_SIZE = 50000
+
+# the rows of the last days can still change (e.g. a reading session goes
+# on) so they are read again at every run; only the rows that settled
+# before these days are kept in the cache
+SETTLING_DAYS = 2
+
+
+class DailyAggregate:
+    """
+    A per-day aggregate of the rows of a table: the sums of the values
+    columns for every day and every combination of the keys columns
+
+    The query must select the id and the day of every row, the keys and
+    the values; and filter the rows with :since <= day and
+    :from_id <= id < :to_id. It can also select the day on which a row
+    stops changing, as settles_on, if that is later than its day (e.g.
+    the duration of a reading session grows until its last action)
+    """
+
+    def __init__(self, name, id_column, query, keys, values):
+        self.name = name
+        self.id_column = id_column
+        self.query = query
+        self.keys = keys
+        self.values = values
+
+
+DAILY_AGGREGATES = [
+    DailyAggregate(
+        "articles",
+        "article.id",
+        """SELECT a.id, DATE(a.published_time) day, a.language_id, a.feed_id,
+            1 articles, a.word_count
+        FROM article a
+        WHERE a.published_time >= :since
+        AND a.id >= :from_id AND a.id < :to_id
+        AND a.broken = 0""",
+        keys=["language_id", "feed_id"],
+        values=["articles", "word_count"],
+    ),
+    DailyAggregate(
+        "bookmarks",
+        "bookmark.id",
+        """SELECT b.id, DATE(b.time) day, uw.language_id, 1 bookmarks
+        FROM bookmark b
+        INNER JOIN user_word uw ON b.origin_id = uw.id
+        WHERE b.time >= :since
+        AND b.id >= :from_id AND b.id < :to_id""",
+        keys=["language_id"],
+        values=["bookmarks"],
+    ),
+    DailyAggregate(
+        "reading",
+        "user_reading_session.id",
+        """SELECT urs.id, DATE(urs.start_time) day,
+            DATE(COALESCE(urs.last_action_time, urs.start_time)) settles_on,
+            a.language_id, a.feed_id, urs.duration reading_time,
+            1 reading_sessions
+        FROM user_reading_session urs
+        INNER JOIN article a ON urs.article_id = a.id
+        INNER JOIN user u ON urs.user_id = u.id
+        WHERE urs.start_time >= :since
+        AND urs.id >= :from_id AND urs.id < :to_id
+        AND u.learned_language_id = a.language_id""",
+        keys=["language_id", "feed_id"],
+        values=["reading_time", "reading_sessions"],
+    ),
+    DailyAggregate(
+        "exercises",
+        "exercise.id",
+        """SELECT e.id, DATE(e.time) day, uw.language_id, es.source,
+            e.solving_speed exercise_time, 1 exercises
+        FROM exercise e
+        INNER JOIN user_exercise_session ues ON e.session_id = ues.id
+        INNER JOIN user u ON ues.user_id = u.id
+        INNER JOIN bookmark_exercise_mapping bem ON e.id = bem.exercise_id
+        INNER JOIN bookmark b ON b.id = bem.bookmark_id AND b.user_id = u.id
+        INNER JOIN user_word uw ON b.origin_id = uw.id
+        INNER JOIN exercise_source es on es.id = e.source_id
+        WHERE e.time >= :since
+        AND e.id >= :from_id AND e.id < :to_id
+        AND uw.language_id = u.learned_language_id""",
+        keys=["language_id", "source"],
+        values=["exercise_time", "exercises"],
+    ),
+]
+
+
+class ReportCache:
+    """
+    The per-day aggregates of the report (see DAILY_AGGREGATES) kept in
+    a local SQLite file, such that a report only reads the rows that were
+    added since the previous one, instead of the whole period again
+
+    For every aggregate the cache remembers the period it has, the last
+    id it read, and the id of the first row that was not settled at that
+    time; every update reads the rows from that id on in ranges of ids,
+    aggregates the ones that are new or were not settled before per day,
+    and saves those that are settled now. The rows that are not settled
+    yet are only kept in memory, for the report that is being generated
+
+    The ids grow with the time the rows are added, not with their days;
+    e.g. an article can be crawled days after it was published. Such a
+    row is new because of its id, and is added to the (settled) day it
+    belongs to in the cache
+    """
+
+    def __init__(self, path, db_connection, chunk_size=CHUNK_SIZE):
+        self.db_connection = db_connection
+        self.chunk_size = chunk_size
+        self.cache = sqlite3.connect(path)
+        self.cache.execute("""CREATE TABLE IF NOT EXISTS checkpoint (
+                name TEXT PRIMARY KEY,
+                cached_from TEXT,
+                cached_until TEXT,
+                resume_id INTEGER,
+                read_until_id INTEGER)""")
+        for aggregate in DAILY_AGGREGATES:
+            columns = ", ".join(["day"] + aggregate.keys + aggregate.values)
+            self.cache.execute(
+                f"CREATE TABLE IF NOT EXISTS {aggregate.name} ({columns})"
+            )
+        self.recent = {}
+
+    def update(self, days_for_report, today=None):
+        today = today or datetime.date.today()
+        start = (today - datetime.timedelta(days=days_for_report)).isoformat()
+        settled_until = (today - datetime.timedelta(days=SETTLING_DAYS)).isoformat()
+
+        for aggregate in DAILY_AGGREGATES:
+            self._update(aggregate, start, settled_until)
+
+    def totals(self, name, days_for_report, today=None):
+        """
+        :return: the aggregate over the last days_for_report days;
+        one row for every combination of the keys
+        """
+        aggregate = self._aggregate(name)
+        daily = self.daily(name, days_for_report, today)
+        return (
+            daily.groupby(aggregate.keys, dropna=False)[aggregate.values]
+            .sum()
+            .reset_index()
+        )
+
+    def daily(self, name, days_for_report, today=None):
+        """
+        :return: the aggregate for every one of the last days_for_report days
+        """
+        today = today or datetime.date.today()
+        start = (today - datetime.timedelta(days=days_for_report)).isoformat()
+
+        cached = pd.read_sql(
+            f"SELECT * FROM {name} WHERE day >= ?", self.cache, params=[start]
+        )
+        recent = self.recent[name]
+        return pd.concat([cached, recent[recent.day >= start]], ignore_index=True)
+
+    def exercise_type_activity(self, language_df, days_for_report):
+        # the same as DataExtractor.get_exercise_type_activity
+        exercises = self.totals("exercises", days_for_report)
+        exercises = _with_language_names(exercises, language_df).rename(
+            columns={
+                "source": "Source",
+                "exercise_time": "total_exercise_time",
+                "exercises": "total_exercises",
+            }
+        )
+        exercises["total_exercise_time"] = exercises["total_exercise_time"].apply(
+            ms_to_mins
+        )
+        return exercises[
+            ["Language", "Source", "total_exercise_time", "total_exercises"]
+        ]
+
+    def daily_activity(self, language_df, days_for_report):
+        """
+        :return: for every day and language: the articles, the bookmarks,
+        the reading time, and the exercise time (in minutes)
+        """
+        result = None
+        for name, values in [
+            ("articles", ["articles"]),
+            ("bookmarks", ["bookmarks"]),
+            ("reading", ["reading_time"]),
+            ("exercises", ["exercise_time"]),
+        ]:
+            per_language = (
+                self.daily(name, days_for_report)
+                .groupby(["day", "language_id"])[values]
+                .sum()
+                .reset_index()
+            )
+            result = (
+                per_language
+                if result is None
+                else result.merge(per_language, on=["day", "language_id"], how="outer")
+            )
+        result = result.fillna(0)
+        result["reading_time"] = result["reading_time"].apply(ms_to_mins)
+        result["exercise_time"] = result["exercise_time"].apply(ms_to_mins)
+        return _with_language_names(result, language_df).sort_values("day")
+
+    def _aggregate(self, name):
+        return next(each for each in DAILY_AGGREGATES if each.name == name)
+
+    def _checkpoint(self, name):
+        return self.cache.execute(
+            """SELECT cached_from, cached_until, resume_id, read_until_id
+            FROM checkpoint WHERE name = ?""",
+            [name],
+        ).fetchone()
+
+    def _update(self, aggregate, start, settled_until):
+        checkpoint = self._checkpoint(aggregate.name)
+        if checkpoint is None:
+            cached_from, cached_until, resume_id, read_until_id = start, start, 0, 0
+        else:
+            cached_from, cached_until, resume_id, read_until_id = checkpoint
+
+        # the rows that were saved already are the ones that were read
+        # before, and were settled at that time
+        settled, unsettled, first_unsettled_id, max_id = self._read(
+            aggregate,
+            cached_from,
+            resume_id,
+            settled_until,
+            lambda rows: (rows.id > read_until_id) | (rows.settles_on >= cached_until),
+        )
+        if start < cached_from:
+            # a longer period than the ones before; none of the rows of
+            # the days before the cached ones were saved
+            older_settled, older_unsettled, older_first_unsettled_id, _ = self._read(
+                aggregate, start, 0, settled_until, lambda rows: rows.day < cached_from
+            )
+            settled = pd.concat([older_settled, settled], ignore_index=True)
+            unsettled = pd.concat([older_unsettled, unsettled], ignore_index=True)
+            first_unsettled_id = min(first_unsettled_id, older_first_unsettled_id)
+            cached_from = start
+
+        with self.cache:
+            self._save(aggregate, settled)
+            self.cache.execute(
+                "INSERT OR REPLACE INTO checkpoint VALUES (?, ?, ?, ?, ?)",
+                [
+                    aggregate.name,
+                    cached_from,
+                    max(cached_until, settled_until),
+                    min(first_unsettled_id, max_id + 1),
+                    max(read_until_id, max_id),
+                ],
+            )
+
+        self.recent[aggregate.name] = unsettled
+
+    def _read(self, aggregate, since, from_id, settled_until, to_aggregate):
+        """
+        Reads the rows from the day since on, and from from_id on; and
+        aggregates the ones for which to_aggregate(rows) is True per day
+
+        :return: the aggregates of the rows that settled before
+        settled_until, and of the others; the smallest id of the others
+        (or infinity); and the largest id there was
+        """
+        with self.db_connection.connect() as connection:
+            max_id = connection.execute(
+                text(f"SELECT MAX(id) FROM {aggregate.id_column.split('.')[0]}")
+            ).scalar()
+        max_id = max_id or 0
+
+        print(f"Reading the {aggregate.name} from id {from_id}...")
+        settled_chunks = []
+        unsettled_chunks = []
+        first_unsettled_id = math.inf
+        for chunk_from_id in range(from_id, max_id + 1, self.chunk_size):
+            rows = pd.read_sql(
+                text(aggregate.query),
+                con=self.db_connection,
+                params=dict(
+                    since=since,
+                    from_id=chunk_from_id,
+                    # not the rows that are added while reading
+                    to_id=min(chunk_from_id + self.chunk_size, max_id + 1),
+                ),
+            )
+            if rows.empty:
+                continue
+            rows["day"] = rows["day"].astype(str)
+            if "settles_on" in rows:
+                rows["settles_on"] = rows["settles_on"].astype(str)
+            else:
+                rows["settles_on"] = rows["day"]
+
+            rows = rows[to_aggregate(rows)]
+            settled = rows.settles_on < settled_until
+            if not settled.all():
+                first_unsettled_id = min(
+                    first_unsettled_id, int(rows.loc[~settled, "id"].min())
+                )
+            settled_chunks.append(_per_day(aggregate, rows[settled]))
+            unsettled_chunks.append(_per_day(aggregate, rows[~settled]))
+
+        return (
+            _concat_per_day(aggregate, settled_chunks),
+            _concat_per_day(aggregate, unsettled_chunks),
+            first_unsettled_id,
+            max_id,
+        )
+
+    def _save(self, aggregate, rows):
+        # not with DataFrame.to_sql, which commits; the rows and the
+        # checkpoint must be saved in the same transaction
+        columns = ["day"] + aggregate.keys + aggregate.values
+        rows = rows[columns].astype(object)
+        self.cache.executemany(
+            f"INSERT INTO {aggregate.name} VALUES ({', '.join('?' * len(columns))})",
+            rows.where(rows.notna(), None).to_dict("split")["data"],
+        )
+
+
+def _per_day(aggregate, rows):
+    return (
+        rows.groupby(["day"] + aggregate.keys, dropna=False)[aggregate.values]
+        .sum()
+        .reset_index()
+    )
+
+
+def _concat_per_day(aggregate, chunks):
+    if not chunks:
+        return pd.DataFrame(columns=["day"] + aggregate.keys + aggregate.values)
+    return _per_day(aggregate, pd.concat(chunks, ignore_index=True))
+
+
+def _with_language_names(df, language_df):
+    names = language_df.set_index("id")["name"]
+    df["Language"] = df.language_id.map(names)
+    return df
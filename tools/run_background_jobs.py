@@ -0,0 +1,52 @@
+# Script:
+#
+# the worker that runs the background jobs that the API hands off
+# (see zeeguu.core.background_jobs); several of them can run at once
+#
+# call like this to keep running, checking for new jobs every few seconds:
+#
+#      python -m tools.run_background_jobs
+#
+# or like this, e.g. from a cron job, to run the due jobs and exit:
+#
+#      python -m tools.run_background_jobs --once
+#
+import argparse
+from datetime import datetime, timedelta
+from time import sleep
+
+from zeeguu.api.app import create_app
+from zeeguu.core.background_jobs import run_due_jobs
+from zeeguu.core.model import db, BackgroundJob
+
+parser = argparse.ArgumentParser(description="Run the background jobs")
+parser.add_argument("--once", action="store_true", help="exit when done")
+parser.add_argument(
+    "--sleep", type=int, default=5, help="seconds to wait when there are no jobs"
+)
+parser.add_argument(
+    "--stuck-after",
+    type=int,
+    default=30,
+    help="minutes after which a running job is considered abandoned",
+)
+args = parser.parse_args()
+
+app = create_app()
+app.app_context().push()
+
+while True:
+    released = BackgroundJob.release_stuck(
+        db.session, datetime.now() - timedelta(minutes=args.stuck_after)
+    )
+    if released:
+        print(f"{released} abandoned jobs are pending again")
+
+    run_count = run_due_jobs(db.session)
+
+    if args.once:
+        print(f"ran {run_count} jobs")
+        break
+
+    if not run_count:
+        sleep(args.sleep)
@@ -0,0 +1,44 @@
+# Script:
+#
+# recomputes bookmark.fit_for_study, e.g. after the rules in
+# zeeguu/core/bookmark_quality/negative_qualities.py changed
+#
+# the bookmarks are evaluated in batches, with a commit after each
+# batch (see bookmark_quality/bulk_fit_for_study.py)
+#
+# call like this to update all the bookmarks:
+#
+#      python -m tools.update_fit_for_study
+#
+# or only the ones of a user, or in a text:
+#
+#      python -m tools.update_fit_for_study --user-id 534
+#      python -m tools.update_fit_for_study --text-id 1234
+#
+import argparse
+
+from zeeguu.api.app import create_app
+from zeeguu.core.bookmark_quality.bulk_fit_for_study import (
+    BATCH_SIZE,
+    update_fit_for_study,
+)
+from zeeguu.core.model import db, Bookmark
+
+parser = argparse.ArgumentParser(description="Recompute fit_for_study")
+parser.add_argument("--user-id", type=int, help="only the given user")
+parser.add_argument("--text-id", type=int, help="only the given text")
+parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+args = parser.parse_args()
+
+app = create_app()
+app.app_context().push()
+
+query = db.session.query(Bookmark)
+if args.user_id is not None:
+    query = query.filter(Bookmark.user_id == args.user_id)
+if args.text_id is not None:
+    query = query.filter(Bookmark.text_id == args.text_id)
+
+print(f"updating fit_for_study (user: {args.user_id}, text: {args.text_id})")
+changed_count = update_fit_for_study(db.session, query, args.batch_size)
+print(f"done: {changed_count} bookmarks changed.")
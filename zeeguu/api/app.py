@@ -71,10 +71,30 @@ def create_app(testing=False):
     with app.app_context():
         db.create_all()
 
+    # the reference tables, the scheduling snapshots, and the
+    # session uses might have been cached from a different DB
+    from zeeguu.core.model.reference_table_cache import invalidate_all_reference_caches
+
+    invalidate_all_reference_caches()
+
+    from zeeguu.core.word_scheduling.basicSR.scheduling_snapshot import (
+        invalidate_all_scheduling_snapshots,
+    )
+
+    invalidate_all_scheduling_snapshots()
+
+    from zeeguu.core.model.session_activity import SESSION_ACTIVITY
+
+    SESSION_ACTIVITY.clear()
+
     from .endpoints import api
 
     app.register_blueprint(api)
 
+    from zeeguu.api.utils.request_instrumentation import instrument_requests
+
+    instrument_requests(app)
+
     # We're saving the zeeguu.core.app so we can refer to the config from deep in the code...
     zeeguu.core.app = app
 
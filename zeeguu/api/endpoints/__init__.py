@@ -33,3 +33,4 @@ from . import user_notifications
 from .student import *
 from .nlp import *
 from .reading_sessions import *
+from . import request_metrics
@@ -151,9 +151,8 @@ def send_code(email):
 
     code = UniqueCode(email)
     db_session.add(code)
-    db_session.commit()
-
     send_password_reset_email(email, code)
+    db_session.commit()
 
     return "OK"
 
@@ -5,8 +5,12 @@ from zeeguu.core.user_activity_hooks.article_interaction_hooks import (
 )
 
 from . import api, db_session
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
-from zeeguu.core.model import UserActivityData, User
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
+from zeeguu.core.model import UserActivityData
 
 
 @api.route("/upload_user_activity_data", methods=["POST"])
@@ -32,7 +36,7 @@ def upload_user_activity_data():
 
     :return: OK if all went well
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     UserActivityData.create_from_post_data(db_session, request.form, user)
 
     if request.form.get("article_id", None):
@@ -42,6 +46,7 @@ def upload_user_activity_data():
         from zeeguu.core.emailer.zeeguu_mailer import ZeeguuMailer
 
         ZeeguuMailer.notify_audio_experiment(request.form, user)
+        db_session.commit()
 
     return "OK"
 
@@ -1,16 +1,18 @@
 import flask
 from flask import request
-from zeeguu.core.model import Article, Language, User, Topic
+from zeeguu.core.content_retriever import article_creation
+from zeeguu.core.model import Article, ArticleCreationJob, Language, Topic, Url
 from zeeguu.core.model.article_topic_user_feedback import ArticleTopicUserFeedback
 from zeeguu.api.utils import json_result
 from zeeguu.core.model.personal_copy import PersonalCopy
 from sqlalchemy.orm.exc import NoResultFound
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from . import api, db_session
-from zeeguu.core.model.article import HTML_TAG_CLEANR
-
-import re
-from langdetect import detect
+from zeeguu.core.content_quality.language_identification import LANGUAGE_IDENTIFIER
 
 
 # ---------------------------------------------------------------------------
@@ -25,9 +27,15 @@ def find_or_create_article():
         - url of the article: str
         - htmlContent: str
         - title: str
+        - async: str (optional; "true" to not wait for a new article to be created)
 
     :return: article id as json (e.g. {article_id: 123})
 
+        with async, if the article does not exist yet, its creation is
+        started in the background and the response is (with status 202)
+        e.g. {id: 42, status: "pending"}: the id of the job that can be
+        polled at /article_creation_job/<id>
+
     """
 
     url = request.form.get("url", "")
@@ -38,6 +46,9 @@ def find_or_create_article():
     if not url:
         flask.abort(400)
 
+    if request.form.get("async", "false") == "true":
+        return _find_or_start_creating_article(url, html_content, title, authors)
+
     try:
         article = Article.find_or_create(
             db_session, url, html_content=html_content, title=title, authors=authors
@@ -52,6 +63,54 @@ def find_or_create_article():
         flask.abort(500)
 
 
+def _find_or_start_creating_article(url, html_content, title, authors):
+    canonical_url = Url.extract_canonical_url(url)
+    article = Article.find(canonical_url)
+    if article:
+        return json_result(article.article_info())
+
+    job = ArticleCreationJob.find_or_create(
+        db_session,
+        canonical_url,
+        html_content=html_content,
+        title=title,
+        authors=authors,
+        user=get_current_user(),
+    )
+    article_creation.submit(db_session, job)
+
+    db_session.refresh(job)
+    return _article_creation_job_result(job)
+
+
+# ---------------------------------------------------------------------------
+@api.route("/article_creation_job/<int:job_id>", methods=("GET",))
+# ---------------------------------------------------------------------------
+@cross_domain
+@requires_session
+def article_creation_job(job_id):
+    """
+    The status of an article that was requested with
+    /find_or_create_article with async
+
+    :return: e.g. {id: 42, status: "pending"}; once the status is "done"
+    the article info is under the "article" key; the other final
+    statuses are "unsupported_language" and "failed"
+    """
+    job = ArticleCreationJob.find_by_id(job_id)
+    if not job:
+        flask.abort(404)
+
+    return _article_creation_job_result(job)
+
+
+def _article_creation_job_result(job):
+    response = json_result(job.as_dictionary())
+    if not job.is_finished():
+        response.status_code = 202
+    return response
+
+
 # ---------------------------------------------------------------------------
 @api.route("/make_personal_copy", methods=("POST",))
 # ---------------------------------------------------------------------------
@@ -60,7 +119,7 @@ def find_or_create_article():
 def make_personal_copy():
     article_id = request.form.get("article_id", "")
     article = Article.find_by_id(article_id)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
 
     if not PersonalCopy.exists_for(user, article):
         PersonalCopy.make_for(user, article, db_session)
@@ -76,7 +135,7 @@ def make_personal_copy():
 def remove_personal_copy():
     article_id = request.form.get("article_id", "")
     article = Article.find_by_id(article_id)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
 
     if PersonalCopy.exists_for(user, article):
         PersonalCopy.remove_for(user, article, db_session)
@@ -102,14 +161,10 @@ def is_article_language_supported():
 
     htmlContent = request.form.get("htmlContent", "")
 
-    text = re.sub(HTML_TAG_CLEANR, "", htmlContent)
-    try:
-        lang = detect(text)
-        if lang in Language.CODES_OF_LANGUAGES_THAT_CAN_BE_LEARNED:
-            return "YES"
-        else:
-            return "NO"
-    except:
+    lang = LANGUAGE_IDENTIFIER.language_of_html(htmlContent)
+    if lang in Language.CODES_OF_LANGUAGES_THAT_CAN_BE_LEARNED:
+        return "YES"
+    else:
         return "NO"
 
 
@@ -122,7 +177,7 @@ def remove_ml_suggestion():
     of the new topics. Can indicate that the prediciton
     isn't correct.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     article_id = request.form.get("article_id", "")
     topic = request.form.get("topic", "")
     article = Article.find_by_id(article_id)
@@ -5,11 +5,22 @@ from flask import request
 from sqlalchemy.orm.exc import NoResultFound
 
 from zeeguu.core.bookmark_quality import top_bookmarks
-from zeeguu.core.model import User, Article, Bookmark, ExerciseSource, ExerciseOutcome
+from zeeguu.core.model import (
+    User,
+    Article,
+    Bookmark,
+    DailyLearnerActivity,
+    ExerciseSource,
+    ExerciseOutcome,
+)
 from zeeguu.core.model.bookmark_user_preference import UserWordExPreference
 from . import api, db_session
 from zeeguu.api.utils.json_result import json_result
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from zeeguu.core.word_scheduling import BasicSRSchedule
 
 
@@ -20,7 +31,7 @@ def studied_words():
     """
     Returns a list of the words that the user is currently studying.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return json_result(user.user_words())
 
 
@@ -31,9 +42,9 @@ def top_bookmarks_route(count):
     """
     Returns a list of the words that the user is currently studying.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     bookmarks = top_bookmarks(user, count)
-    json_bookmarks = [b.json_serializable_dict(True) for b in bookmarks]
+    json_bookmarks = Bookmark.json_serializable_dicts(bookmarks, True)
     return json_result(json_bookmarks)
 
 
@@ -44,9 +55,9 @@ def learned_bookmarks(count):
     """
     Returns a list of the words that the user is currently studying.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     top_bookmarks = user.learned_bookmarks(count)
-    json_bookmarks = [b.json_serializable_dict(True) for b in top_bookmarks]
+    json_bookmarks = Bookmark.json_serializable_dicts(top_bookmarks, True)
     return json_result(json_bookmarks)
 
 
@@ -57,9 +68,9 @@ def starred_bookmarks(count):
     """
     Returns a list of the words that the user is currently studying.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     top_bookmarks = user.starred_bookmarks(count)
-    json_bookmarks = [b.json_serializable_dict(True) for b in top_bookmarks]
+    json_bookmarks = Bookmark.json_serializable_dicts(top_bookmarks, True)
     return json_result(json_bookmarks)
 
 
@@ -74,7 +85,7 @@ def get_bookmarks_by_day(return_context):
     is anything else, the context is not returned.
 
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     with_context = return_context == "with_context"
     return json_result(user.bookmarks_by_day(with_context))
 
@@ -100,7 +111,7 @@ def post_bookmarks_by_day():
     with_title = request.form.get("with_title", "false") in ["True", "true"]
     after_date_string = request.form.get("after_date", "1970-01-01T00:00:00")
     after_date = datetime.strptime(after_date_string, "%Y-%m-%dT%H:%M:%S")
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return json_result(
         user.bookmarks_by_day(with_context, after_date, with_title=with_title)
     )
@@ -139,7 +150,7 @@ def bookmarks_for_article(article_id, user_id):
 @requires_session
 def bookmarks_to_study_for_article(article_id):
 
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     article = Article.query.filter_by(id=article_id).one()
 
     bookmarks = user.bookmarks_for_article(
@@ -175,6 +186,21 @@ def bookmarks_for_article_2(article_id):
 def delete_bookmark(bookmark_id):
     try:
         bookmark = Bookmark.find(bookmark_id)
+        DailyLearnerActivity.record(
+            db_session,
+            bookmark.user_id,
+            bookmark.origin.language_id,
+            bookmark.time,
+            bookmarks_created=-1,
+        )
+        if bookmark.learned_time:
+            DailyLearnerActivity.record(
+                db_session,
+                bookmark.user_id,
+                bookmark.origin.language_id,
+                bookmark.learned_time,
+                words_learned=-1,
+            )
         db_session.delete(bookmark)
         db_session.commit()
     except NoResultFound:
@@ -43,6 +43,7 @@ def exercise_session_update():
 def exercise_session_end():
     session = update_activity_session(UserExerciseSession, request, db_session)
     send_user_finished_exercise_session(session)
+    db_session.commit()
     return "OK"
 
 
@@ -1,10 +1,15 @@
+import json
 import traceback
-import flask
 
+from zeeguu.core.exercises.exercise_outcomes import report_exercise_outcomes
 from zeeguu.core.exercises.similar_words import similar_words
-from zeeguu.core.model import Bookmark, User
+from zeeguu.core.model import Bookmark
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from zeeguu.api.utils.json_result import json_result
 from . import api, db_session
 from flask import request
@@ -21,9 +26,9 @@ def scheduled_bookmarks_to_study(bookmark_count):
     """
 
     int_count = int(bookmark_count)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     to_study = user.bookmarks_to_study(bookmark_count=int_count, scheduled_only=True)
-    json_bookmarks = [bookmark.json_serializable_dict() for bookmark in to_study]
+    json_bookmarks = Bookmark.json_serializable_dicts(to_study)
     return json_result(json_bookmarks)
 
 
@@ -35,9 +40,9 @@ def top_bookmarks_to_study():
     Return all the possible bookmarks a user has to study ordered by
     how common it is in the language and how close they are to being learned.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     to_study = user.bookmarks_to_study(scheduled_only=False)
-    json_bookmarks = [bookmark.json_serializable_dict() for bookmark in to_study]
+    json_bookmarks = Bookmark.json_serializable_dicts(to_study)
     return json_result(json_bookmarks)
 
 
@@ -49,9 +54,9 @@ def bookmarks_to_learn_not_scheduled():
     Return all the bookmarks that aren't learned and haven't been
     scheduled to the user.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     to_study = user.bookmarks_to_learn_not_in_pipeline()
-    json_bookmarks = [bookmark.json_serializable_dict() for bookmark in to_study]
+    json_bookmarks = Bookmark.json_serializable_dicts(to_study)
 
     return json_result(json_bookmarks)
 
@@ -64,11 +69,9 @@ def bookmarks_in_pipeline():
     Returns all the words in the pipeline to be learned by a user.
     Is used to render the Words tab in Zeeguu
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     bookmarks_in_pipeline = user.bookmarks_in_pipeline()
-    json_bookmarks = [
-        bookmark.json_serializable_dict() for bookmark in bookmarks_in_pipeline
-    ]
+    json_bookmarks = Bookmark.json_serializable_dicts(bookmarks_in_pipeline)
     return json_result(json_bookmarks)
 
 
@@ -80,7 +83,7 @@ def has_bookmarks_in_pipeline_to_review():
     Checks if there is at least one bookmark in the pipeline
     to review today.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     at_least_one_bookmark_in_pipeline = user.bookmarks_to_study(1, scheduled_only=True)
     return json_result(len(at_least_one_bookmark_in_pipeline) > 0)
 
@@ -93,7 +96,7 @@ def has_bookmarks_to_review():
     Checks if there is at least one bookmark that can be exercised
     today.
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     at_least_one_bookmark_in_pipeline = user.bookmarks_to_study(1, scheduled_only=False)
     return json_result(len(at_least_one_bookmark_in_pipeline) > 0)
 
@@ -107,9 +110,9 @@ def new_bookmarks_to_study(bookmark_count):
     are recommended for this user to study and are not in the pipeline
     """
     int_count = int(bookmark_count)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     new_to_study = user.get_new_bookmarks_to_study(int_count)
-    json_bookmarks = [bookmark.json_serializable_dict() for bookmark in new_to_study]
+    json_bookmarks = Bookmark.json_serializable_dicts(new_to_study)
     return json_result(json_bookmarks)
 
 
@@ -121,7 +124,7 @@ def get_total_bookmarks_in_pipeline():
     Returns a number of bookmarks that are in active learning.
     (Means the user has done at least on exercise in the past)
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     total_bookmark_count = user.total_bookmarks_in_pipeline()
     return json_result(total_bookmark_count)
 
@@ -166,22 +169,56 @@ def report_exercise_outcome():
     :return:
     """
 
-    outcome = request.form.get("outcome", "")
-    source = request.form.get("source")
-    solving_speed = request.form.get("solving_speed")
-    bookmark_id = request.form.get("bookmark_id")
-    other_feedback = request.form.get("other_feedback")
+    outcome = dict(
+        outcome=request.form.get("outcome", ""),
+        source=request.form.get("source"),
+        solving_speed=request.form.get("solving_speed"),
+        bookmark_id=request.form.get("bookmark_id"),
+        other_feedback=request.form.get("other_feedback"),
+    )
     session_id = int(request.form.get("session_id"))
 
-    if not solving_speed.isdigit():
-        solving_speed = 0
+    try:
+        report_exercise_outcomes(db_session, get_current_user(), session_id, [outcome])
+        return "OK"
+    except:
+        traceback.print_exc()
+        return "FAIL"
+
+
+@api.route(
+    "/report_exercise_outcomes",
+    methods=["POST"],
+)
+@requires_session
+def report_exercise_outcomes_in_session():
+    """
+    The same as /report_exercise_outcome, but for several exercises
+    of a session at once; either all of them are saved or none is
 
+    The body is a JSON object:
+
+        {
+            "session_id": 123,
+            "outcomes": [
+                {
+                    "bookmark_id": 4,
+                    "outcome": "C",
+                    "source": "Recognize",
+                    "solving_speed": 2300,
+                    "other_feedback": ""
+                },
+                ...
+            ]
+        }
+
+    :return: "OK" or "FAIL"
+    """
     try:
-        bookmark = Bookmark.find(bookmark_id)
-        bookmark.report_exercise_outcome(
-            source, outcome, solving_speed, session_id, other_feedback, db_session
+        data = json.loads(request.data)
+        report_exercise_outcomes(
+            db_session, get_current_user(), int(data["session_id"]), data["outcomes"]
         )
-
         return "OK"
     except:
         traceback.print_exc()
@@ -193,7 +230,7 @@ def report_exercise_outcome():
 @requires_session
 def similar_words_api(bookmark_id):
     bookmark = Bookmark.find(bookmark_id)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return json_result(
         similar_words(bookmark.origin.word, bookmark.origin.language, user)
     )
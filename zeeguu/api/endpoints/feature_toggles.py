@@ -1,8 +1,5 @@
-import flask
-
 from zeeguu.api.endpoints import api
-from zeeguu.api.utils import cross_domain, requires_session
-from zeeguu.core.model import User
+from zeeguu.api.utils import cross_domain, requires_session, get_current_user
 
 
 @api.route("/is_feature_enabled/<feature_name>", methods=["GET"])
@@ -20,7 +17,7 @@ def is_feature_enabled(feature_name):
 
     if not func:
         return "NO"
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     if func(user):
         return "YES"
 
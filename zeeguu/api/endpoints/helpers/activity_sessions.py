@@ -5,6 +5,8 @@
 
 from datetime import datetime
 
+from zeeguu.core.model import DailyLearnerActivity
+
 
 def update_activity_session(session_class, request, db_session):
     form = request.form
@@ -13,9 +15,13 @@ def update_activity_session(session_class, request, db_session):
     duration = int(form.get("duration", 0))
 
     session = session_class.find_by_id(session_id)
+    previous_duration = session.duration
     session.duration = duration
     session.last_action_time = datetime.now()
     db_session.add(session)
+    DailyLearnerActivity.record_session_duration(
+        db_session, session, previous_duration
+    )
     db_session.commit()
 
     return session
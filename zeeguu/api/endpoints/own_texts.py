@@ -1,11 +1,14 @@
-import flask
 import sqlalchemy
 from flask import request
 
-from zeeguu.core.model import Article, Language, CohortArticleMap, UserArticle, User
+from zeeguu.core.model import Article, Language, CohortArticleMap, UserArticle
 from zeeguu.core.model.personal_copy import PersonalCopy
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from zeeguu.api.utils.json_result import json_result
 from . import api, db_session
 
@@ -20,7 +23,7 @@ def upload_own_text():
     content = request.form.get("content", "")
     htmlContent = request.form.get("htmlContent", "")
     title = request.form.get("title", "")
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     new_article_id = Article.create_from_upload(
         db_session, title, content, htmlContent, user, language
     )
@@ -32,13 +35,13 @@ def upload_own_text():
 @cross_domain
 @requires_session
 def own_texts():
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     r = Article.own_texts_for_user(user)
     r2 = PersonalCopy.all_for(user)
     all_articles = r + r2
     all_articles.sort(key=lambda art: art.id, reverse=True)
 
-    article_infos = [UserArticle.user_article_info(user, e) for e in all_articles]
+    article_infos = UserArticle.user_article_infos(user, all_articles)
 
     return json_result(article_infos)
 
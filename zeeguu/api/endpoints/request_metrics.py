@@ -0,0 +1,39 @@
+import flask
+
+from zeeguu.core.instrumentation import metrics_report, reset_metrics
+
+from zeeguu.api.utils.json_result import json_result
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
+from . import api
+
+
+@api.route("/request_metrics", methods=["GET"])
+@cross_domain
+@requires_session
+def request_metrics():
+    """
+    Per route histograms (count, mean, p50, p95, p99, max) of:
+    - wall_ms
+    - sql_count & sql_ms
+    - es_ms & translator_ms (only for routes that call them)
+    - response_kb
+
+    together with the statements that were repeatedly
+    executed within a single request (likely N+1 patterns)
+
+    Only available to dev users. Measured since the
+    process started or since the last ?reset=true
+    """
+    if not get_current_user().is_dev:
+        flask.abort(401)
+
+    report = metrics_report()
+
+    if flask.request.args.get("reset", "false") == "true":
+        reset_metrics()
+
+    return json_result(report)
@@ -1,4 +1,3 @@
-import flask
 from zeeguu.api.utils.abort_handling import make_error
 from zeeguu.logging import log
 from flask import request
@@ -6,11 +5,14 @@ from zeeguu.core.model.search import Search
 from zeeguu.core.model.search_filter import SearchFilter
 from zeeguu.core.model.search_subscription import SearchSubscription
 from zeeguu.core.model.user_article import UserArticle
-from zeeguu.core.model import User
 
 from zeeguu.core.content_recommender import article_search_for_user
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from zeeguu.api.utils.json_result import json_result
 from . import api
 
@@ -52,7 +54,7 @@ def subscribe_to_search(search_terms):
              This is used to display it in the UI.
 
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     search = Search.find_or_create(db_session, search_terms, user.learned_language_id)
     receive_email = False
     subscription = SearchSubscription.find_or_create(
@@ -75,7 +77,7 @@ def unsubscribe_from_search():
     """
 
     search_id = int(request.form.get("search_id", ""))
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     try:
         to_delete = SearchSubscription.with_search_id(search_id, user)
         db_session.delete(to_delete)
@@ -112,7 +114,7 @@ def get_subscribed_searches():
                 id = unique id of the search;
                 search_keywords = <unicode string>
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     subscriptions = SearchSubscription.all_for_user(user)
     searches_list = []
 
@@ -139,7 +141,7 @@ def filter_search(search_terms):
     :param: search_terms -- the search to be filtered.
     :return: the search as a dictionary
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     search = Search.find_or_create(db_session, search_terms, user.learned_language_id)
     SearchFilter.find_or_create(db_session, user, search)
 
@@ -158,7 +160,7 @@ def unfilter_search():
     """
 
     search_id = int(request.form.get("search_id", ""))
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     try:
         to_delete = SearchFilter.with_search_id(search_id, user)
         db_session.delete(to_delete)
@@ -193,7 +195,7 @@ def get_filtered_searches():
                 id = unique id of the topic;
                 search_keywords = <unicode string>
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     filters = SearchFilter.all_for_user(user)
     filtered_searches = []
 
@@ -242,7 +244,7 @@ def search_for_search_terms(search_terms, page: int = 0):
             request.form.get("use_readability_priority", "true") == "true"
         )
 
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     articles = article_search_for_user(
         user,
         20,
@@ -251,7 +253,7 @@ def search_for_search_terms(search_terms, page: int = 0):
         use_published_priority=use_published_priority,
         use_readability_priority=use_readability_priority,
     )
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
     return json_result(article_infos)
 
 
@@ -273,7 +275,7 @@ def search_for_latest_search_terms(search_terms):
 
     """
 
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     articles = article_search_for_user(
         user,
         3,
@@ -283,7 +285,7 @@ def search_for_latest_search_terms(search_terms):
         use_readability_priority=True,
         score_threshold=2,
     )
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
 
     return json_result(article_infos)
 
@@ -296,7 +298,7 @@ def subscribe_to_email_search(search_terms):
     """
     A user can subscribe to email updates about a search
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     search = Search.find(search_terms, user.learned_language_id)
     receive_email = True
     subscription = SearchSubscription.update_receive_email(
@@ -314,7 +316,7 @@ def unsubscribe_from_email_search(search_terms):
     """
     A user can unsubscribe to email updates about a search
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     search = Search.find(search_terms, user.learned_language_id)
 
     receive_email = False
@@ -2,9 +2,13 @@ import flask
 from flask import request
 from zeeguu.api.utils import json_result
 
-from zeeguu.core.model import Cohort, User
+from zeeguu.core.model import Cohort
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from . import api, db_session
 
 
@@ -21,7 +25,7 @@ def join_cohort_api():
 
     try:
         cohort = Cohort.find_by_code(invite_code)
-        user = User.find_by_id(flask.g.user_id)
+        user = get_current_user()
         user.add_user_to_cohort(cohort, db_session)
 
         return "OK"
@@ -37,7 +41,7 @@ def join_cohort_api():
 @cross_domain
 @requires_session
 def student_info():
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     user_cohorts = [c.cohort.get_cohort_info() for c in user.cohorts]
     return json_result(
         {
@@ -16,7 +16,7 @@ from ._permissions import (
     check_permission_for_cohort,
 )
 from .. import api
-from zeeguu.api.utils.route_wrappers import requires_session
+from zeeguu.api.utils.route_wrappers import requires_session, get_current_user
 
 from zeeguu.core.model import db
 
@@ -40,7 +40,7 @@ def send_article_to_colleague():
     print(f"send email confirmation to {receiving_user} ")
     from zeeguu.core.emailer.zeeguu_mailer import ZeeguuMailer
 
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     mail = ZeeguuMailer(
         f"Shared: {article.title}",
         f"Dear {receiving_user.name},\n\n"
@@ -51,7 +51,8 @@ def send_article_to_colleague():
         + "The Zeeguu Team",
         receiving_user.email,
     )
-    mail.send()
+    mail.send_in_background()
+    db.session.commit()
     print("email sent")
 
     return "OK"
@@ -209,7 +210,7 @@ def teacher_texts():
     """
     Gets all the articles of this teacher
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     articles = Article.own_texts_for_user(user)
     article_info_dicts = [article.article_info_for_teacher() for article in articles]
 
@@ -4,6 +4,7 @@ import json
 import flask
 
 from ._only_teachers_decorator import only_teachers
+from ._common_api_parameters import _convert_number_of_days_to_date_interval
 from .helpers import all_user_info_from_cohort
 
 from ._permissions import (
@@ -60,10 +61,14 @@ def users_by_teacher(duration):
 
     from zeeguu.core.model import TeacherCohortMap
 
+    from_date, to_date = _convert_number_of_days_to_date_interval(
+        duration, to_string=True
+    )
+
     mappings = TeacherCohortMap.query.filter_by(user_id=flask.g.user_id).all()
     all_users = []
     for m in mappings:
-        users = all_user_info_from_cohort(m.cohort_id, duration)
+        users = all_user_info_from_cohort(m.cohort_id, from_date, to_date)
         all_users.extend(users)
     return json.dumps(all_users)
 
@@ -4,25 +4,15 @@ import sqlalchemy
 
 from zeeguu.core.model import Cohort, User, Language
 from zeeguu.core.sql.teacher.teachers_for_cohort import teachers_for_cohort
-from zeeguu.core.user_statistics.exercise_corectness import (
-    exercise_count_and_correctness_percentage,
-)
-from zeeguu.core.user_statistics.exercise_sessions import (
-    total_time_in_exercise_sessions,
-)
-from zeeguu.core.user_statistics.reading_sessions import summarize_reading_activity
+from zeeguu.core.user_statistics.cohort_statistics import cohort_student_statistics
 
 
 def student_info_for_teacher_dashboard(user, cohort, from_date: str, to_date: str):
 
     info = {"id": user.id, "name": user.name, "email": user.email}
 
-    info.update(summarize_reading_activity(user.id, cohort.id, from_date, to_date))
-    info.update(total_time_in_exercise_sessions(user.id, cohort.id, from_date, to_date))
     info.update(
-        exercise_count_and_correctness_percentage(
-            user.id, cohort.id, from_date, to_date
-        )
+        cohort_student_statistics([user.id], cohort.id, from_date, to_date)[user.id]
     )
 
     return info
@@ -36,10 +26,15 @@ def all_user_info_from_cohort(id, from_date: str, to_date: str):
 
     c = Cohort.query.filter_by(id=id).one()
     users = User.query.join(UserCohortMap).filter_by(cohort_id=c.id).all()
-    users_info = []
 
+    statistics = cohort_student_statistics(
+        [u.id for u in users], c.id, from_date, to_date
+    )
+
+    users_info = []
     for u in users:
-        info = student_info_for_teacher_dashboard(u, c, from_date, to_date)
+        info = {"id": u.id, "name": u.name, "email": u.email}
+        info.update(statistics[u.id])
 
         users_info.append(info)
     return users_info
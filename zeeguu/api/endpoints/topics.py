@@ -1,4 +1,3 @@
-import flask
 from zeeguu.logging import log
 from flask import request
 from zeeguu.core.model import (
@@ -6,10 +5,13 @@ from zeeguu.core.model import (
     TopicSubscription,
     TopicFilter,
     Language,
-    User,
 )
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from zeeguu.api.utils.json_result import json_result
 from . import api
 
@@ -40,7 +42,7 @@ def subscribe_to_topic_with_id():
     topic_id = int(request.form.get("topic_id", ""))
 
     topic_object = Topic.find_by_id(topic_id)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     TopicSubscription.find_or_create(db_session, user, topic_object)
     db_session.commit()
     return "OK"
@@ -59,7 +61,7 @@ def unsubscribe_from_topic():
     """
 
     topic_id = int(request.form.get("topic_id", ""))
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     try:
         to_delete = TopicSubscription.with_topic_id(topic_id, user)
         db_session.delete(to_delete)
@@ -88,7 +90,7 @@ def get_subscribed_topics():
                 id = unique id of the topic;
                 title = <unicode string>
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     subscriptions = TopicSubscription.all_for_user(user)
     topic_list = []
     for sub in subscriptions:
@@ -119,7 +121,7 @@ def get_available_topics():
     :return:
     """
     topic_data = []
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     already_subscribed = [
         each.topic.id for each in TopicSubscription.all_for_user(user)
     ]
@@ -149,7 +151,7 @@ def subscribe_to_filter_with_id():
     filter_id = int(request.form.get("filter_id", ""))
 
     filter_object = Topic.find_by_id(filter_id)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     TopicFilter.find_or_create(db_session, user, filter_object)
 
     return "OK"
@@ -165,7 +167,7 @@ def unsubscribe_from_filter():
     A user can unsubscribe from the filter with a given ID
     :return: OK / ERROR
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     filter_id = int(request.form.get("topic_id", ""))
 
     try:
@@ -196,7 +198,7 @@ def get_subscribed_filters():
                 id = unique id of the topic;
                 title = <unicode string>
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     filters = TopicFilter.all_for_user(user)
     filter_list = []
     for fil in filters:
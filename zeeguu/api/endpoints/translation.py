@@ -2,7 +2,6 @@ from string import punctuation
 from urllib.parse import unquote_plus
 import os
 
-import flask
 from flask import request
 
 from zeeguu.api.utils.translator import (
@@ -15,11 +14,15 @@ from python_translators.translation_query import TranslationQuery
 from zeeguu.core.crowd_translations import (
     get_own_past_translation,
 )
-from zeeguu.core.model import Bookmark, Article, Text, User
+from zeeguu.core.model import Bookmark, Article, Text
 from zeeguu.core.model.user_word import UserWord
 from . import api, db_session
 from zeeguu.api.utils.json_result import json_result
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 
 punctuation_extended = "»«" + punctuation
 IS_DEV_SKIP_TRANSLATION = int(os.environ.get("DEV_SKIP_TRANSLATION", 0)) == 1
@@ -56,7 +59,7 @@ def get_one_translation(from_lang_code, to_lang_code):
     # - a teacher's translation or a senior user's should still
     # be considered here
     print("getting own past translation....")
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     bookmark = get_own_past_translation(
         user, word_str, from_lang_code, to_lang_code, context
     )
@@ -86,7 +89,6 @@ def get_one_translation(from_lang_code, to_lang_code):
             best_guess = translations[0]["translation"]
             likelihood = translations[0].pop("quality")
             source = translations[0].pop("service_name")
-        user = User.find_by_id(flask.g.user_id)
         bookmark = Bookmark.find_or_create(
             db_session,
             user,
@@ -188,9 +190,11 @@ def update_translation(bookmark_id):
 
     bookmark = Bookmark.find(bookmark_id)
 
-    origin = UserWord.find_or_create(db_session, word_str, bookmark.origin.language)
+    origin = UserWord.find_or_create(
+        db_session, word_str, bookmark.origin.language, commit=False
+    )
     translation = UserWord.find_or_create(
-        db_session, translation_str, bookmark.translation.language
+        db_session, translation_str, bookmark.translation.language, commit=False
     )
     text = Text.find_or_create(
         db_session,
@@ -198,6 +202,7 @@ def update_translation(bookmark_id):
         bookmark.origin.language,
         bookmark.text.url,
         bookmark.text.article,
+        commit=False,
     )
     bookmark.origin = origin
     bookmark.translation = translation
@@ -259,7 +264,7 @@ def contribute_translation(from_lang_code, to_lang_code):
     selected_from_predefined_choices = request.form.get(
         "selected_from_predefined_choices", ""
     )
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     bookmark = Bookmark.find_or_create(
         db_session,
         user,
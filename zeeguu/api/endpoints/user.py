@@ -3,10 +3,13 @@ import json
 import flask
 from zeeguu.api.endpoints.feature_toggles import features_for_user
 import zeeguu.core
-from zeeguu.core.model import User
 
 from zeeguu.api.utils.json_result import json_result
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from . import api
 from ...core.model import UserActivityData, UserArticle, Article
 from zeeguu.core.model.feedback_component import FeedbackComponent
@@ -37,7 +40,7 @@ def learned_language():
         argument together wit your API request
         e.g. API_URL/learned_language?session=123141516
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return user.learned_language.code
 
 
@@ -50,7 +53,7 @@ def learned_language_set(language_code):
     :param language_code: one of the ISO language codes
     :return: "OK" for success
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     user.set_learned_language(language_code, session=zeeguu.core.model.db.session)
     zeeguu.core.model.db.session.commit()
     return "OK"
@@ -60,7 +63,7 @@ def learned_language_set(language_code):
 @cross_domain
 @requires_session
 def native_language():
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return user.native_language.code
 
 
@@ -72,7 +75,7 @@ def native_language_set(language_code):
     :param language_code:
     :return: OK for success
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     user.set_native_language(language_code)
     zeeguu.core.model.db.session.commit()
     return "OK"
@@ -87,7 +90,7 @@ def learned_and_native_language():
     for the user in session
     :return:
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     res = dict(native=user.native_language_id, learned=user.learned_language_id)
     return json_result(res)
 
@@ -103,7 +106,7 @@ def get_user_unfinished_reading_sessions(total_sessions: int = 1):
     Retrieves the last uncompleted sessions based on the SCROLL events of the user.
 
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     last_sessions = UserActivityData.get_scroll_events_for_user_in_date_range(
         user, limit=total_sessions
     )
@@ -141,7 +144,7 @@ def get_user_details():
     :param lang_code:
     :return:
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     details_dict = user.details_as_dictionary()
     details_dict["features"] = features_for_user(user)
 
@@ -157,7 +160,7 @@ def user_settings():
     """
 
     data = flask.request.form
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
 
     submitted_name = data.get("name", None)
     if submitted_name:
@@ -194,7 +197,7 @@ def send_feedback():
     feedback_component_id = int(flask.request.form.get("feedbackComponentId", ""))
     from zeeguu.core.emailer.zeeguu_mailer import ZeeguuMailer
 
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     feedback_component = FeedbackComponent.find_by_id(feedback_component_id)
     if url is not None:
         url = Url.find_or_create(session, url)
@@ -202,10 +205,10 @@ def send_feedback():
     user_feedback = UserFeedback.create(
         session, user, feedback_component, message, url
     )
-    session.commit()
     ZeeguuMailer.send_feedback(
         "Feedback", feedback_component.component_type, message, user
     )
+    session.commit()
     return "OK"
 
 
@@ -220,7 +223,7 @@ def leave_cohort(cohort_id):
     :return: OK for success
     """
     try:
-        user = User.find_by_id(flask.g.user_id)
+        user = get_current_user()
         user.remove_from_cohort(cohort_id, db.session)
         return "OK"
     except Exception as e:
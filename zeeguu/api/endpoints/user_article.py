@@ -1,9 +1,13 @@
 import flask
 from flask import request
-from zeeguu.core.model import Article, UserArticle, User
+from zeeguu.core.model import Article, UserArticle
 from zeeguu.core.model.article_difficulty_feedback import ArticleDifficultyFeedback
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from zeeguu.api.utils.json_result import json_result
 from . import api, db_session
 
@@ -45,7 +49,7 @@ def user_article():
 
     print(article_id)
     article = Article.query.filter_by(id=article_id).one()
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return json_result(UserArticle.user_article_info(user, article, with_content=True))
 
 
@@ -65,7 +69,7 @@ def post_article_difficulty_feedback():
     article = Article.query.filter_by(id=article_id).one()
 
     feedback = request.form.get("difficulty")
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     df = ArticleDifficultyFeedback.find_or_create(
         db_session, user, article, datetime.now(), feedback
     )
@@ -89,7 +93,7 @@ def article_opened():
 
     article_id = int(request.form.get("article_id"))
     article = Article.query.filter_by(id=article_id).one()
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     ua = UserArticle.find_or_create(db_session, user, article)
     ua.set_opened()
 
@@ -121,7 +125,7 @@ def user_article_update():
     liked = request.form.get("liked")
 
     article = Article.query.filter_by(id=article_id).one()
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     user_article = UserArticle.find_or_create(db_session, user, article)
 
     if starred is not None:
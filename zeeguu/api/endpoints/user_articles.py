@@ -1,13 +1,15 @@
-import flask
-
 from zeeguu.core.content_recommender import (
     article_recommendations_for_user,
     topic_filter_for_user,
     content_recommendations,
 )
-from zeeguu.core.model import UserArticle, Article, PersonalCopy, User
+from zeeguu.core.model import UserArticle, Article, PersonalCopy
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from zeeguu.api.utils.json_result import json_result
 from sentry_sdk import capture_exception
 from . import api
@@ -35,7 +37,7 @@ def user_articles_recommended(count: int = 20, page: int = 0):
     are relevant enough. The articles are then sorted by published date.
 
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     try:
         articles = article_recommendations_for_user(user, count, page)
 
@@ -49,7 +51,7 @@ def user_articles_recommended(count: int = 20, page: int = 0):
             .limit(20)
         )
 
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
 
     return json_result(article_infos)
 
@@ -59,13 +61,13 @@ def user_articles_recommended(count: int = 20, page: int = 0):
 @cross_domain
 @requires_session
 def saved_articles(page: int = None):
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     if page is not None:
         saves = PersonalCopy.get_page_for(user, page)
     else:
         saves = PersonalCopy.all_for(user)
 
-    article_infos = [UserArticle.user_article_info(user, e) for e in saves]
+    article_infos = UserArticle.user_article_infos(user, saves)
 
     return json_result(article_infos)
 
@@ -73,10 +75,10 @@ def saved_articles(page: int = None):
 @cross_domain
 @requires_session
 def saved_articles():
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     saves = PersonalCopy.all_for(user)
 
-    article_infos = [UserArticle.user_article_info(user, e) for e in saves]
+    article_infos = UserArticle.user_article_infos(user, saves)
 
     return json_result(article_infos)
 
@@ -97,7 +99,7 @@ def user_articles_topic_filtered():
     max_duration = request.form.get("max_duration", None)
     min_duration = request.form.get("min_duration", None)
     difficulty_level = request.form.get("difficulty_level", None)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
 
     articles = topic_filter_for_user(
         user,
@@ -109,7 +111,7 @@ def user_articles_topic_filtered():
         difficulty_level,
         topic,
     )
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
 
     return json_result(article_infos)
 
@@ -120,7 +122,7 @@ def user_articles_topic_filtered():
 @cross_domain
 @requires_session
 def user_articles_starred_and_liked():
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return json_result(UserArticle.all_starred_and_liked_articles_of_user_info(user))
 
 
@@ -133,7 +135,7 @@ def user_articles_cohort():
     """
     get all articles for the cohort associated with the user
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return json_result(user.cohort_articles_for_user())
 
 
@@ -144,7 +146,7 @@ def user_articles_cohort():
 @requires_session
 def user_articles_foryou():
     article_infos = []
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     try:
         articles = content_recommendations(user.id, user.learned_language_id)
         print("Sending CB recommendations")
@@ -153,6 +155,6 @@ def user_articles_foryou():
         capture_exception(e)
         # Usually no recommendations when the user has not liked any articles
         articles = []
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
 
     return json_result(article_infos)
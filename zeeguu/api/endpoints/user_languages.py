@@ -1,12 +1,14 @@
-import flask
 import zeeguu.core
 from flask import request
 from zeeguu.core.model.language import Language
 from zeeguu.core.model.user_language import UserLanguage
-from zeeguu.core.model import User
 
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from zeeguu.api.utils.json_result import json_result
 from . import api
 
@@ -45,7 +47,7 @@ def modify_user_language():
         language_level = int(request.form.get("language_level", ""))
     except:
         language_level = None
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     language_object = Language.find(language_code)
     user_language = UserLanguage.find_or_create(db_session, user, language_object)
     if language_reading is not None:
@@ -75,7 +77,7 @@ def delete_user_language(language_id):
     """
 
     try:
-        user = User.find_by_id(flask.g.user_id)
+        user = get_current_user()
         to_delete = UserLanguage.with_language_id(language_id, user)
         db_session.delete(to_delete)
         db_session.commit()
@@ -104,7 +106,7 @@ def get_user_languages():
                 language = <unicode string>
     """
     all_user_languages = []
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     user_languages = UserLanguage.all_for_user(user)
     for lan in user_languages:
         all_user_languages.append(lan.as_dictionary())
@@ -127,7 +129,7 @@ def get_reading_languages():
                 language = <unicode string>
     """
     all_user_languages = []
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     reading_languages = Language.all_reading_for_user(user)
     for lan in reading_languages:
         all_user_languages.append(lan.as_dictionary())
@@ -152,7 +154,7 @@ def get_interesting_reading_languages():
 
     all_languages = Language.available_languages()
     all_languages.sort(key=lambda x: x.name)
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     learned_languages = Language.all_reading_for_user(user)
 
     interesting_languages = []
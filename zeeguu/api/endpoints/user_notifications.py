@@ -2,12 +2,15 @@ import flask
 
 
 from zeeguu.api.utils.json_result import json_result
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from . import api, db_session
 from .exercises import scheduled_bookmarks_to_study
 from zeeguu.core.model.user_notification import UserNotification
 from zeeguu.core.model.notification import Notification
-from zeeguu.core.model.user import User
 from zeeguu.core.content_recommender.elastic_recommender import (
     article_recommendations_for_user,
 )
@@ -39,7 +42,7 @@ def get_notification_for_user():
     to practice. Otherwise, we will invite the user to check articles.
     """
     notification_data = {"notification_available": True}
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
 
     # Is there at least one exercise for the user?
     if scheduled_bookmarks_to_study(1):
@@ -86,7 +89,7 @@ def get_notification_for_user():
 @requires_session
 def set_notification_click_date():
     data = flask.request.form
-    # user = User.find_by_id(flask.g.user_id)
+    # user = get_current_user()
     user_notification_id = data.get("user_notification_id", None)
     UserNotification.update_user_notification_time(user_notification_id, db_session)
     db_session.commit()
@@ -3,9 +3,13 @@ import flask
 import zeeguu.core
 
 from zeeguu.api.utils.json_result import json_result
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 from . import api
-from ...core.model import UserPreference, User
+from ...core.model import UserPreference
 
 
 @api.route("/user_preferences", methods=["GET"])
@@ -13,7 +17,7 @@ from ...core.model import UserPreference, User
 @requires_session
 def user_preferences():
     preferences = {}
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     for each in UserPreference.all_for_user(user):
         preferences[each.key] = each.value
 
@@ -25,7 +29,7 @@ def user_preferences():
 @requires_session
 def save_user_preferences():
     data = flask.request.form
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     audio_exercises_value = data.get(UserPreference.AUDIO_EXERCISES, None)
     if audio_exercises_value:
         pref = UserPreference.find_or_create(
@@ -53,7 +57,7 @@ def save_user_preferences():
         )
         translate_reader.value = translate_reader_value
         zeeguu.core.model.db.session.add(translate_reader)
-    
+
     pronounce_reader_value = data.get(UserPreference.PRONOUNCE_IN_READER, None)
     if pronounce_reader_value:
         pronounce_reader = UserPreference.find_or_create(
@@ -1,10 +1,11 @@
-import flask
-
 from zeeguu.api.utils import json_result
 from zeeguu.core.user_statistics.activity import activity_duration_by_day
 from . import api
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
-from zeeguu.core.model import User
+from zeeguu.api.utils.route_wrappers import (
+    cross_domain,
+    requires_session,
+    get_current_user,
+)
 
 
 @api.route("/bookmark_counts_by_date", methods=("GET",))
@@ -14,7 +15,7 @@ def bookmark_counts_by_date():
     """
     Words that have been translated in texts
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return user.bookmark_counts_by_date()
 
 
@@ -25,5 +26,5 @@ def activity_by_day():
     """
     User sessions by day
     """
-    user = User.find_by_id(flask.g.user_id)
+    user = get_current_user()
     return json_result(activity_duration_by_day(user))
@@ -29,3 +29,29 @@ def test_starred_or_liked(client):
     # Still one article is returned
     result = client.get(f"/user_articles/starred_or_liked")
     assert len(result) == 1
+
+
+def test_create_article_asynchronously(client):
+    job = client.post(
+        "/find_or_create_article", dict(url=URL_SPIEGEL_VENEZUELA, **{"async": "true"})
+    )
+
+    # in the tests the job runs right away, in the request
+    assert job["status"] == "done"
+    assert "Venezuela" in job["article"]["title"]
+
+    polled = client.get(f"/article_creation_job/{job['id']}")
+    assert polled["article"]["id"] == job["article"]["id"]
+
+    # once the article exists, it is returned directly
+    article = client.post(
+        "/find_or_create_article", dict(url=URL_SPIEGEL_VENEZUELA, **{"async": "true"})
+    )
+    assert article["id"] == job["article"]["id"]
+
+
+def test_is_article_language_supported(client):
+    german_page = "<html><body><p>Der Hund läuft jeden Morgen schnell über die Straße zum Park.</p></body></html>"
+    assert client.post("/is_article_language_supported", dict(htmlContent=german_page)) == b"YES"
+
+    assert client.post("/is_article_language_supported", dict(htmlContent="<html></html>")) == b"NO"
@@ -32,3 +32,26 @@ def test_add_exercise_to_session(client):
 
     session_info = client.get(f"/exercise_session_info/{session_id}")
     assert session_info["duration"] == 2000
+
+
+def test_report_several_exercise_outcomes_at_once(client):
+    bookmark_id = add_one_bookmark(client)
+    session_id = test_start_new_exercise_session(client)
+
+    outcome = dict(
+        bookmark_id=bookmark_id, outcome="C", source="Recognize", solving_speed=100
+    )
+    data = json.dumps(dict(session_id=session_id, outcomes=[outcome, outcome]))
+    assert b"OK" == client.post("/report_exercise_outcomes", data=data)
+
+    exercise_log = client.get(f"/get_exercise_log_for_bookmark/{bookmark_id}")
+    assert len(exercise_log) == 2
+    assert client.get("/get_total_bookmarks_in_pipeline") == 1
+
+    # none of the outcomes is saved if one of them is for an unknown bookmark
+    unknown = dict(outcome, bookmark_id=bookmark_id + 1)
+    data = json.dumps(dict(session_id=session_id, outcomes=[outcome, unknown]))
+    assert b"FAIL" == client.post("/report_exercise_outcomes", data=data)
+
+    exercise_log = client.get(f"/get_exercise_log_for_bookmark/{bookmark_id}")
+    assert len(exercise_log) == 2
@@ -0,0 +1,41 @@
+import flask
+import pytest
+
+from zeeguu.api.utils.request_instrumentation import instrument_requests
+from zeeguu.core.instrumentation import metrics_report, reset_metrics
+
+
+@pytest.fixture
+def instrumented_app():
+    reset_metrics()
+    app = flask.Flask(__name__)
+    instrument_requests(app)
+
+    @app.route("/ok")
+    def ok():
+        return "OK"
+
+    @app.route("/failing")
+    def failing():
+        raise ValueError("the DB went away")
+
+    yield app
+    reset_metrics()
+
+
+def test_requests_are_measured(instrumented_app):
+    instrumented_app.test_client().get("/ok")
+
+    route_stats = metrics_report()["GET /ok"]
+    assert route_stats["wall_ms"]["count"] == 1
+    assert route_stats["response_kb"]["count"] == 1
+
+
+def test_failing_requests_are_measured_too(instrumented_app):
+    instrumented_app.testing = True
+    with pytest.raises(ValueError):
+        instrumented_app.test_client().get("/failing")
+
+    route_stats = metrics_report()["GET /failing"]
+    assert route_stats["wall_ms"]["count"] == 1
+    assert "response_kb" not in route_stats
@@ -0,0 +1,16 @@
+from zeeguu.api.test.fixtures import logged_in_client
+from zeeguu.core.model import db, Session
+from zeeguu.core.model.session_activity import SESSION_ACTIVITY
+
+
+def test_session_use_is_saved_with_the_next_flush(logged_in_client):
+    session = Session.find(logged_in_client.session)
+    last_use_at_login = session.last_use
+
+    assert logged_in_client.get("/validate") == b"OK"
+    db.session.refresh(session)
+    assert session.last_use == last_use_at_login
+
+    SESSION_ACTIVITY.flush(db.session)
+    db.session.refresh(session)
+    assert session.last_use > last_use_at_login
@@ -1,2 +1,2 @@
-from .route_wrappers import cross_domain, requires_session
+from .route_wrappers import cross_domain, requires_session, get_current_user
 from .json_result import json_result
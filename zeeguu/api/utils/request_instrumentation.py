@@ -0,0 +1,42 @@
+import flask
+
+from zeeguu.core.instrumentation import (
+    start_request,
+    finish_request,
+    current_request_metrics,
+    install_sql_listeners,
+)
+
+
+def instrument_requests(app):
+    """
+    Records for every request the wall time, the SQL statements,
+    the time spent in ES and in the translators, and the size of
+    the response. See: /request_metrics
+
+    Can be disabled with INSTRUMENT_REQUESTS = False in the config
+    """
+
+    if not app.config.get("INSTRUMENT_REQUESTS", True):
+        return
+
+    install_sql_listeners()
+
+    @app.before_request
+    def _start_measuring():
+        url_rule = flask.request.url_rule
+        route = url_rule.rule if url_rule else "<no matching route>"
+        start_request(f"{flask.request.method} {route}")
+
+    @app.after_request
+    def _measure_response(response):
+        metrics = current_request_metrics()
+        if metrics is not None:
+            # streamed responses (e.g. the mp3 files) have no known length
+            metrics.response_size = response.calculate_content_length()
+        return response
+
+    @app.teardown_request
+    def _stop_measuring(exception=None):
+        # also runs for the requests that raise, unlike after_request
+        finish_request()
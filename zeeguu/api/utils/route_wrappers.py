@@ -3,7 +3,10 @@ import flask
 from werkzeug.exceptions import BadRequestKeyError
 
 from zeeguu.logging import log
+from zeeguu.core.model import db
 from zeeguu.core.model.session import Session
+from zeeguu.core.model.session_activity import SESSION_ACTIVITY
+from zeeguu.core.model.user import User
 
 from datetime import datetime, timedelta
 import zeeguu
@@ -55,6 +58,11 @@ def requires_session(view):
 
             flask.g.user_id = user_id
             flask.g.session_uuid = session_uuid
+            # the last use of the session is only written every now and then
+            SESSION_ACTIVITY.record_use(session_uuid)
+            SESSION_ACTIVITY.flush_if_due(db.session)
+            # in the tests several requests can share the same flask.g
+            flask.g.pop("user", None)
         except BadRequestKeyError as e:
             # This surely happens for missing session key
             # I'm not sure in which way the request could be bad
@@ -74,6 +82,19 @@ def requires_session(view):
     return wrapped_view
 
 
+def get_current_user():
+    """
+    The user of the current session; loaded at most once per request
+    and kept in flask.g, so a handler (and the helpers it calls) can
+    ask for it repeatedly without going to the DB every time.
+
+    Only to be called from within an endpoint decorated with @requires_session
+    """
+    if "user" not in flask.g:
+        flask.g.user = User.find_by_id(flask.g.user_id)
+    return flask.g.user
+
+
 def cross_domain(view):
     """
     Decorator enables x-origin requests from any domain.
@@ -2,6 +2,7 @@ import json
 import os
 
 from zeeguu.logging import log
+from zeeguu.core.instrumentation import external_call
 
 from apimux.api_base import BaseThirdPartyAPIService
 from apimux.mux import APIMultiplexer
@@ -182,16 +183,17 @@ def get_next_results(
     else:
         api_mux = api_mux_translators
 
-    if number_of_results == 1:
-        logger.debug("Getting only top result")
-        translator_results = api_mux.get_next_results(
-            translator_data, number_of_results=1
-        )
-    else:
-        logger.debug("Getting all results")
-        translator_results = api_mux.get_next_results(
-            translator_data, number_of_results=-1, exclude_services=exclude_services
-        )
+    with external_call("translator"):
+        if number_of_results == 1:
+            logger.debug("Getting only top result")
+            translator_results = api_mux.get_next_results(
+                translator_data, number_of_results=1
+            )
+        else:
+            logger.debug("Getting all results")
+            translator_results = api_mux.get_next_results(
+                translator_data, number_of_results=-1, exclude_services=exclude_services
+            )
     log(f"Got results get_next_results: {translator_results}")
     json_translator_results = [(x, y.to_json()) for x, y in translator_results]
     logger.debug(
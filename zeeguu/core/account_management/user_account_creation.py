@@ -81,10 +81,10 @@ def create_account(
                 teacher = Teacher(new_user)
                 db_session.add(teacher)
 
-        db_session.commit()
-
         send_new_user_account_email(username, invite_code, cohort_name)
 
+        db_session.commit()
+
         return new_user
 
     except sqlalchemy.exc.IntegrityError:
@@ -125,10 +125,10 @@ def create_basic_account(db_session, username, password, invite_code, email):
                 teacher = Teacher(new_user)
                 db_session.add(teacher)
 
-        db_session.commit()
-
         send_new_user_account_email(username, invite_code, cohort_name)
 
+        db_session.commit()
+
         return new_user
 
     except sqlalchemy.exc.IntegrityError:
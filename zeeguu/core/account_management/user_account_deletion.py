@@ -25,6 +25,8 @@ from zeeguu.core.model import (
     UserArticle,
     UserReadingSession,
     UserExerciseSession,
+    DailyLearnerActivity,
+    ArticleCreationJob,
 )
 from zeeguu.core.model import Article
 
@@ -38,6 +40,8 @@ tables_to_modify = [
     UserArticle,
     UserReadingSession,
     UserExerciseSession,
+    DailyLearnerActivity,
+    ArticleCreationJob,
     StarredArticle,
     ArticleDifficultyFeedback,
     PersonalCopy,
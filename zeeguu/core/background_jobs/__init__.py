@@ -0,0 +1,217 @@
+"""
+
+A minimal job queue for the work that request handlers do not need to
+wait for (e.g. sending emails). The queue is the background_job table,
+so nothing besides the DB is needed to run it:
+
+    - a task is a function registered with @task; its arguments
+      must be JSON serializable (e.g. ids, not model objects)
+
+    - enqueue(...) adds a job for a task to the session; it is saved
+      with the commit of the handler, which can return right away
+
+    - tools/run_background_jobs.py is the worker process that runs them
+      (the background_jobs service in docker-compose.yml)
+
+Only with BACKGROUND_JOBS_WORKER = True in the config are the jobs left
+to the worker; otherwise (e.g. in testing, or in a deployment without the
+worker) they are run as soon as they are enqueued, in the same process,
+and a job that fails is marked as failed right away, since there is
+nothing that would retry it.
+
+The jobs that are pending without a worker (e.g. they were enqueued
+while BACKGROUND_JOBS_WORKER was set) are only run by the worker; to
+run them locally:
+
+    python -m tools.run_background_jobs --once
+
+"""
+
+from datetime import datetime, timedelta
+
+import sqlalchemy
+
+from zeeguu.logging import log
+
+DEFAULT_MAX_ATTEMPTS = 5
+
+# the first retry is after a minute, then after 2, 4, 8, ... minutes
+FIRST_RETRY_DELAY = timedelta(minutes=1)
+MAX_RETRY_DELAY = timedelta(hours=6)
+
+_tasks = {}
+
+
+def task(name=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """
+    Registers the decorated function as a task that can be enqueued
+    """
+
+    def register(function):
+        task_name = name or function.__name__
+        _tasks[task_name] = (function, max_attempts)
+        function.task_name = task_name
+        return function
+
+    return register
+
+
+def enqueue(session, task_function, idempotency_key=None, **arguments):
+    """
+    Adds a job that calls task_function(**arguments) to the session; does
+    not commit: the job is saved with the commit of the caller, such that
+    when the caller fails after enqueuing, no job is left behind for
+    something that was rolled back
+
+    Without a worker the job is run right away, in a savepoint; so the
+    task must not commit (see add_job for the ones that do). If it fails,
+    it is not retried
+
+    :param idempotency_key: if a job with the same key was already
+    enqueued, that one is returned and no new job is added
+
+    :return: the BackgroundJob
+    """
+    job = add_job(session, task_function, idempotency_key, **arguments)
+
+    if not has_worker() and job.attempts == 0:
+        _run_in_session(session, job)
+
+    return job
+
+
+def add_job(session, task_function, idempotency_key=None, **arguments):
+    """
+    Like enqueue, but the job is never run right away; for the tasks
+    that commit, which the caller runs with run_job after its own commit
+    when there is no worker
+    """
+    from zeeguu.core.model import BackgroundJob
+
+    if idempotency_key:
+        existing = BackgroundJob.find_by_idempotency_key(idempotency_key)
+        if existing:
+            return existing
+
+    _, max_attempts = _tasks[task_function.task_name]
+    job = BackgroundJob(
+        task_function.task_name, arguments, max_attempts, idempotency_key
+    )
+    try:
+        with session.begin_nested():
+            session.add(job)
+    except sqlalchemy.exc.IntegrityError:
+        # somebody enqueued the same key in the meantime; only the
+        # savepoint was rolled back, not the transaction of the caller
+        return BackgroundJob.find_by_idempotency_key(idempotency_key, locking=True)
+
+    return job
+
+
+def has_worker():
+    """
+    :return: True if tools/run_background_jobs.py is deployed, i.e.
+    BACKGROUND_JOBS_WORKER = True in the config
+    """
+    import zeeguu.core
+
+    return zeeguu.core.app.config.get("BACKGROUND_JOBS_WORKER", False)
+
+
+def run_due_jobs(session, limit=100):
+    """
+    Runs the jobs that are due, oldest first
+
+    :return: the number of jobs that were run
+    """
+    from zeeguu.core.model import BackgroundJob
+
+    run_count = 0
+    for job_id in BackgroundJob.ids_of_due(datetime.now(), limit):
+        if run_job(session, job_id):
+            run_count += 1
+    return run_count
+
+
+def run_job(session, job_id):
+    """
+    Runs the job, unless another worker took it already; a job that
+    fails is rescheduled, with an exponential backoff, or marked as
+    failed once it has no attempts left
+
+    :return: the job, or None if it was not run
+    """
+    from zeeguu.core.model import BackgroundJob
+
+    job = BackgroundJob.claim(session, job_id)
+    if not job:
+        return None
+
+    try:
+        function, _ = _tasks[job.task]
+        function(**job.arguments())
+        _succeeded(job)
+    except Exception as e:
+        session.rollback()
+        _failed(job, e)
+
+    session.add(job)
+    session.commit()
+    log(f"{job}")
+    return job
+
+
+def _run_in_session(session, job):
+    # when there is no worker; the job is run right away, in a savepoint
+    # of the session of the caller, which is not committed, and which
+    # is not rolled back if the job fails
+    from zeeguu.core.model import BackgroundJob
+
+    job.status = BackgroundJob.RUNNING
+    job.started_at = datetime.now()
+    job.attempts += 1
+    try:
+        function, _ = _tasks[job.task]
+        with session.begin_nested():
+            function(**job.arguments())
+        _succeeded(job)
+    except Exception as e:
+        # there is no worker to retry it
+        _failed(job, e, retry=False)
+    log(f"{job}")
+
+
+def _succeeded(job):
+    from zeeguu.core.model import BackgroundJob
+
+    job.status = BackgroundJob.DONE
+    job.last_error = None
+    job.finished_at = datetime.now()
+
+
+def _failed(job, e, retry=True):
+    from zeeguu.core.model import BackgroundJob
+
+    job.last_error = f"{type(e).__name__}: {e}"[:512]
+    if retry and job.attempts < job.max_attempts:
+        job.status = BackgroundJob.PENDING
+        job.run_after = datetime.now() + retry_delay(job.attempts)
+    else:
+        job.status = BackgroundJob.FAILED
+        job.finished_at = datetime.now()
+
+        from sentry_sdk import capture_exception
+
+        capture_exception(e)
+
+
+def retry_delay(attempts):
+    """
+    :param attempts: how many times the job was tried already
+    """
+    # the exponent is capped such that the multiplication can not overflow
+    return min(FIRST_RETRY_DELAY * 2 ** min(attempts - 1, 20), MAX_RETRY_DELAY)
+
+
+# the tasks register themselves when their module is loaded
+from . import tasks
@@ -0,0 +1,27 @@
+from zeeguu.core.background_jobs import task
+
+
+@task(max_attempts=8)
+def send_email(subject, body, to_email):
+    from zeeguu.core.emailer.zeeguu_mailer import ZeeguuMailer
+
+    mailer = ZeeguuMailer(subject, body, to_email)
+    if not mailer.sending_is_enabled():
+        return
+
+    # unlike ZeeguuMailer.send, a failure is raised, such that it is retried
+    mailer.send_with_yagmail()
+
+
+@task(max_attempts=3)
+def create_article(article_creation_job_id):
+    # commits; see content_retriever.article_creation
+    from zeeguu.core.model import db
+    from zeeguu.core.model.article_creation_job import ArticleCreationJob
+
+    job = ArticleCreationJob.find_by_id(article_creation_job_id)
+    if not job or job.is_finished():
+        return
+
+    # a failure is saved in the job, and not retried
+    job.run(db.session)
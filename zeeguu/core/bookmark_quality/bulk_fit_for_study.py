@@ -0,0 +1,70 @@
+from collections import defaultdict
+
+from sqlalchemy.orm import joinedload
+
+from zeeguu.core.model import Bookmark
+from zeeguu.core.bookmark_quality.fit_for_study import fit_for_study
+
+BATCH_SIZE = 1000
+
+
+def update_fit_for_study(db_session, bookmark_query, batch_size=BATCH_SIZE):
+    """
+    Recomputes fit_for_study for all the bookmarks of the query, e.g. the
+    bookmarks of a user, the ones in a text, or all of them
+
+    Works in batches of bookmarks (with a commit after each); for every batch
+    the words and the texts of the bookmarks, and the other bookmarks that
+    their users have in the same texts, are loaded with two queries, and the
+    rules in negative_qualities are evaluated on them in memory; only the
+    bookmarks for which the result changed are updated
+
+    :param bookmark_query: a query of Bookmark, without an order or a limit
+    :return: the number of bookmarks for which fit_for_study changed
+    """
+    changed_count = 0
+    last_id = 0
+    while True:
+        bookmarks = (
+            bookmark_query.options(
+                joinedload(Bookmark.origin),
+                joinedload(Bookmark.translation),
+                joinedload(Bookmark.text),
+            )
+            .filter(Bookmark.id > last_id)
+            .order_by(Bookmark.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not bookmarks:
+            return changed_count
+        last_id = bookmarks[-1].id
+
+        bookmarks_in_text = _bookmarks_in_the_same_texts(db_session, bookmarks)
+
+        for each in bookmarks:
+            fit = bool(
+                fit_for_study(each, bookmarks_in_text[(each.text_id, each.user_id)])
+            )
+            if each.fit_for_study is None or bool(each.fit_for_study) != fit:
+                each.fit_for_study = fit
+                changed_count += 1
+
+        db_session.commit()
+
+
+def _bookmarks_in_the_same_texts(db_session, bookmarks):
+    """
+    :return: dictionary (text_id, user_id) -> the bookmarks of the user
+    in the text, ordered by id; the bookmarks themselves included
+    """
+    result = defaultdict(list)
+    for each in (
+        db_session.query(Bookmark)
+        .options(joinedload(Bookmark.origin))
+        .filter(Bookmark.text_id.in_(set(each.text_id for each in bookmarks)))
+        .filter(Bookmark.user_id.in_(set(each.user_id for each in bookmarks)))
+        .order_by(Bookmark.id)
+    ):
+        result[(each.text_id, each.user_id)].append(each)
+    return result
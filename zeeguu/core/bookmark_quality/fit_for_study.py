@@ -2,9 +2,12 @@ from zeeguu.core.bookmark_quality import quality_bookmark
 from zeeguu.core.model.bookmark_user_preference import UserWordExPreference
 
 
-def fit_for_study(bookmark):
+def fit_for_study(bookmark, bookmarks_in_text=None):
+    """
+    :param bookmarks_in_text: see bad_quality_bookmark
+    """
     return (
-        quality_bookmark(bookmark)
+        quality_bookmark(bookmark, bookmarks_in_text)
         or bookmark.user_preference == UserWordExPreference.USE_IN_EXERCISES
     ) and not bookmark.user_preference == UserWordExPreference.DONT_USE_IN_EXERCISES
 
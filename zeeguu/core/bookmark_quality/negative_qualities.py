@@ -1,8 +1,16 @@
-def bad_quality_bookmark(bookmark):
+import re
 
+WORD_PATTERN = re.compile(r"(?u)\w+")
+
+
+def bad_quality_bookmark(bookmark, bookmarks_in_text=None):
+    """
+    :param bookmarks_in_text: the bookmarks of the user in the text of
+    the bookmark, ordered by id; if not given, they are queried
+    """
     return (
         origin_same_as_translation(bookmark)
-        or origin_is_subsumed_in_other_bookmark(bookmark)
+        or origin_is_subsumed_in_other_bookmark(bookmark, bookmarks_in_text)
         or origin_has_too_many_words(bookmark)
         or origin_is_a_very_short_word(bookmark)
         or context_is_too_long(bookmark)
@@ -11,10 +19,8 @@ def bad_quality_bookmark(bookmark):
 
 
 def split_words_from_context(bookmark):
-    import re
-
     result = []
-    bookmark_content_words = re.findall(r"(?u)\w+", bookmark.text.content)
+    bookmark_content_words = WORD_PATTERN.findall(bookmark.text.content)
     for word in bookmark_content_words:
         if word.lower() != bookmark.origin.word.lower():
             result.append(word)
@@ -37,13 +43,16 @@ def origin_has_too_many_words(bookmark):
     return len(words_in_origin) > 2
 
 
-def origin_is_subsumed_in_other_bookmark(self):
+def origin_is_subsumed_in_other_bookmark(self, all_bookmarks_in_text=None):
     """
     if the user translates a superset of this sentence
     """
     from zeeguu.core.model.bookmark import Bookmark
 
-    all_bookmarks_in_text = Bookmark.find_all_for_text_and_user(self.text, self.user)
+    if all_bookmarks_in_text is None:
+        all_bookmarks_in_text = Bookmark.find_all_for_text_and_user(
+            self.text, self.user
+        )
 
     for each in all_bookmarks_in_text:
         if each != self:
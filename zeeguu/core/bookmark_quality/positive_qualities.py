@@ -1,8 +1,8 @@
 from zeeguu.core.bookmark_quality.negative_qualities import bad_quality_bookmark
 
 
-def quality_bookmark(bookmark):
-    return not bad_quality_bookmark(bookmark)
+def quality_bookmark(bookmark, bookmarks_in_text=None):
+    return not bad_quality_bookmark(bookmark, bookmarks_in_text)
 
 
 def quality_top_bookmark(bookmark):
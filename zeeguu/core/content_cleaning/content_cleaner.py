@@ -4,6 +4,8 @@ from nltk.tokenize import sent_tokenize
 import os
 import json
 
+from zeeguu.core.util.pattern_matcher import PatternMatcher
+
 JUNK_PATTERNS_TO_REMOVE = [
     "\nAdvertisement\n",
     "\ntrue\n",
@@ -55,12 +57,21 @@ def normalize_sent(text: str):
     return text.lower().strip()
 
 
+# built once per process, instead of at every call
+JUNK_COUNT_PATTERNS_SET = frozenset(JUNK_COUNT_PATTERNS)
+JUNK_PATTERNS_MATCHER = PatternMatcher(JUNK_PATTERNS_TO_REMOVE)
+
+
 def filter_noise_patterns(
-    article, sent_filter_set, crawl_report=None, feed=None, url=None
+    article,
+    sent_filter_set=JUNK_COUNT_PATTERNS_SET,
+    crawl_report=None,
+    feed=None,
+    url=None,
 ):
-    clean_artcile = ""
+    clean_paragraphs = []
     for paragraph in article.split("\n\n"):
-        clean_paragraph = ""
+        clean_sents = []
         is_prev_skip = False
         for sent in sent_tokenize(paragraph):
             if is_prev_skip and len(sent) <= 10:
@@ -76,58 +87,47 @@ def filter_noise_patterns(
                     crawl_report.add_sent_removed(feed, sent, url)
                 is_prev_skip = True
                 continue
-            clean_paragraph += sent + " "
+            clean_sents.append(sent + " ")
+        clean_paragraph = "".join(clean_sents)
         if len(clean_paragraph) < 10:
             continue
-        clean_artcile += clean_paragraph + "\n\n"
-    return clean_artcile.strip()
+        clean_paragraphs.append(clean_paragraph + "\n\n")
+    return "".join(clean_paragraphs).strip()
 
 
 def cleanup_non_content_bits_w_crawl_report(text: str, crawl_report, feed, url) -> str:
-    new_text = text
     new_text = filter_noise_patterns(
-        text, set(JUNK_COUNT_PATTERNS), crawl_report, feed, url
+        text, JUNK_COUNT_PATTERNS_SET, crawl_report, feed, url
     )
-    for junk_pattern in JUNK_PATTERNS_TO_REMOVE:
-        cleaned = new_text.replace(junk_pattern, "")
 
-        if cleaned != new_text:
+    new_text, removed_patterns = JUNK_PATTERNS_MATCHER.remove(new_text)
+    for junk_pattern in removed_patterns:
+        if crawl_report is not None:
             crawl_report.add_sent_removed(feed, junk_pattern, url)
-            print(f"- cleaned: {junk_pattern}")
-            new_text = cleaned
-
-    clean_text = ""
-    for junk_prefix in JUNK_PREFIXES:
-        for each in new_text.split("\n"):
-            if each.startswith(junk_prefix):
-                print(">>>> dropping the Paragraph: " + each)
-                crawl_report.add_sent_removed(feed, junk_pattern, url)
-                continue
-            clean_text += each + "\n"
+        print(f"- cleaned: {junk_pattern}")
+
+    clean_lines = []
+    for each in new_text.split("\n"):
+        junk_prefix = _junk_prefix_of(each)
+        if junk_prefix:
+            print(">>>> dropping the Paragraph: " + each)
+            if crawl_report is not None:
+                crawl_report.add_sent_removed(feed, junk_prefix, url)
+            continue
+        clean_lines.append(each + "\n")
 
-    return clean_text
+    return "".join(clean_lines)
 
 
 def cleanup_non_content_bits(text: str):
-    new_text = text
-    new_text = filter_noise_patterns(text, set(JUNK_COUNT_PATTERNS))
-
-    for junk_pattern in JUNK_PATTERNS_TO_REMOVE:
-        cleaned = new_text.replace(junk_pattern, "")
+    return cleanup_non_content_bits_w_crawl_report(text, None, None, None)
 
-        if cleaned != new_text:
-            print(f"- cleaned: {junk_pattern}")
-            new_text = cleaned
 
-    clean_text = ""
+def _junk_prefix_of(line):
     for junk_prefix in JUNK_PREFIXES:
-        for each in new_text.split("\n"):
-            if each.startswith(junk_prefix):
-                print(">>>> dropping the Paragraph: " + each)
-                continue
-            clean_text += each + "\n"
-
-    return clean_text
+        if line.startswith(junk_prefix):
+            return junk_prefix
+    return None
 
 
 def cleanup_all_articles_in_language(language_code):
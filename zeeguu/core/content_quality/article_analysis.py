@@ -0,0 +1,112 @@
+from langdetect import detect
+
+
+class ArticleAnalysis(object):
+    """
+
+    What the crawler needs to know about the text of one article: its
+    language, its words, and its stems. Each of them is computed the first
+    time it is needed and then reused by the parsing, the quality filter,
+    the paywall classifier and the difficulty estimation, instead of
+    each of them going over the whole text again.
+
+    An analysis is only valid for the text it was created with; when the
+    text changes (e.g. it is cleaned up) with_text(...) gives a new
+    analysis that keeps the language, but not what depends on the words.
+
+    """
+
+    def __init__(self, text, language_code=None, sample_size=None):
+        """
+        :param language_code: if already known, it is not detected again
+
+        :param sample_size: if given, the language is detected on a
+        sample of (about) this many characters, rather than on the whole
+        text; langdetect does not get more accurate after a few hundred
+        words, it only gets slower
+        """
+        self.text = text
+        self.sample_size = sample_size
+        self._language_code = language_code
+        self._words = None
+        self._stemmed_text = None
+
+    def __repr__(self):
+        return f"<ArticleAnalysis {self._language_code} ({len(self.text)} chars)>"
+
+    @classmethod
+    def of(cls, np_article):
+        """
+        :return: the analysis that was made while parsing the newspaper
+        article, if its text did not change since; a new one otherwise
+        """
+        analysis = getattr(np_article, "analysis", None)
+        if analysis is not None and analysis.text is np_article.text:
+            return analysis
+        return cls(np_article.text)
+
+    def with_text(self, text):
+        return ArticleAnalysis(text, self._language_code, self.sample_size)
+
+    @property
+    def language_code(self):
+        if self._language_code is None:
+            self._language_code = detect(self.sample())
+        return self._language_code
+
+    @property
+    def words(self):
+        # the whitespace separated words; what the word_count is based on
+        if self._words is None:
+            self._words = self.text.split()
+        return self._words
+
+    @property
+    def word_count(self):
+        return len(self.words)
+
+    @property
+    def stemmed_text(self):
+        # the input of the paywall classifier
+        if self._stemmed_text is None:
+            from zeeguu.core.ml_models.utils import stem_pre_process
+
+            self._stemmed_text = stem_pre_process(self.text, self.language_code)
+        return self._stemmed_text
+
+    def fk_difficulty(self, language):
+        from zeeguu.core.language.difficulty_estimator_factory import (
+            DifficultyEstimatorFactory,
+        )
+
+        fk_estimator = DifficultyEstimatorFactory.get_difficulty_estimator("fk")
+        return fk_estimator.estimate_difficulty(self.text, language, None)
+
+    def sample(self):
+        """
+        :return: the text, or, if it is longer than the sample_size,
+        three equally long pieces of it (from the beginning, the middle and
+        the end) such that a header or a footer alone can't decide the language
+        """
+        if not self.sample_size or len(self.text) <= self.sample_size:
+            return self.text
+
+        piece_length = self.sample_size // 3
+        middle = (len(self.text) - piece_length) // 2
+        starts = [0, middle, len(self.text) - piece_length]
+        return "\n".join(
+            _whole_words(self.text, start, piece_length) for start in starts
+        )
+
+
+def _whole_words(text, start, length):
+    # the piece is extended to the end of the word it cuts in the middle of,
+    # and starts after the word it starts in the middle of
+    end = start + length
+    if start > 0 and not text[start - 1].isspace():
+        space = text.find(" ", start)
+        if 0 <= space < end:
+            start = space + 1
+    space = text.find(" ", end)
+    end = space if space >= 0 else len(text)
+    return text[start:end]
@@ -0,0 +1,126 @@
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
+
+from langdetect import detector_factory
+from langdetect.lang_detect_exception import LangDetectException
+
+from zeeguu.core.content_quality.article_analysis import ArticleAnalysis
+
+# langdetect does not get more accurate after a few hundred words; and
+# it runs its URL and e-mail regexes over all the text it is given
+SAMPLE_SIZE = 2000
+
+# the sample is taken from (at most) this many characters of the text
+# of a page, such that a huge page does not have to be stripped entirely
+MAX_TEXT_LENGTH = 50000
+
+# the languages of this many pages are remembered
+CACHE_SIZE = 1024
+
+# langdetect is randomized; with a fixed seed the same text always
+# gets the same language
+SEED = 0
+
+# elements whose content is not text that is read, and comments; or a tag
+_NOT_TEXT = re.compile(
+    r"<(script|style|noscript|svg|template|head)\b.*?</\1\s*>|<!--.*?-->|<[^>]*>",
+    re.DOTALL | re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class LanguageIdentifier(object):
+    """
+    Identifies the language of texts and of HTML pages from a sample of
+    (about) SAMPLE_SIZE characters of their text, with a seeded langdetect
+    detector; and remembers the language of the last CACHE_SIZE contents
+    by their hash, since e.g. the browser extension asks about the page
+    it is on before it creates an article from the same page
+    """
+
+    def __init__(self, sample_size=SAMPLE_SIZE, cache_size=CACHE_SIZE, seed=SEED):
+        self.sample_size = sample_size
+        self.cache_size = cache_size
+        self.seed = seed
+
+        self._languages = OrderedDict()
+        self._lock = threading.Lock()
+
+    def language_of_html(self, html_content):
+        """
+        :return: the code of the language of the text of the page;
+        None if it has no text that a language can be detected for
+        """
+        return self._cached(
+            "html", html_content, lambda: self._detect(html_text(html_content))
+        )
+
+    def language_of_text(self, text):
+        return self._cached("text", text, lambda: self._detect(text))
+
+    def clear(self):
+        with self._lock:
+            self._languages.clear()
+
+    def _cached(self, kind, content, identify):
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        key = (kind, digest)
+        with self._lock:
+            if key in self._languages:
+                self._languages.move_to_end(key)
+                return self._languages[key]
+
+        language = identify()
+
+        with self._lock:
+            self._languages[key] = language
+            if len(self._languages) > self.cache_size:
+                self._languages.popitem(last=False)
+        return language
+
+    def _detect(self, text):
+        sample = ArticleAnalysis(text, sample_size=self.sample_size).sample()
+
+        # the profiles are loaded once, and shared with langdetect.detect
+        detector_factory.init_factory()
+        detector = detector_factory._factory.create()
+        detector.seed = self.seed
+        detector.append(sample)
+        try:
+            language = detector.detect()
+        except LangDetectException:
+            return None
+        return None if language == detector.UNKNOWN_LANG else language
+
+
+def html_text(html_content, max_length=MAX_TEXT_LENGTH):
+    """
+    :return: the text of the page, without the tags, the scripts, the
+    styles, and the head; with the whitespace collapsed, and only as much
+    of it as max_length; the rest of the page is not even looked at
+    """
+    pieces = []
+    length = 0
+    position = 0
+    for match in _NOT_TEXT.finditer(html_content):
+        length += _add_piece(pieces, html_content[position : match.start()])
+        position = match.end()
+        if length >= max_length:
+            break
+    else:
+        _add_piece(pieces, html_content[position:])
+
+    return html.unescape(" ".join(pieces))[:max_length]
+
+
+def _add_piece(pieces, text):
+    text = _WHITESPACE.sub(" ", text).strip()
+    if text:
+        pieces.append(text)
+    return len(text)
+
+
+LANGUAGE_IDENTIFIER = LanguageIdentifier()
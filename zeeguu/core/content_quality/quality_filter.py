@@ -1,7 +1,8 @@
 import newspaper
-from langdetect import detect
 from zeeguu.core.model import Article, LowQualityTypes
+from zeeguu.core.content_quality.article_analysis import ArticleAnalysis
 from zeeguu.core.ml_models import is_paywalled, ID_TO_LABEL_PAYWALL
+from zeeguu.core.util.pattern_matcher import PatternMatcher
 
 HTML_READ_MORE_PATTERNS = [
     "To continue reading this premium",  # New Scientist
@@ -37,19 +38,31 @@ LIVE_BLOG_KIND_OF_PATTERNS = [
 ]
 
 
+HTML_READ_MORE_MATCHER = PatternMatcher(HTML_READ_MORE_PATTERNS)
+PLAIN_TEXT_PAYWALL_MATCHER = PatternMatcher(PLAIN_TEXT_PAYWALL_PATTERNS)
+LIVE_BLOG_KIND_OF_MATCHER = PatternMatcher(LIVE_BLOG_KIND_OF_PATTERNS)
+
+
 def sufficient_quality_html(html):
-    for each in HTML_READ_MORE_PATTERNS:
-        if html.find(each) > 0:
-            return (
-                False,
-                f"Incomplete Article (based on HTML analysis). Contains: {each}",
-                LowQualityTypes.HTML_PATTERN,
-            )
+    # a pattern at the very beginning of the html does not count
+    each = HTML_READ_MORE_MATCHER.first_match(html, start=1)
+    if each:
+        return (
+            False,
+            f"Incomplete Article (based on HTML analysis). Contains: {each}",
+            LowQualityTypes.HTML_PATTERN,
+        )
     return True, "", ""
 
 
-def sufficient_quality_plain_text(text, lang_code=None):
-    word_count = len(text.split())
+def sufficient_quality_plain_text(text, lang_code=None, analysis=None):
+    """
+    :param analysis: the ArticleAnalysis of the text, if the caller has one
+    """
+    if analysis is None:
+        analysis = ArticleAnalysis(text)
+
+    word_count = analysis.word_count
     if word_count < Article.MINIMUM_WORD_COUNT:
         return (
             False,
@@ -57,13 +70,13 @@ def sufficient_quality_plain_text(text, lang_code=None):
             LowQualityTypes.TOO_SHORT,
         )
 
-    for each in PLAIN_TEXT_PAYWALL_PATTERNS:
-        if text.find(each) >= 0:
-            return (
-                False,
-                f"Incomplete pattern in text: {each}",
-                LowQualityTypes.TEXT_PAYWALL_PATTERN,
-            )
+    each = PLAIN_TEXT_PAYWALL_MATCHER.first_match(text)
+    if each:
+        return (
+            False,
+            f"Incomplete pattern in text: {each}",
+            LowQualityTypes.TEXT_PAYWALL_PATTERN,
+        )
 
     if text.endswith(incomplete_suggesting_terminations):
         return (
@@ -72,7 +85,7 @@ def sufficient_quality_plain_text(text, lang_code=None):
             LowQualityTypes.INCOMPLETE_PATTERN,
         )
 
-    art_lang = detect(text)
+    art_lang = analysis.language_code
     if lang_code is not None and art_lang != lang_code:
         return (
             False,
@@ -80,11 +93,10 @@ def sufficient_quality_plain_text(text, lang_code=None):
             LowQualityTypes.LANGUAGE_DOES_NOT_MATCH_FEED,
         )
 
-    for each in LIVE_BLOG_KIND_OF_PATTERNS:
-        if text.find(each) >= 0:
-            return False, "Live blog kind of article", LowQualityTypes.LIVE_BLOG
+    if LIVE_BLOG_KIND_OF_MATCHER.first_match(text):
+        return False, "Live blog kind of article", LowQualityTypes.LIVE_BLOG
 
-    paywall_pred = is_paywalled(text)
+    paywall_pred = is_paywalled(text, analysis.stemmed_text)
     if paywall_pred > 0:
         # 0 is Normal Text
         label_found = ID_TO_LABEL_PAYWALL[paywall_pred]
@@ -97,11 +109,15 @@ def sufficient_quality_plain_text(text, lang_code=None):
     return True, "", ""
 
 
-def sufficient_quality(art: newspaper.Article, lang_code=None) -> tuple[bool, str, str]:
+def sufficient_quality(
+    art: newspaper.Article, lang_code=None, analysis=None
+) -> tuple[bool, str, str]:
     res, reason, code = sufficient_quality_html(art.html)
     if not res:
         return False, reason, code
-    res, reason, code = sufficient_quality_plain_text(art.text, lang_code)
+    if analysis is None:
+        analysis = ArticleAnalysis.of(art)
+    res, reason, code = sufficient_quality_plain_text(art.text, lang_code, analysis)
     if not res:
         return False, reason, code
 
@@ -28,6 +28,7 @@ from zeeguu.core.elastic.elastic_query_builder import (
 )
 from zeeguu.core.util.timer_logging_decorator import time_this
 from zeeguu.core.elastic.settings import ES_CONN_STRING, ES_ZINDEX
+from zeeguu.core.instrumentation import external_call
 
 
 def filter_hits_on_score(hits, score_threshold):
@@ -144,7 +145,8 @@ def article_recommendations_for_user(
         page=page,
     )
 
-    res = es.search(index=ES_ZINDEX, body=query_body)
+    with external_call("es"):
+        res = es.search(index=ES_ZINDEX, body=query_body)
 
     hit_list = res["hits"].get("hits")
     final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
@@ -213,7 +215,8 @@ def article_search_for_user(
     )
 
     es = Elasticsearch(ES_CONN_STRING)
-    res = es.search(index=ES_ZINDEX, body=query_body)
+    with external_call("es"):
+        res = es.search(index=ES_ZINDEX, body=query_body)
     hit_list = res["hits"].get("hits")
     if score_threshold > 0:
         hit_list = filter_hits_on_score(hit_list, score_threshold)
@@ -273,7 +276,8 @@ def topic_filter_for_user(
         "sort": [{"published_time": "desc"}],
     }
 
-    res = es.search(index=ES_ZINDEX, body=query_with_size)
+    with external_call("es"):
+        res = es.search(index=ES_ZINDEX, body=query_with_size)
 
     hit_list = res["hits"].get("hits")
 
@@ -331,7 +335,8 @@ def __find_articles_like(
         cutoff_days=article_age,
     )
 
-    res = es.search(index=ES_ZINDEX, body=mlt_query, size=limit)
+    with external_call("es"):
+        res = es.search(index=ES_ZINDEX, body=mlt_query, size=limit)
     articles = _to_articles_from_ES_hits(res["hits"]["hits"])
     articles = [a for a in articles if a.broken == 0]
     return articles
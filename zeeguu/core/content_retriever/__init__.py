@@ -6,6 +6,7 @@ def download_and_parse(url):
 
     np_article = _download_and_parse(url)
     np_article.text = cleanup_text(np_article.text)
+    np_article.analysis = np_article.analysis.with_text(np_article.text)
 
     return np_article
 
@@ -0,0 +1,30 @@
+"""
+
+Runs the ArticleCreationJobs outside of the requests that saved them,
+as background jobs (see zeeguu.core.background_jobs); a job whose worker
+dies while creating the article is released and run again by the worker.
+
+Without a worker (e.g. in the tests) the article is created right away,
+in the request.
+
+"""
+
+from zeeguu.core.background_jobs import add_job, has_worker, run_job
+from zeeguu.core.background_jobs.tasks import create_article
+
+
+def submit(session, job):
+    """
+    Schedules the job to be run, and commits; returns immediately
+    unless there is no worker
+    """
+    background_job = add_job(
+        session,
+        create_article,
+        idempotency_key=f"article_creation_job-{job.id}",
+        article_creation_job_id=job.id,
+    )
+    session.commit()
+
+    if not has_worker():
+        run_job(session, background_job.id)
@@ -18,6 +18,7 @@ from zeeguu.core import model
 
 from zeeguu.core.semantic_search import add_topics_based_on_semantic_hood_search
 from zeeguu.core.content_quality.quality_filter import sufficient_quality
+from zeeguu.core.content_quality.article_analysis import ArticleAnalysis
 from zeeguu.core.content_cleaning import cleanup_text_w_crawl_report
 from zeeguu.core.emailer.zeeguu_mailer import ZeeguuMailer
 from zeeguu.core.model import Url, Feed, UrlKeyword, Topic
@@ -269,13 +270,15 @@ def download_feed_item(session, feed, feed_item, url, crawl_report):
 
     np_article = readability_download_and_parse(url)
 
+    analysis = ArticleAnalysis.of(np_article)
     is_quality_article, reason, code = sufficient_quality(
-        np_article, feed.language.code
+        np_article, feed.language.code, analysis
     )
     if is_quality_article:
         np_article.text = cleanup_text_w_crawl_report(
             np_article.text, crawl_report, feed, url
         )
+        analysis = analysis.with_text(np_article.text)
     summary = feed_item["summary"]
     # however, this is not so easy... there have been cases where
     # the summary is just malformed HTML... thus we try to extract
@@ -302,6 +305,7 @@ def download_feed_item(session, feed, feed_item, url, crawl_report):
         feed,
         feed.language,
         htmlContent=np_article.htmlContent,
+        analysis=analysis,
     )
     session.add(new_article)
 
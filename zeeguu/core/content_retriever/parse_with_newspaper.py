@@ -1,5 +1,6 @@
 import newspaper
-from langdetect import detect
+
+from zeeguu.core.content_quality.article_analysis import ArticleAnalysis
 
 
 def download_and_parse(url):
@@ -13,8 +14,9 @@ def download_and_parse(url):
         # this is a temporary solution for allowing translations
         # on pages that do not have "articles" downloadable by newspaper.
 
+    parsed.analysis = ArticleAnalysis(parsed.text)
     if parsed.meta_lang == "":
-        parsed.meta_lang = detect(parsed.text)
+        parsed.meta_lang = parsed.analysis.language_code
 
     # Other relevant attributes: title, text, summary, authors
     return parsed
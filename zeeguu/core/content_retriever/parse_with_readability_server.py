@@ -1,9 +1,9 @@
 import json
 
 import newspaper
-from langdetect import detect
 import requests
 
+from zeeguu.core.content_quality.article_analysis import ArticleAnalysis
 from zeeguu.core.content_retriever.crawler_exceptions import (
     FailedToParseWithReadabilityServer,
 )
@@ -36,8 +36,11 @@ def download_and_parse(url, request_timeout=TIMEOUT_SECONDS):
     np_article.text = result_dict["text"]
     np_article.htmlContent = result_dict["html"]
 
+    # the language detected here is reused by the quality filter
+    # (see ArticleAnalysis.of)
+    np_article.analysis = ArticleAnalysis(np_article.text)
     if np_article.meta_lang == "":
-        np_article.meta_lang = detect(np_article.text)
+        np_article.meta_lang = np_article.analysis.language_code
 
     # Other relevant attributes: title, text, summary, authors
     return np_article
@@ -12,4 +12,4 @@ def send_password_reset_email(to_email, code):
     ])
 
     emailer = ZeeguuMailer('Reset your password', body, to_email)
-    emailer.send()
\ No newline at end of file
+    emailer.send_in_background()
\ No newline at end of file
@@ -19,9 +19,12 @@ class ZeeguuMailer(object):
         yag = yagmail.SMTP(self.our_email, self.password)
         yag.send(self.to_email, self.message_subject, contents=self.message_body)
 
+    def sending_is_enabled(self):
+        # this disables the mailer also during unit testing
+        return zeeguu.core.app.config.get("SEND_NOTIFICATION_EMAILS", False)
+
     def send(self):
-        # this next line disables the mailer also during unit testing
-        if not zeeguu.core.app.config.get("SEND_NOTIFICATION_EMAILS", False):
+        if not self.sending_is_enabled():
             logp("returning without sending")
             return
         try:
@@ -33,6 +36,26 @@ class ZeeguuMailer(object):
 
             capture_exception(e)
 
+    def send_in_background(self):
+        """
+        Hands off the sending to a background job, which is retried if
+        the sending fails; for the request handlers, which should not wait
+        for the SMTP server. The job is saved with the next commit of the
+        session; without a worker (see zeeguu.core.background_jobs)
+        the email is sent right away
+        """
+        from zeeguu.core.background_jobs import enqueue
+        from zeeguu.core.background_jobs.tasks import send_email
+        from zeeguu.core.model import db
+
+        enqueue(
+            db.session,
+            send_email,
+            subject=self.message_subject,
+            body=self.message_body,
+            to_email=self.to_email,
+        )
+
     def _content_of_email(self):
         from email.mime.text import MIMEText
 
@@ -57,7 +80,7 @@ class ZeeguuMailer(object):
             zeeguu.core.app.config.get("SMTP_EMAIL"),
         )
 
-        mailer.send()
+        mailer.send_in_background()
 
     @classmethod
     def notify_audio_experiment(cls, data, user):
@@ -78,7 +101,7 @@ class ZeeguuMailer(object):
                 "Audio Experiment Event",
                 content,
                 handle + prefix + "tu" + ".d" + "k",
-            ).send()
+            ).send_in_background()
 
     @classmethod
     def send_mail(cls, subject, content_lines):
@@ -86,7 +109,7 @@ class ZeeguuMailer(object):
         logger.info("Sending email...")
         body = "\r\n".join(content_lines)
         mailer = ZeeguuMailer(subject, body, zeeguu.core.app.config.get("SMTP_EMAIL"))
-        mailer.send()
+        mailer.send_in_background()
 
     @classmethod
     def send_content_retrieved_notification(cls, article, old_content=""):
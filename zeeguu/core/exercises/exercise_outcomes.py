@@ -0,0 +1,56 @@
+from sqlalchemy.orm.exc import NoResultFound
+
+from zeeguu.core.model import Bookmark, ExerciseOutcome, ExerciseSource
+
+
+def report_exercise_outcomes(db_session, user, session_id, outcomes):
+    """
+    Saves the outcomes of the exercises that the user did in the exercise
+    session, and updates the schedules of their bookmarks; with a single
+    commit at the end, so either all of them are saved or none is
+
+    :param outcomes: list of dicts with the keys: bookmark_id, outcome,
+    source, solving_speed (in milliseconds), and other_feedback (optional)
+
+    :raises NoResultFound: if one of the bookmarks does not exist
+    or is not a bookmark of the user
+    """
+    bookmark_ids = set(int(each["bookmark_id"]) for each in outcomes)
+    bookmarks = {
+        each.id: each
+        for each in Bookmark.query.filter(Bookmark.id.in_(bookmark_ids)).filter(
+            Bookmark.user_id == user.id
+        )
+    }
+    missing_ids = bookmark_ids - bookmarks.keys()
+    if missing_ids:
+        raise NoResultFound(f"No bookmarks {sorted(missing_ids)} for {user.id}")
+
+    # a source or an outcome that is not known yet is saved (and committed)
+    # before any of the exercises; the others are found in the cache
+    for source in set(each["source"] for each in outcomes):
+        ExerciseSource.find_or_create(db_session, source)
+    for outcome in set(each["outcome"] for each in outcomes):
+        ExerciseOutcome.find_or_create(db_session, outcome)
+
+    try:
+        for each in outcomes:
+            bookmarks[int(each["bookmark_id"])].report_exercise_outcome(
+                each["source"],
+                each["outcome"],
+                _solving_speed(each.get("solving_speed")),
+                session_id,
+                each.get("other_feedback"),
+                db_session,
+                commit=False,
+            )
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+
+
+def _solving_speed(solving_speed):
+    # the clients send e.g. NaN when they could not measure it
+    solving_speed = str(solving_speed)
+    return int(solving_speed) if solving_speed.isdigit() else 0
@@ -1,4 +1,5 @@
 import random
+from functools import lru_cache
 
 from zeeguu.core.word_stats import lang_info
 from zeeguu.core.word_filter import (
@@ -15,16 +16,21 @@ def similar_words(word, language, user, number_of_words_to_return=2):
     if len(words_the_user_must_study) == 10:
         candidates = [each.origin.word for each in words_the_user_must_study]
     else:
-        candidates = lang_info(language.code).all_words()
-        candidates_filtered = remove_words_based_on_list(candidates, BAD_WORD_LIST)
-        candidates_filtered = remove_words_based_on_list(
-            candidates_filtered, PROPER_NAMES_LIST
-        )
-        # Update candidates to be based on the filtered words.
-        candidates = [w for w in candidates_filtered if len(w) > 1]
+        candidates = _distractor_candidates(language.code)
 
     random_sample = random.sample(candidates, number_of_words_to_return)
     while word in random_sample:
         random_sample = random.sample(candidates, number_of_words_to_return)
 
     return random_sample
+
+
+@lru_cache(maxsize=None)
+def _distractor_candidates(language_code):
+    # the same for every request, so filtered only once per process
+    candidates = lang_info(language_code).all_words()
+    candidates_filtered = remove_words_based_on_list(candidates, BAD_WORD_LIST)
+    candidates_filtered = remove_words_based_on_list(
+        candidates_filtered, PROPER_NAMES_LIST
+    )
+    return [w for w in candidates_filtered if len(w) > 1]
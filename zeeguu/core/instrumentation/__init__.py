@@ -0,0 +1,10 @@
+from .histogram import Histogram
+from .request_metrics import (
+    start_request,
+    finish_request,
+    current_request_metrics,
+    external_call,
+    install_sql_listeners,
+    metrics_report,
+    reset_metrics,
+)
@@ -0,0 +1,84 @@
+import bisect
+import threading
+
+# Upper bounds of the buckets; chosen such that they work for
+# milliseconds, statement counts, and kilobytes alike
+DEFAULT_BUCKETS = [
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+    1000,
+    2000,
+    5000,
+    10000,
+    20000,
+    50000,
+]
+
+
+class Histogram:
+    """
+    A fixed-bucket histogram that is cheap to update from
+    many threads and small enough to keep one per route
+    and per measurement in memory.
+
+    The percentiles are estimated: they return the upper
+    bound of the bucket in which the percentile falls
+    (or the max, for the overflow bucket).
+    """
+
+    def __init__(self, buckets=None):
+        self.buckets = buckets or DEFAULT_BUCKETS
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self._lock = threading.Lock()
+
+    def add(self, value):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.total += value
+            self.max = max(self.max, value)
+
+    def percentile(self, p: float):
+        if self.count == 0:
+            return None
+
+        rank = p / 100 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                if i < len(self.buckets):
+                    return min(self.buckets[i], self.max)
+                return self.max
+
+        return self.max
+
+    def mean(self):
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def as_dictionary(self):
+        return dict(
+            count=self.count,
+            mean=_rounded(self.mean()),
+            p50=_rounded(self.percentile(50)),
+            p95=_rounded(self.percentile(95)),
+            p99=_rounded(self.percentile(99)),
+            max=round(self.max, 2),
+        )
+
+
+def _rounded(value):
+    return round(value, 2) if value is not None else None
@@ -0,0 +1,196 @@
+"""
+
+Per-request measurements (wall time, SQL statements, time spent
+in external services, response size) aggregated per route into
+in-process histograms.
+
+The measurements of the request that is being served are kept
+in a context variable, such that code deep in the core (e.g. the
+ES recommender) can contribute to them without knowing about Flask.
+
+"""
+
+import contextvars
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from zeeguu.core.instrumentation.histogram import Histogram
+from zeeguu.logging import warning
+
+# The same statement executed this many times during one
+# request is most likely a query issued from inside a loop
+N_PLUS_ONE_THRESHOLD = 10
+
+# We keep only this many distinct N+1 statements per route
+MAX_N_PLUS_ONE_STATEMENTS_PER_ROUTE = 20
+
+# Statements are truncated to this length when reported
+MAX_STATEMENT_LENGTH = 300
+
+_current_request = contextvars.ContextVar("current_request_metrics", default=None)
+
+_route_stats = {}
+_route_stats_lock = threading.Lock()
+
+_sql_listeners_installed = False
+
+
+class RequestMetrics:
+    def __init__(self, route):
+        self.route = route
+        self.start = time.perf_counter()
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.statements = Counter()
+        self.external_ms = defaultdict(float)
+        self.response_size = None
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+
+class RouteStats:
+    def __init__(self):
+        self.histograms = defaultdict(Histogram)
+        self.n_plus_one_statements = Counter()
+        # the histograms have their own locks; this one is for the counter
+        self._n_plus_one_lock = threading.Lock()
+
+    def record(self, metrics: RequestMetrics, response_size):
+        self.histograms["wall_ms"].add(metrics.elapsed_ms())
+        self.histograms["sql_count"].add(metrics.sql_count)
+        self.histograms["sql_ms"].add(metrics.sql_ms)
+        for service, ms in metrics.external_ms.items():
+            self.histograms[service + "_ms"].add(ms)
+        if response_size is not None:
+            self.histograms["response_kb"].add(response_size / 1024)
+
+        for statement, count in metrics.statements.items():
+            if count < N_PLUS_ONE_THRESHOLD:
+                continue
+
+            with self._n_plus_one_lock:
+                is_new = statement not in self.n_plus_one_statements
+                if (
+                    is_new
+                    and len(self.n_plus_one_statements)
+                    >= MAX_N_PLUS_ONE_STATEMENTS_PER_ROUTE
+                ):
+                    continue
+                self.n_plus_one_statements[statement] += 1
+
+            if is_new:
+                warning(
+                    f"Possible N+1 in {metrics.route}: "
+                    f"{count} executions of: {statement}"
+                )
+
+    def as_dictionary(self):
+        with self._n_plus_one_lock:
+            n_plus_one_statements = self.n_plus_one_statements.most_common()
+        return dict(
+            **{name: h.as_dictionary() for name, h in list(self.histograms.items())},
+            n_plus_one=[
+                dict(statement=statement, requests=requests)
+                for statement, requests in n_plus_one_statements
+            ],
+        )
+
+
+def start_request(route: str):
+    _current_request.set(RequestMetrics(route))
+
+
+def finish_request(response_size=None):
+    """
+    :param response_size: if not given, the one that was set on the
+    metrics of the request, if any; a request that failed has none
+    """
+    metrics = _current_request.get()
+    if metrics is None:
+        return
+    _current_request.set(None)
+
+    if response_size is None:
+        response_size = metrics.response_size
+
+    with _route_stats_lock:
+        stats = _route_stats.setdefault(metrics.route, RouteStats())
+    stats.record(metrics, response_size)
+
+
+def current_request_metrics():
+    return _current_request.get()
+
+
+@contextmanager
+def external_call(service: str):
+    """
+    Times the enclosed block as a call to an external
+    service (e.g. "es", "translator") of the current request.
+
+        with external_call("es"):
+            res = es.search(...)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current_request.get()
+        if metrics is not None:
+            metrics.external_ms[service] += (time.perf_counter() - start) * 1000
+
+
+def install_sql_listeners():
+    """
+    Counts and times every statement that any engine executes
+    while a request is being measured. Safe to call several times.
+    """
+    global _sql_listeners_installed
+    if _sql_listeners_installed:
+        return
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _sql_listeners_installed = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_request.get() is None:
+        return
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    metrics = _current_request.get()
+    start_times = conn.info.get("query_start_time")
+    if metrics is None or not start_times:
+        return
+
+    metrics.sql_count += 1
+    metrics.sql_ms += (time.perf_counter() - start_times.pop()) * 1000
+    # the parameters are not part of the statement, so the same
+    # query issued for different ids has the same text
+    metrics.statements[statement[:MAX_STATEMENT_LENGTH]] += 1
+
+
+def metrics_report():
+    """
+    :return: dictionary route -> stats; routes sorted by
+    the total wall time spent in them
+    """
+    with _route_stats_lock:
+        items = list(_route_stats.items())
+
+    items.sort(key=lambda each: each[1].histograms["wall_ms"].total, reverse=True)
+    return {route: stats.as_dictionary() for route, stats in items}
+
+
+def reset_metrics():
+    with _route_stats_lock:
+        _route_stats.clear()
@@ -7,7 +7,13 @@ from joblib import load
 ml_models_path = os.path.dirname(__file__)
 PAYWALL_TFIDF_MODEL = load(os.path.join(ml_models_path,'binary', 'tfidf_multi_paywall_detect.joblib'))
 
-def is_paywalled(article_txt:str):
-    lang = detect(article_txt)
-    #print("Language detected was: ", lang)
-    return PAYWALL_TFIDF_MODEL.predict([stem_pre_process(article_txt, lang)])[0]
\ No newline at end of file
+def is_paywalled(article_txt:str, stemmed_text:str=None):
+    """
+    :param stemmed_text: the stem_pre_process-ed text, if it was already
+    computed (e.g. by an ArticleAnalysis); spares the language detection
+    """
+    if stemmed_text is None:
+        lang = detect(article_txt)
+        #print("Language detected was: ", lang)
+        stemmed_text = stem_pre_process(article_txt, lang)
+    return PAYWALL_TFIDF_MODEL.predict([stemmed_text])[0]
\ No newline at end of file
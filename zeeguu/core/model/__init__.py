@@ -76,6 +76,10 @@ from .topic_filter import TopicFilter
 
 from .user_reading_session import UserReadingSession
 from .user_exercise_session import UserExerciseSession
+from .daily_learner_activity import DailyLearnerActivity
+
+from .article_creation_job import ArticleCreationJob
+from .background_job import BackgroundJob
 
 
 # bookmark scheduling
@@ -4,13 +4,13 @@ from datetime import datetime
 import time
 
 import sqlalchemy
-from langdetect import detect
 from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UnicodeText, Table
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship, backref, deferred, validates
 from sqlalchemy.orm.exc import NoResultFound
 from zeeguu.core.model.article_topic_map import TopicOriginType
 
-from zeeguu.core.language.difficulty_estimator_factory import DifficultyEstimatorFactory
+from zeeguu.core.content_quality.article_analysis import ArticleAnalysis
+from zeeguu.core.content_quality.language_identification import LANGUAGE_IDENTIFIER
 from zeeguu.core.model.article_url_keyword_map import ArticleUrlKeywordMap
 from zeeguu.core.model.article_topic_map import ArticleTopicMap
 from zeeguu.core.util.encoding import datetime_to_json
@@ -48,9 +48,14 @@ class Article(db.Model):
 
     title = Column(String(512))
     authors = Column(UnicodeText)
-    content = Column(UnicodeText())
-    htmlContent = Column(UnicodeText())
+    # the text of an article is only loaded when it is used, such that
+    # the lists of articles (which only show the content_preview) don't
+    # transfer the whole text of every article from the DB
+    content = deferred(Column(UnicodeText()))
+    htmlContent = deferred(Column(UnicodeText()))
     summary = Column(UnicodeText)
+    # the beginning of the content; kept in sync with it by _set_content
+    content_preview = Column(String(MAX_CHAR_COUNT_IN_SUMMARY))
     word_count = Column(Integer)
     published_time = Column(DateTime)
     fk_difficulty = Column(Integer)
@@ -108,6 +113,7 @@ class Article(db.Model):
         deleted=0,
         video=0,
         img_url=None,
+        analysis=None,  # the ArticleAnalysis of the content, if there is one already
     ):
 
         if not summary:
@@ -131,18 +137,25 @@ class Article(db.Model):
         self.fk_cefr_level = None
 
         self.convertHTML2TextIfNeeded()
-        self.compute_fk_and_wordcount()
+        self.compute_fk_and_wordcount(analysis)
 
-    def compute_fk_and_wordcount(self):
-        fk_estimator = DifficultyEstimatorFactory.get_difficulty_estimator("fk")
-        fk_difficulty = fk_estimator.estimate_difficulty(
-            self.content, self.language, None
-        )
+    def compute_fk_and_wordcount(self, analysis=None):
+        if analysis is None or analysis.text is not self.content:
+            analysis = ArticleAnalysis(self.content)
+
+        fk_difficulty = analysis.fk_difficulty(self.language)
 
         # easier to store integer in the DB
         # otherwise we have to use Decimal, and it's not supported on all dbs
         self.fk_difficulty = fk_difficulty["grade"]
-        self.word_count = len(self.content.split())
+        self.word_count = analysis.word_count
+
+    @validates("content")
+    def _set_content(self, key, content):
+        self.content_preview = (
+            None if content is None else content[:MAX_CHAR_COUNT_IN_SUMMARY]
+        )
+        return content
 
     def __repr__(self):
         return f"<Article {self.title} (w: {self.word_count}, d: {self.fk_difficulty}) ({self.url})>"
@@ -217,7 +230,10 @@ class Article(db.Model):
             else:
                 return "C2"
 
-        summary = self.content[:MAX_CHAR_COUNT_IN_SUMMARY]
+        summary = self.content_preview
+        if summary is None:
+            # not backfilled yet; see tools/backfill_article_content_preview.py
+            summary = self.content[:MAX_CHAR_COUNT_IN_SUMMARY]
 
         result_dict = dict(
             id=self.id,
@@ -354,13 +370,15 @@ class Article(db.Model):
         parsed = download_and_parse(self.url.as_string())
         self.content = parsed.text
         self.htmlContent = parsed.htmlContent
-        self.compute_fk_and_wordcount()
+        self.compute_fk_and_wordcount(parsed.analysis)
 
         from zeeguu.core.content_quality.quality_filter import (
             sufficient_quality_plain_text,
         )
 
-        quality, reason, _ = sufficient_quality_plain_text(self.content)
+        quality, reason, _ = sufficient_quality_plain_text(
+            self.content, analysis=parsed.analysis
+        )
         if not quality:
             print("Marking as broken. Reason: " + reason)
             self.mark_as_low_quality_and_remove_from_index()
@@ -464,7 +482,12 @@ class Article(db.Model):
                 text = text.strip()
 
                 summary = text[0:MAX_CHAR_COUNT_IN_SUMMARY]
-                lang = detect(text)
+                # usually known already: the extension asks whether the
+                # language of the page is supported before it gets here
+                analysis = ArticleAnalysis(
+                    text, LANGUAGE_IDENTIFIER.language_of_html(html_content)
+                )
+                lang = analysis.language_code
             else:
                 # TODO: consequently, as above, this is probably not called because
                 # the only place where we call the endpoint is from the extension
@@ -479,6 +502,7 @@ class Article(db.Model):
                 title = np_article.title
                 authors = ", ".join(np_article.authors or [])
                 lang = np_article.meta_lang
+                analysis = np_article.analysis
 
             language = Language.find(lang)
 
@@ -495,6 +519,7 @@ class Article(db.Model):
                 None,
                 language,
                 html_content,
+                analysis=analysis,
             )
             session.add(new_article)
             session.commit()
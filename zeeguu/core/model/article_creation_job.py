@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm.exc import NoResultFound
+
+from zeeguu.core.model.article import Article
+from zeeguu.core.model.user import User
+
+from zeeguu.core.model import db
+
+
+class ArticleCreationJob(db.Model):
+    """
+
+    A request to create the article at a URL that is not yet in the DB.
+
+    Downloading, parsing, and analyzing a page takes seconds, so instead
+    of doing it inside the request, the /find_or_create_article endpoint
+    can save a job and return its id right away; the job is then run in
+    the background (see content_retriever.article_creation) and the client
+    polls /article_creation_job/<id> until it is done.
+
+    The jobs are run by the background jobs worker; one whose worker died
+    while creating the article is run again once the worker releases it.
+    Until then, a job that is not finished STALE_AFTER after it was created
+    is not reused for its URL anymore
+
+    """
+
+    __table_args__ = {"mysql_collate": "utf8_bin"}
+    __tablename__ = "article_creation_job"
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    UNSUPPORTED_LANGUAGE = "unsupported_language"
+    FAILED = "failed"
+
+    FINISHED = [DONE, UNSUPPORTED_LANGUAGE, FAILED]
+
+    # creating an article takes seconds; and the background jobs
+    # worker releases the jobs that are stuck after half an hour
+    STALE_AFTER = timedelta(minutes=30)
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    url = db.Column(db.String(2083), nullable=False)
+    html_content = db.Column(db.UnicodeText)
+    title = db.Column(db.String(512))
+    authors = db.Column(db.String(512))
+
+    user_id = db.Column(db.Integer, db.ForeignKey(User.id))
+    user = db.relationship(User)
+
+    status = db.Column(db.String(32), nullable=False)
+    error = db.Column(db.String(512))
+
+    article_id = db.Column(db.Integer, db.ForeignKey(Article.id))
+    article = db.relationship(Article)
+
+    created_at = db.Column(db.DateTime, nullable=False)
+    finished_at = db.Column(db.DateTime)
+
+    def __init__(self, url, html_content, title, authors, user):
+        self.url = url
+        self.html_content = html_content
+        self.title = title
+        self.authors = authors
+        self.user = user
+        self.status = self.PENDING
+        self.created_at = datetime.now()
+
+    def __repr__(self):
+        return f"<ArticleCreationJob {self.id} {self.status} {self.url}>"
+
+    def is_finished(self):
+        return self.status in self.FINISHED
+
+    def as_dictionary(self):
+        result = dict(id=self.id, status=self.status)
+        if self.status == self.DONE:
+            result["article"] = self.article.article_info()
+        if self.error:
+            result["error"] = self.error
+        return result
+
+    def run(self, session):
+        """
+        Creates the article; the outcome is saved in the status of the job.
+        Commits. Only called from the create_article background job (see
+        content_retriever.article_creation) which runs it once at a time
+        """
+        self.status = self.RUNNING
+        session.add(self)
+        session.commit()
+
+        try:
+            article = Article.find_or_create(
+                session,
+                self.url,
+                html_content=self.html_content,
+                title=self.title,
+                authors=self.authors,
+            )
+            if article:
+                self.article = article
+                self.status = self.DONE
+            else:
+                self.status = self.FAILED
+                self.error = "Could not save the article"
+        except NoResultFound:
+            session.rollback()
+            self.status = self.UNSUPPORTED_LANGUAGE
+        except Exception as e:
+            session.rollback()
+            self.status = self.FAILED
+            self.error = str(e)[:512]
+
+        self.finished_at = datetime.now()
+        session.add(self)
+        session.commit()
+
+    @classmethod
+    def find_or_create(
+        cls, session, url, html_content=None, title=None, authors="", user=None
+    ):
+        """
+        A URL that is requested again while its article is being created
+        (e.g. the page was reloaded) reuses the unfinished job for it;
+        unless that one is stale, e.g. its worker died
+        """
+        existing = (
+            cls.query.filter(cls.url == url)
+            .filter(cls.status.in_([cls.PENDING, cls.RUNNING]))
+            .filter(cls.created_at > datetime.now() - cls.STALE_AFTER)
+            .order_by(cls.id.desc())
+            .first()
+        )
+        if existing:
+            return existing
+
+        new = cls(url, html_content, title, authors, user)
+        session.add(new)
+        session.commit()
+        return new
+
+    @classmethod
+    def find_by_id(cls, job_id):
+        return cls.query.filter(cls.id == job_id).first()
@@ -0,0 +1,131 @@
+import json
+from datetime import datetime
+
+from zeeguu.core.model import db
+
+
+class BackgroundJob(db.Model):
+    """
+
+    A piece of work that a request handed off to be done later, by
+    tools/run_background_jobs.py (see zeeguu.core.background_jobs).
+
+    A job that fails is retried (after a delay that grows with every
+    attempt) until it runs out of attempts. Jobs with the same
+    idempotency_key are only saved once, such that handing off the
+    same work twice does not do it twice.
+
+    """
+
+    __table_args__ = {"mysql_collate": "utf8_bin"}
+    __tablename__ = "background_job"
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    task = db.Column(db.String(64), nullable=False)
+    payload = db.Column(db.UnicodeText, nullable=False)
+
+    idempotency_key = db.Column(db.String(255), unique=True)
+
+    status = db.Column(db.String(32), nullable=False)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False)
+    last_error = db.Column(db.String(512))
+
+    created_at = db.Column(db.DateTime, nullable=False)
+    # a pending job is not run before this time
+    run_after = db.Column(db.DateTime, nullable=False)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    def __init__(self, task, arguments, max_attempts, idempotency_key=None):
+        self.task = task
+        self.payload = json.dumps(arguments)
+        self.idempotency_key = idempotency_key
+        self.status = self.PENDING
+        self.attempts = 0
+        self.max_attempts = max_attempts
+        self.created_at = datetime.now()
+        self.run_after = self.created_at
+
+    def __repr__(self):
+        return f"<BackgroundJob {self.id} {self.task} {self.status} ({self.attempts})>"
+
+    def arguments(self):
+        return json.loads(self.payload)
+
+    @classmethod
+    def find_by_idempotency_key(cls, key, locking=False):
+        """
+        :param locking: a locking read; under REPEATABLE READ only such
+        a read sees a job that another transaction committed after
+        the current one started
+        """
+        query = cls.query.filter(cls.idempotency_key == key)
+        if locking:
+            query = query.with_for_update(read=True)
+        return query.first()
+
+    @classmethod
+    def ids_of_due(cls, now, limit):
+        return [
+            job_id
+            for (job_id,) in db.session.query(cls.id)
+            .filter(cls.status == cls.PENDING)
+            .filter(cls.run_after <= now)
+            .order_by(cls.run_after, cls.id)
+            .limit(limit)
+        ]
+
+    @classmethod
+    def claim(cls, session, job_id):
+        """
+        Marks the job as running, unless another worker already did
+
+        :return: the job, or None if it was not pending anymore
+        """
+        claimed = (
+            cls.query.filter(cls.id == job_id)
+            .filter(cls.status == cls.PENDING)
+            .update(
+                {
+                    cls.status: cls.RUNNING,
+                    cls.started_at: datetime.now(),
+                    cls.attempts: cls.attempts + 1,
+                },
+                synchronize_session=False,
+            )
+        )
+        session.commit()
+        if not claimed:
+            return None
+        return session.get(cls, job_id, populate_existing=True)
+
+    @classmethod
+    def release_stuck(cls, session, started_before):
+        """
+        Jobs whose worker died while running them are pending again;
+        unless they have no attempts left (e.g. they kill their worker
+        every time), then they failed
+        """
+        stuck = cls.query.filter(cls.status == cls.RUNNING).filter(
+            cls.started_at < started_before
+        )
+        stuck.filter(cls.attempts >= cls.max_attempts).update(
+            {
+                cls.status: cls.FAILED,
+                cls.last_error: "abandoned by its worker",
+                cls.finished_at: datetime.now(),
+            },
+            synchronize_session=False,
+        )
+        released = stuck.filter(cls.attempts < cls.max_attempts).update(
+            {cls.status: cls.PENDING}, synchronize_session=False
+        )
+        session.commit()
+        return released
@@ -4,27 +4,28 @@ import sqlalchemy
 from sqlalchemy import Column, ForeignKey, Integer, Table
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm.exc import NoResultFound
-from wordstats import Word
 
 from zeeguu.logging import log
 from zeeguu.core.bookmark_quality.fit_for_study import fit_for_study
 
 from zeeguu.core.model import Article
+from zeeguu.core.model.daily_learner_activity import DailyLearnerActivity
 from zeeguu.core.model.exercise import Exercise
 from zeeguu.core.model.exercise_outcome import ExerciseOutcome
 from zeeguu.core.model.exercise_source import ExerciseSource
 from zeeguu.core.model.language import Language
 from zeeguu.core.model.text import Text
 from zeeguu.core.model.user import User
+from zeeguu.core.model.user_exercise_session import UserExerciseSession
 from zeeguu.core.model.user_word import UserWord
 from zeeguu.core.util.encoding import datetime_to_json
+from zeeguu.core.word_stats import word_stats, word_stats_for
 from zeeguu.core.model.learning_cycle import LearningCycle
 from zeeguu.core.model.bookmark_user_preference import UserWordExPreference
 
 
 from zeeguu.core.model import db
 
-
 bookmark_exercise_mapping = Table(
     "bookmark_exercise_mapping",
     db.Model.metadata,
@@ -168,6 +169,14 @@ class Bookmark(db.Model):
         self.add_new_exercise(exercise)
         db.session.add(exercise)
 
+        if session_id:
+            UserExerciseSession.tag_with_language(
+                db.session, session_id, self.origin.language_id
+            )
+        DailyLearnerActivity.record(
+            db.session, self.user_id, self.origin.language_id, time, exercises_done=1
+        )
+
         return exercise
 
     def report_exercise_outcome(
@@ -179,7 +188,12 @@ class Bookmark(db.Model):
         other_feedback,
         db_session,
         time: datetime = None,
+        commit=True,
     ):
+        """
+        :param commit: if False, the caller must commit;
+        see report_exercise_outcomes
+        """
 
         source = ExerciseSource.find_or_create(db_session, exercise_source)
         outcome = ExerciseOutcome.find_or_create(db_session, exercise_outcome)
@@ -190,7 +204,10 @@ class Bookmark(db.Model):
         db_session.add(exercise)
 
         scheduler = self.get_scheduler()
-        scheduler.update(db_session, self, exercise_outcome, time)
+        scheduler.update(db_session, self, exercise_outcome, time, commit)
+
+        if not commit:
+            return
 
         db_session.commit()
 
@@ -200,6 +217,109 @@ class Bookmark(db.Model):
         # self.update_learned_status(db_session)
 
     def json_serializable_dict(self, with_context=True, with_title=False):
+        try:
+            scheduler = self.get_scheduler()
+            schedule = scheduler.query.filter(scheduler.bookmark_id == self.id).one()
+        except sqlalchemy.exc.NoResultFound:
+            schedule = None
+
+        word_info = word_stats(self.origin.word, self.origin.language.code)
+
+        return self._json_dict(schedule, word_info, with_context, with_title)
+
+    @classmethod
+    def json_serializable_dicts(cls, bookmarks, with_context=True, with_title=False):
+        """
+            Same result as calling json_serializable_dict on every one of the
+            bookmarks, but the words, languages, texts, articles, and schedules
+            are loaded for all of them at once, in a constant number of queries
+
+        :param bookmarks: list of Bookmark objects
+        :return: list of dictionaries in the order of the bookmarks
+        """
+        if not bookmarks:
+            return []
+
+        from zeeguu.core.model.user_preference import UserPreference
+
+        cls.preload_for_serialization(bookmarks)
+        schedules = cls._schedules_by_bookmark_id(bookmarks)
+        word_infos = word_stats_for(
+            (b.origin.word, b.origin.language.code) for b in bookmarks
+        )
+
+        # looked up once per user instead of once per scheduled bookmark
+        productive_exercises_enabled = {}
+
+        result = []
+        for b in bookmarks:
+            schedule = schedules.get(b.id)
+            if schedule is not None and b.user_id not in productive_exercises_enabled:
+                productive_exercises_enabled[b.user_id] = (
+                    UserPreference.is_productive_exercises_preference_enabled(b.user)
+                )
+
+            result.append(
+                b._json_dict(
+                    schedule,
+                    word_infos[(b.origin.word, b.origin.language.code)],
+                    with_context,
+                    with_title,
+                    productive_exercises_enabled.get(b.user_id),
+                )
+            )
+        return result
+
+    @classmethod
+    def preload_for_serialization(cls, bookmarks):
+        """
+        Loads in the session, with one query, everything that the
+        serialization of the bookmarks navigates to. The objects that
+        are already loaded are not touched
+        """
+        from sqlalchemy.orm import joinedload, load_only
+        from zeeguu.core.model.url import Url
+
+        (
+            cls.query.filter(cls.id.in_([b.id for b in bookmarks]))
+            .options(
+                joinedload(cls.origin).joinedload(UserWord.language),
+                joinedload(cls.translation).joinedload(UserWord.language),
+                joinedload(cls.text)
+                .joinedload(Text.article)
+                .options(
+                    load_only(Article.id, Article.title, Article.url_id),
+                    joinedload(Article.url).joinedload(Url.domain),
+                ),
+            )
+            .all()
+        )
+
+    @classmethod
+    def _schedules_by_bookmark_id(cls, bookmarks):
+        from zeeguu.core.word_scheduling import get_scheduler
+
+        bookmark_ids_by_user = {}
+        for b in bookmarks:
+            bookmark_ids_by_user.setdefault(b.user_id, []).append(b.id)
+
+        schedules = {}
+        for user_id, bookmark_ids in bookmark_ids_by_user.items():
+            scheduler = get_scheduler(User.find_by_id(user_id))
+            for schedule in scheduler.query.filter(
+                scheduler.bookmark_id.in_(bookmark_ids)
+            ):
+                schedules.setdefault(schedule.bookmark_id, schedule)
+        return schedules
+
+    def _json_dict(
+        self,
+        schedule,
+        word_info,
+        with_context,
+        with_title,
+        productive_exercises_enabled=None,
+    ):
         try:
             translation_word = self.translation.word
             translation_language = self.translation.language.code
@@ -211,36 +331,26 @@ class Bookmark(db.Model):
             )
             print(str(e))
 
-        word_info = Word.stats(self.origin.word, self.origin.language.code)
-
         learned_datetime = (
             str(self.learned_time.date()) if self.learned_time is not None else ""
         )
 
         created_day = "today" if self.time.date() == datetime.now().date() else ""
 
-        # Fetch the BasicSRSchedule instance associated with the current bookmark
         from zeeguu.core.word_scheduling import ONE_DAY
 
-        try:
-            scheduler = self.get_scheduler()
-            bookmark_scheduler = scheduler.query.filter(
-                scheduler.bookmark_id == self.id
-            ).one()
-            cooling_interval_in_days = bookmark_scheduler.cooling_interval // ONE_DAY
-            next_practice_time = bookmark_scheduler.next_practice_time
-            can_update_schedule = (
-                next_practice_time <= bookmark_scheduler.get_end_of_today()
-            )
-            consecutive_correct_answers = bookmark_scheduler.consecutive_correct_answers
-            is_last_in_cycle = (
-                bookmark_scheduler.get_max_interval()
-                == bookmark_scheduler.cooling_interval
-            )
+        if schedule is not None:
+            cooling_interval_in_days = schedule.cooling_interval // ONE_DAY
+            next_practice_time = schedule.next_practice_time
+            can_update_schedule = next_practice_time <= schedule.get_end_of_today()
+            consecutive_correct_answers = schedule.consecutive_correct_answers
+            is_last_in_cycle = schedule.get_max_interval() == schedule.cooling_interval
 
-            is_about_to_be_learned = bookmark_scheduler.is_about_to_be_learned()
+            is_about_to_be_learned = schedule.is_about_to_be_learned(
+                productive_exercises_enabled
+            )
 
-        except sqlalchemy.exc.NoResultFound:
+        else:
             cooling_interval_in_days = None
             can_update_schedule = None
             consecutive_correct_answers = None
@@ -312,13 +422,19 @@ class Bookmark(db.Model):
         origin_lang = Language.find_or_create(_origin_lang)
         translation_lang = Language.find_or_create(_translation_lang)
 
-        origin = UserWord.find_or_create(session, _origin, origin_lang)
-
-        article = Article.query.filter_by(id=article_id).one()
-
-        context = Text.find_or_create(session, _context, origin_lang, None, article)
+        article = session.get(Article, article_id)
+        if article is None:
+            raise NoResultFound(f"No article with id {article_id}")
 
-        translation = UserWord.find_or_create(session, _translation, translation_lang)
+        # the words and the context are only flushed, such that everything
+        # is saved in the single commit at the end
+        origin = UserWord.find_or_create(session, _origin, origin_lang, commit=False)
+        context = Text.find_or_create(
+            session, _context, origin_lang, None, article, commit=False
+        )
+        translation = UserWord.find_or_create(
+            session, _translation, translation_lang, commit=False
+        )
 
         now = datetime.now()
 
@@ -339,6 +455,9 @@ class Bookmark(db.Model):
                 learning_cycle=learning_cycle,
                 level=level,
             )
+            DailyLearnerActivity.record(
+                session, user.id, origin_lang.id, now, bookmarks_created=1
+            )
         except Exception as e:
             raise e
 
@@ -422,6 +541,14 @@ class Bookmark(db.Model):
         )
         if is_learned:
             log(f"Log: {exercise_log.summary()}: bookmark {self.id} learned!")
+            if self.learned_time is None:
+                DailyLearnerActivity.record(
+                    session,
+                    self.user_id,
+                    self.origin.language_id,
+                    exercise_log.last_exercise_time(),
+                    words_learned=1,
+                )
             self.learned_time = exercise_log.last_exercise_time()
             session.add(self)
         else:
@@ -0,0 +1,289 @@
+from datetime import date, datetime
+
+import sqlalchemy
+from sqlalchemy import UniqueConstraint, func
+from sqlalchemy.exc import IntegrityError
+
+from zeeguu.core.model.language import Language
+from zeeguu.core.model.user import User
+
+from zeeguu.core.model import db
+
+
+class DailyLearnerActivity(db.Model):
+    """
+
+    Per user, language, and day aggregates of the learner activity, such
+    that the statistics do not have to go through the whole history of
+    sessions and bookmarks of a user every time they are shown.
+
+    The counters are incremented when the activity is saved (see record);
+    rebuild recomputes them from the history, and can be run periodically
+    to correct for anything that was not recorded incrementally.
+
+    The day of a session is the day in which the session started.
+
+    """
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "language_id", "day"),
+        {"mysql_collate": "utf8_bin"},
+    )
+    __tablename__ = "daily_learner_activity"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(db.Integer, db.ForeignKey(User.id), nullable=False)
+    user = db.relationship(User)
+
+    # NULL for the exercise sessions in which no exercise was done
+    # (and for the reading sessions of articles that do not exist anymore)
+    language_id = db.Column(db.Integer, db.ForeignKey(Language.id))
+    language = db.relationship(Language)
+
+    day = db.Column(db.Date, nullable=False)
+
+    reading_ms = db.Column(db.Integer, nullable=False, default=0)
+    exercise_ms = db.Column(db.Integer, nullable=False, default=0)
+    bookmarks_created = db.Column(db.Integer, nullable=False, default=0)
+    exercises_done = db.Column(db.Integer, nullable=False, default=0)
+    words_learned = db.Column(db.Integer, nullable=False, default=0)
+
+    COUNTERS = [
+        "reading_ms",
+        "exercise_ms",
+        "bookmarks_created",
+        "exercises_done",
+        "words_learned",
+    ]
+
+    def __init__(self, user_id, language_id, day, **counters):
+        self.user_id = user_id
+        self.language_id = language_id
+        self.day = day
+        for counter in self.COUNTERS:
+            setattr(self, counter, counters.get(counter, 0))
+
+    def __repr__(self):
+        return f"<DailyLearnerActivity {self.user_id} {self.language_id} {self.day}>"
+
+    @classmethod
+    def record(cls, db_session, user_id, language_id, time, **increments):
+        """
+        Adds the increments (e.g. bookmarks_created=1) to the counters
+        of the user and language for the day of the given time;
+        does not commit
+
+        """
+        increments = {k: v for k, v in increments.items() if v}
+        if not increments:
+            return
+
+        if cls._increment(db_session, user_id, language_id, time.date(), increments):
+            return
+
+        try:
+            with db_session.begin_nested():
+                db_session.add(cls(user_id, language_id, time.date(), **increments))
+        except IntegrityError:
+            # another request created the row in the meantime
+            cls._increment(db_session, user_id, language_id, time.date(), increments)
+
+    @classmethod
+    def record_session_duration(cls, db_session, session, previous_duration):
+        """
+        :param session: a UserReadingSession or a UserExerciseSession
+        whose duration was just updated
+        """
+        from zeeguu.core.model.user_reading_session import UserReadingSession
+
+        increment = round((session.duration or 0) - (previous_duration or 0))
+        if isinstance(session, UserReadingSession):
+            language_id = session.article.language_id if session.article else None
+            counter = "reading_ms"
+        else:
+            language_id = session.language_id
+            counter = "exercise_ms"
+
+        cls.record(
+            db_session,
+            session.user_id,
+            language_id,
+            session.start_time,
+            **{counter: increment},
+        )
+
+    @classmethod
+    def _increment(cls, db_session, user_id, language_id, day, increments):
+        result = db_session.execute(
+            sqlalchemy.update(cls)
+            .where(
+                cls.user_id == user_id,
+                cls._language_is(language_id),
+                cls.day == day,
+            )
+            .values({k: getattr(cls, k) + v for k, v in increments.items()})
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    @classmethod
+    def _language_is(cls, language_id):
+        if language_id is None:
+            return cls.language_id == None
+        return cls.language_id == language_id
+
+    @classmethod
+    def days_with(cls, user_id, counter, language_id=None, after_date=None, limit=None):
+        """
+        :return: the days on which the given counter is positive,
+        most recent first; for all the languages if language_id is None
+        """
+        query = (
+            db.session.query(cls.day)
+            .filter(cls.user_id == user_id)
+            .group_by(cls.day)
+            .having(func.sum(getattr(cls, counter)) > 0)
+            .order_by(cls.day.desc())
+        )
+        if language_id is not None:
+            query = query.filter(cls.language_id == language_id)
+        if after_date is not None:
+            query = query.filter(cls.day >= _as_date(after_date))
+        if limit is not None:
+            query = query.limit(limit)
+        return [_as_date(day) for (day,) in query.all()]
+
+    @classmethod
+    def totals_by_day(cls, user_id, counters, language_id=None, after_date=None):
+        """
+        :return: list of (day, counter values...) in chronological order,
+        summed over the languages if language_id is None
+        """
+        query = (
+            db.session.query(
+                cls.day, *[func.sum(getattr(cls, each)) for each in counters]
+            )
+            .filter(cls.user_id == user_id)
+            .group_by(cls.day)
+            .order_by(cls.day)
+        )
+        if language_id is not None:
+            query = query.filter(cls.language_id == language_id)
+        if after_date is not None:
+            query = query.filter(cls.day >= _as_date(after_date))
+        return [
+            (_as_date(day), *[int(value or 0) for value in values])
+            for day, *values in query.all()
+        ]
+
+    @classmethod
+    def rebuild(cls, db_session, user_id=None, since: datetime = None):
+        """
+        Recomputes the aggregates from the sessions, bookmarks, and
+        exercises; for one user or for all of them, for all the days
+        or only for the ones after since
+
+        """
+        from zeeguu.core.model import (
+            Article,
+            Bookmark,
+            Exercise,
+            UserExerciseSession,
+            UserReadingSession,
+            UserWord,
+        )
+        from zeeguu.core.model.bookmark import bookmark_exercise_mapping
+
+        if since is not None:
+            since = datetime.combine(_as_date(since), datetime.min.time())
+
+        def grouped(query, time_column, user_column, language_column, value):
+            query = query.with_entities(
+                user_column, language_column, func.date(time_column), value
+            )
+            if user_id is not None:
+                query = query.filter(user_column == user_id)
+            if since is not None:
+                query = query.filter(time_column >= since)
+            return query.group_by(
+                user_column, language_column, func.date(time_column)
+            ).all()
+
+        bookmark_origin = db_session.query(Bookmark).join(
+            UserWord, Bookmark.origin_id == UserWord.id
+        )
+
+        aggregates = {
+            "reading_ms": grouped(
+                db_session.query(UserReadingSession).outerjoin(
+                    Article, UserReadingSession.article_id == Article.id
+                ),
+                UserReadingSession.start_time,
+                UserReadingSession.user_id,
+                Article.language_id,
+                func.sum(UserReadingSession.duration),
+            ),
+            "exercise_ms": grouped(
+                db_session.query(UserExerciseSession),
+                UserExerciseSession.start_time,
+                UserExerciseSession.user_id,
+                UserExerciseSession.language_id,
+                func.sum(UserExerciseSession.duration),
+            ),
+            "bookmarks_created": grouped(
+                bookmark_origin,
+                Bookmark.time,
+                Bookmark.user_id,
+                UserWord.language_id,
+                func.count(Bookmark.id),
+            ),
+            "exercises_done": grouped(
+                bookmark_origin.join(
+                    bookmark_exercise_mapping,
+                    bookmark_exercise_mapping.c.bookmark_id == Bookmark.id,
+                ).join(
+                    Exercise, bookmark_exercise_mapping.c.exercise_id == Exercise.id
+                ),
+                Exercise.time,
+                Bookmark.user_id,
+                UserWord.language_id,
+                func.count(Exercise.id),
+            ),
+            "words_learned": grouped(
+                bookmark_origin.filter(Bookmark.learned_time != None),
+                Bookmark.learned_time,
+                Bookmark.user_id,
+                UserWord.language_id,
+                func.count(Bookmark.id),
+            ),
+        }
+
+        rows = {}
+        for counter, values in aggregates.items():
+            for each_user_id, language_id, day, value in values:
+                key = (each_user_id, language_id, _as_date(day))
+                if key not in rows:
+                    rows[key] = cls(*key)
+                setattr(rows[key], counter, int(value or 0))
+
+        existing = db_session.query(cls)
+        if user_id is not None:
+            existing = existing.filter(cls.user_id == user_id)
+        if since is not None:
+            existing = existing.filter(cls.day >= _as_date(since))
+        existing.delete(synchronize_session=False)
+
+        db_session.add_all(rows.values())
+        db_session.commit()
+
+        return len(rows)
+
+
+def _as_date(value):
+    # sqlite returns the result of date() as a string
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
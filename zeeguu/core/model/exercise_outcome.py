@@ -2,6 +2,7 @@ import sqlalchemy
 import zeeguu.core
 
 from zeeguu.core.model import db
+from zeeguu.core.model.reference_table_cache import ReferenceTableCache
 
 
 class ExerciseOutcome(db.Model):
@@ -82,19 +83,19 @@ class ExerciseOutcome(db.Model):
 
     @classmethod
     def find(cls, outcome: str):
-        return cls.query.filter_by(outcome=outcome).one()
+        return cls.cache.find_by_key(outcome)
 
     @classmethod
     def find_or_create(cls, session, _outcome: str):
         try:
-            outcome = cls.find(_outcome)
-
+            return cls.find(_outcome)
         except sqlalchemy.orm.exc.NoResultFound as e:
             outcome = cls(_outcome)
-        except Exception as e:
-            raise e
 
         session.add(outcome)
         session.commit()
 
         return outcome
+
+
+ExerciseOutcome.cache = ReferenceTableCache(ExerciseOutcome, "outcome")
@@ -3,6 +3,7 @@ from sqlalchemy.orm.exc import NoResultFound
 import zeeguu.core
 
 from zeeguu.core.model import db
+from zeeguu.core.model.reference_table_cache import ReferenceTableCache
 
 
 class ExerciseSource(db.Model):
@@ -22,19 +23,19 @@ class ExerciseSource(db.Model):
 
     @classmethod
     def find(cls, source):
-        return cls.query.filter_by(source=source).one()
+        return cls.cache.find_by_key(source)
 
     @classmethod
     def find_or_create(cls, session, _source):
         try:
-            source = cls.find(_source)
-
+            return cls.find(_source)
         except NoResultFound as e:
             source = cls(_source)
-        except Exception as e:
-            raise e
 
         session.add(source)
         session.commit()
 
         return source
+
+
+ExerciseSource.cache = ReferenceTableCache(ExerciseSource, "source")
@@ -6,6 +6,7 @@ from zeeguu.logging import logp
 import zeeguu
 
 from zeeguu.core.model import db
+from zeeguu.core.model.reference_table_cache import ReferenceTableCache
 
 
 class Language(db.Model):
@@ -136,8 +137,7 @@ class Language(db.Model):
 
     @classmethod
     def find(cls, code):
-        result = cls.query.filter(Language.code == code).one()
-        return result
+        return cls.cache.find_by_key(code)
 
     @classmethod
     def find_or_create(cls, language_code):
@@ -161,7 +161,7 @@ class Language(db.Model):
 
     @classmethod
     def find_by_id(cls, i):
-        return cls.query.filter(Language.id == i).one()
+        return cls.cache.find_by_id(i)
 
     def get_articles(
         self, after_date=None, most_recent_first=False, easiest_first=False
@@ -237,3 +237,6 @@ class Language(db.Model):
         """
 
         return [user.learned_language]
+
+
+Language.cache = ReferenceTableCache(Language, "code")
@@ -0,0 +1,120 @@
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.exc import NoResultFound
+
+from zeeguu.core.model import db
+
+REFRESH_INTERVAL = timedelta(minutes=30)
+
+_all_caches = []
+
+
+class ReferenceTableCache:
+    """
+    Process-wide, read-only snapshot of a small reference table
+    (Language, ExerciseSource, ExerciseOutcome, Topic).
+
+    The rows are loaded once, kept as detached copies that are never
+    modified, and reloaded when older than REFRESH_INTERVAL. A key that
+    is not found (e.g. a row added by another process) is looked up in
+    the DB on its own, rather than reloading the whole table.
+
+    Lookups return an instance that belongs to the current db.session;
+    it is obtained with session.merge(load=False) which emits no SQL.
+    """
+
+    def __init__(self, model_class, key_attribute: str):
+        self.model_class = model_class
+        self.key_attribute = key_attribute
+
+        self._by_key = {}
+        self._by_id = {}
+        self._last_load = None
+        self._lock = threading.Lock()
+
+        _all_caches.append(self)
+
+    def find_by_key(self, key):
+        detached = self._lookup(
+            "_by_key", key, getattr(self.model_class, self.key_attribute)
+        )
+        return db.session.merge(detached, load=False)
+
+    def find_by_id(self, _id):
+        detached = self._lookup("_by_id", int(_id), self.model_class.id)
+        return db.session.merge(detached, load=False)
+
+    def all(self):
+        self._reload_if_stale()
+        return [db.session.merge(each, load=False) for each in self._by_id.values()]
+
+    def invalidate(self):
+        self._last_load = None
+
+    def _lookup(self, index_name, key, column):
+        self._reload_if_stale()
+
+        try:
+            return getattr(self, index_name)[key]
+        except KeyError:
+            pass
+
+        # might have been added since the last load
+        row = db.session.query(self.model_class).filter(column == key).one_or_none()
+        if row is None:
+            raise NoResultFound(f"No {self.model_class.__name__} for {key}")
+        return self._add(row)
+
+    def _reload_if_stale(self):
+        if (
+            self._last_load is None
+            or datetime.now() - self._last_load > REFRESH_INTERVAL
+        ):
+            self._reload()
+
+    def _reload(self):
+        with self._lock:
+            rows = db.session.query(self.model_class).all()
+            detached_copies = [_detached_copy(each) for each in rows]
+
+            self._by_id = {each.id: each for each in detached_copies}
+            self._by_key = {
+                getattr(each, self.key_attribute): each for each in detached_copies
+            }
+            self._last_load = datetime.now()
+
+    def _add(self, row):
+        detached_copy = _detached_copy(row)
+        with self._lock:
+            # copied, such that a lookup that runs meanwhile
+            # never sees a dict that is being changed
+            self._by_id = {**self._by_id, detached_copy.id: detached_copy}
+            self._by_key = {
+                **self._by_key,
+                getattr(detached_copy, self.key_attribute): detached_copy,
+            }
+        return detached_copy
+
+
+def _detached_copy(instance):
+    # A copy that shares no state with the session that loaded
+    # the original; this way a commit (which expires the original)
+    # or a closed session can not affect the cached values
+    mapper = inspect(instance).mapper
+    copy = mapper.class_manager.new_instance()
+    for column_attribute in mapper.column_attrs:
+        setattr(copy, column_attribute.key, getattr(instance, column_attribute.key))
+    make_transient_to_detached(copy)
+    return copy
+
+
+def invalidate_all_reference_caches():
+    """
+    Must be called when the model gets bound to a different
+    database, e.g. every time an app is created in the tests
+    """
+    for each in _all_caches:
+        each.invalidate()
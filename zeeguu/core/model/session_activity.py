@@ -0,0 +1,73 @@
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, update
+
+from zeeguu.core.model.session import Session
+from zeeguu.logging import warning
+
+# how often the recorded uses are written to the DB; a session.last_use
+# can be this much behind, and what was not written yet when the process
+# stops is lost, which is fine for a timestamp that expires after days
+FLUSH_INTERVAL = timedelta(minutes=1)
+
+
+class SessionActivityTracker(object):
+    """
+    Records in memory when every session was used last, and writes all
+    of them at once, with a single UPDATE, at most once per FLUSH_INTERVAL;
+    rather than writing the session row of a learner on every request
+    """
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+
+        self._last_uses = {}
+        self._last_flush = datetime.now()
+        self._lock = threading.Lock()
+
+    def record_use(self, session_uuid, time=None):
+        with self._lock:
+            self._last_uses[session_uuid] = time or datetime.now()
+
+    def flush_if_due(self, db_session):
+        if datetime.now() - self._last_flush < self.flush_interval:
+            return
+        try:
+            self.flush(db_session)
+        except Exception as e:
+            # the uses are written with the next flush
+            warning(f"Could not save the last use of the sessions: {e}")
+
+    def flush(self, db_session):
+        """
+        Writes the recorded uses, and commits; must not be called
+        while the db_session has changes that are not to be committed yet
+        """
+        with self._lock:
+            last_uses, self._last_uses = self._last_uses, {}
+            self._last_flush = datetime.now()
+        if not last_uses:
+            return
+
+        try:
+            db_session.execute(
+                update(Session)
+                .where(Session.uuid.in_(last_uses.keys()))
+                .values(last_use=case(last_uses, value=Session.uuid))
+                .execution_options(synchronize_session=False)
+            )
+            db_session.commit()
+        except Exception:
+            db_session.rollback()
+            # they are recorded again, unless more recent uses were meanwhile
+            with self._lock:
+                self._last_uses = {**last_uses, **self._last_uses}
+            raise
+
+    def clear(self):
+        with self._lock:
+            self._last_uses = {}
+
+
+SESSION_ACTIVITY = SessionActivityTracker()
@@ -1,13 +1,66 @@
+from collections import defaultdict
+
+from sqlalchemy.orm import joinedload
+
+
 class SortedExerciseLog(object):
 
-    def __init__(self, bookmark):
-        self.exercises = sorted(
-            bookmark.exercise_log, key=lambda x: x.time, reverse=True
-        )
+    def __init__(self, bookmark, exercises=None, learning_cycle_length=None):
+        """
+        :param exercises: the exercise log of the bookmark, if already
+        loaded; by default bookmark.exercise_log
+        :param learning_cycle_length: by default the one of the scheduler
+        of the owner of the bookmark
+        """
+        if exercises is None:
+            exercises = bookmark.exercise_log
+        self.exercises = sorted(exercises, key=lambda x: x.time, reverse=True)
         self.bookmark = bookmark
-        self.learning_cycle_length = (
-            bookmark.get_scheduler().get_learning_cycle_length()
-        )
+        if learning_cycle_length is None:
+            learning_cycle_length = bookmark.get_scheduler().get_learning_cycle_length()
+        self.learning_cycle_length = learning_cycle_length
+
+    @classmethod
+    def for_bookmarks(cls, bookmarks):
+        """
+        The exercise logs of many bookmarks at once: the exercises
+        of all of them (and their outcomes) are loaded in a single query,
+        and the scheduler is looked up once per user
+
+        :return: dictionary bookmark id -> SortedExerciseLog
+        """
+        from zeeguu.core.model import db, Exercise
+        from zeeguu.core.model.bookmark import bookmark_exercise_mapping
+
+        exercises = defaultdict(list)
+        if bookmarks:
+            rows = (
+                db.session.query(bookmark_exercise_mapping.c.bookmark_id, Exercise)
+                .join(Exercise, bookmark_exercise_mapping.c.exercise_id == Exercise.id)
+                .options(joinedload(Exercise.outcome))
+                .filter(
+                    bookmark_exercise_mapping.c.bookmark_id.in_(
+                        [each.id for each in bookmarks]
+                    )
+                )
+                .order_by(Exercise.id)
+            )
+            for bookmark_id, exercise in rows:
+                exercises[bookmark_id].append(exercise)
+
+        learning_cycle_lengths = {}
+        logs = {}
+        for bookmark in bookmarks:
+            if bookmark.user_id not in learning_cycle_lengths:
+                learning_cycle_lengths[bookmark.user_id] = (
+                    bookmark.get_scheduler().get_learning_cycle_length()
+                )
+            logs[bookmark.id] = cls(
+                bookmark,
+                exercises[bookmark.id],
+                learning_cycle_lengths[bookmark.user_id],
+            )
+        return logs
 
     # string rep for logging
     def summary(self):
@@ -107,11 +107,13 @@ class Text(db.Model):
         )
 
     @classmethod
-    def find_or_create(cls, session, text, language, url, article):
+    def find_or_create(cls, session, text, language, url, article, commit=True):
         """
         :param text: string
         :param language: Language (object)
         :param url: Url (object)
+        :param commit: if False, a new text is only flushed (in a savepoint)
+        and the caller is responsible for committing
         :return:
         """
         # we ended up with a bunch of duplicates in the
@@ -120,29 +122,59 @@ class Text(db.Model):
         # and some other times don't.
         # we fix it here now
         clean_text = text.strip()
+        existing = cls._find(clean_text, article)
+        if existing:
+            return existing
+
+        if not commit:
+            return cls._create_in_savepoint(session, clean_text, language, url, article)
+
+        try:
+            new = cls(clean_text, language, url, article)
+            session.add(new)
+            session.commit()
+            return new
+        except sqlalchemy.exc.IntegrityError or sqlalchemy.exc.DatabaseError:
+            for i in range(10):
+                try:
+                    session.rollback()
+                    t = cls.query.filter(
+                        cls.content_hash == text_hash(clean_text)
+                    ).one()
+                    print("found text after recovering from race")
+                    return t
+                except:
+                    print("exception of second degree in find text..." + str(i))
+                    time.sleep(0.3)
+                    continue
+                break
+
+    @classmethod
+    def _find(cls, clean_text, article, locking=False):
+        # there is no unique key on the hash and the article, so two
+        # requests that create the same text at the same time can both
+        # succeed; the oldest of the two is the one that is used after
+        query = (
+            cls.query.filter(cls.content_hash == text_hash(clean_text))
+            .filter(cls.article == article)
+            .order_by(cls.id)
+        )
+        if locking:
+            # under REPEATABLE READ only a locking read sees what other
+            # transactions committed after this one started
+            query = query.with_for_update(read=True)
+        return query.first()
+
+    @classmethod
+    def _create_in_savepoint(cls, session, clean_text, language, url, article):
         try:
-            return (
-                cls.query.filter(cls.content_hash == text_hash(clean_text))
-                .filter(cls.article == article)
-                .one()
-            )
-        except sqlalchemy.orm.exc.NoResultFound or sqlalchemy.exc.InterfaceError:
-            try:
+            with session.begin_nested():
                 new = cls(clean_text, language, url, article)
                 session.add(new)
-                session.commit()
-                return new
-            except sqlalchemy.exc.IntegrityError or sqlalchemy.exc.DatabaseError:
-                for i in range(10):
-                    try:
-                        session.rollback()
-                        t = cls.query.filter(
-                            cls.content_hash == text_hash(clean_text)
-                        ).one()
-                        print("found text after recovering from race")
-                        return t
-                    except:
-                        print("exception of second degree in find text..." + str(i))
-                        time.sleep(0.3)
-                        continue
-                    break
+            return new
+        except sqlalchemy.exc.IntegrityError:
+            # only the savepoint was rolled back, not the ongoing transaction
+            existing = cls._find(clean_text, article, locking=True)
+            if existing is None:
+                raise
+            return existing
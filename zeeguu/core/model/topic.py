@@ -3,6 +3,7 @@ from zeeguu.logging import logp
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 from zeeguu.core.model import db
+from zeeguu.core.model.reference_table_cache import ReferenceTableCache
 from zeeguu.core.model.language import Language
 from zeeguu.core.model.article_topic_map import ArticleTopicMap
 from datetime import datetime
@@ -71,7 +72,7 @@ class Topic(db.Model):
     @classmethod
     def find(cls, name: str):
         try:
-            return cls.query.filter(cls.title == name).one()
+            return cls.cache.find_by_key(name)
         except Exception as e:
             from sentry_sdk import capture_exception
 
@@ -81,8 +82,7 @@ class Topic(db.Model):
     @classmethod
     def find_by_id(cls, i):
         try:
-            result = cls.query.filter(cls.id == i).one()
-            return result
+            return cls.cache.find_by_id(i)
         except Exception as e:
             from sentry_sdk import capture_exception
 
@@ -121,3 +121,6 @@ class Topic(db.Model):
 
         topics_available = cls.language_topic_available_cache[language.id][0]
         return topics_available
+
+
+Topic.cache = ReferenceTableCache(Topic, "title")
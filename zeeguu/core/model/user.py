@@ -1,7 +1,7 @@
 #
 import datetime
 import json
-import random
+import os
 import re
 
 import sqlalchemy.orm
@@ -15,7 +15,11 @@ from zeeguu.core.model.language import Language
 from zeeguu.core.model.learning_cycle import LearningCycle
 
 from zeeguu.logging import log
-from zeeguu.core.util import password_hash
+from zeeguu.core.util.password import (
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
 
 from zeeguu.core.model import db
 from zeeguu.logging import warning
@@ -402,11 +406,9 @@ class User(db.Model):
         :param password: str
         :return:
         """
-        salt_bytes = "".join(chr(random.randint(0, 255)) for _ in range(32)).encode(
-            "utf-8"
-        )
+        salt_bytes = os.urandom(32)
 
-        self.password = password_hash(password, salt_bytes)
+        self.password = hash_password(password, salt_bytes)
         self.password_salt = salt_bytes.hex()
 
     def all_reading_sessions(
@@ -604,6 +606,21 @@ class User(db.Model):
         with_title=False,
         language_id=None,
     ):
+        from zeeguu.core.model.daily_learner_activity import DailyLearnerActivity
+
+        # only the bookmarks of the most recent max days with bookmarks
+        # are returned, so there is no need to load the ones before them
+        recent_days = DailyLearnerActivity.days_with(
+            self.id,
+            "bookmarks_created",
+            language_id or self.learned_language_id,
+            after_date,
+            limit=max,
+        )
+        if len(recent_days) == max:
+            oldest_day = datetime.datetime.combine(recent_days[-1], datetime.time.min)
+            if oldest_day > after_date:
+                after_date = oldest_day
 
         bookmarks = self.all_bookmarks(after_date, language_id=language_id)
         date_bookmarks_dict = self._to_date_dict(dict_list=bookmarks, date_key="time")
@@ -630,8 +647,6 @@ class User(db.Model):
 
         from zeeguu.core.model import Bookmark, Text
 
-        json_bookmarks = []
-
         query = zeeguu.core.model.db.session.query(Bookmark)
         bookmarks = (
             query.join(Text)
@@ -653,10 +668,7 @@ class User(db.Model):
         if not json:
             return bookmarks
 
-        for each in bookmarks:
-            json_bookmarks.append(each.json_serializable_dict(with_context, with_title))
-
-        return json_bookmarks
+        return Bookmark.json_serializable_dicts(bookmarks, with_context, with_title)
 
     def bookmarks_by_url_by_date(self, n_days=365):
         bookmarks_list, dates = self.bookmarks_by_date()
@@ -676,18 +688,22 @@ class User(db.Model):
         this function is for the activity_graph, generates data
         """
 
+        from zeeguu.core.model.daily_learner_activity import DailyLearnerActivity
+
         # compute bookmark_counts_by_date
         year = datetime.date.today().year - 1
         month = datetime.date.today().month
-        bookmarks_dict, dates = self.bookmarks_by_date(
-            datetime.datetime(year, month, 1)
+        totals = DailyLearnerActivity.totals_by_day(
+            self.id,
+            ["bookmarks_created"],
+            self.learned_language_id,
+            datetime.datetime(year, month, 1),
         )
 
         counts = []
-        for date in dates:
-            the_date = date.strftime("%Y-%m-%d")
-            the_count = len(bookmarks_dict[date])
-            counts.append(dict(date=the_date, count=the_count))
+        for date, count in reversed(totals):
+            if count > 0:
+                counts.append(dict(date=date.strftime("%Y-%m-%d"), count=count))
 
         bookmark_counts_by_date = json.dumps(counts)
         return bookmark_counts_by_date
@@ -843,9 +859,15 @@ class User(db.Model):
     def authorize(cls, email, password):
         try:
             user = cls.find(email)
-            if user.password == password_hash(
-                password, bytes.fromhex(user.password_salt)
+            if verify_password(
+                password, bytes.fromhex(user.password_salt), user.password
             ):
+                if password_needs_rehash(user.password):
+                    # the password is only known at login; that's when
+                    # a hash with an older scheme can be replaced
+                    user.update_password(password)
+                    db.session.add(user)
+                    db.session.commit()
                 return user
         except sqlalchemy.orm.exc.NoResultFound:
             warning(f"Login attempt with wrong email: {email}")
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from datetime import datetime
 import random
 from sqlalchemy import (
@@ -9,7 +10,7 @@ from sqlalchemy import (
     Boolean,
     or_,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import contains_eager, joinedload, relationship, selectinload
 from sqlalchemy.orm.exc import NoResultFound
 
 from zeeguu.core.model import Article, User
@@ -182,7 +183,8 @@ class UserArticle(db.Model):
     @classmethod
     def all_starred_or_liked_articles_of_user(cls, user, limit=30):
         return (
-            cls.query.filter_by(user=user)
+            cls.query.options(joinedload(UserArticle.article))
+            .filter_by(user=user)
             .filter(
                 or_(UserArticle.starred.isnot(None), UserArticle.liked.isnot(False))
             )
@@ -230,11 +232,15 @@ class UserArticle(db.Model):
 
         user_articles = cls.all_starred_or_liked_articles_of_user(user)
 
-        return [
-            cls.user_article_info(user, each.article, with_translations=False)
-            for each in user_articles
-            if each.last_interaction() is not None
-        ]
+        return cls.user_article_infos(
+            user,
+            [
+                each.article
+                for each in user_articles
+                if each.last_interaction() is not None
+            ],
+            with_translations=False,
+        )
 
     @classmethod
     def exists(cls, obj):
@@ -246,21 +252,28 @@ class UserArticle(db.Model):
 
     @classmethod
     def user_article_info(
-        cls, user: User, article: Article, with_content=False, with_translations=True
+        cls,
+        user: User,
+        article: Article,
+        with_content=False,
+        with_translations=True,
+        user_state=None,
     ):
-
-        from zeeguu.core.model import Bookmark
+        """
+        :param user_state: the UserArticlesState of the user for (at least)
+        this article; see user_article_infos. Loaded if not given
+        """
+        if user_state is None:
+            user_state = UserArticlesState(user, [article], with_translations)
 
         # Initialize returned info with the default article info
         returned_info = article.article_info(with_content=with_content)
 
-        user_article_info = UserArticle.find(user, article)
+        user_article_info = user_state.user_articles.get(article.id)
 
-        user_diff_feedback = ArticleDifficultyFeedback.find(user, article)
+        user_diff_feedback = user_state.difficulty_feedback.get(article.id)
 
-        user_topics_feedback = ArticleTopicUserFeedback.find_given_user_article(
-            article, user
-        )
+        user_topics_feedback = user_state.topics_feedback.get(article.id)
 
         if user_topics_feedback:
             article_topic_list = returned_info["topics_list"]
@@ -300,14 +313,128 @@ class UserArticle(db.Model):
                 )
 
             if with_translations:
-                translations = Bookmark.find_all_for_user_and_article(user, article)
+                translations = user_state.translations_in(article)
                 returned_info["translations"] = [
                     each.serializable_dictionary() for each in translations
                 ]
 
-        if PersonalCopy.exists_for(user, article):
+        if article.id in user_state.personal_copies:
             returned_info["has_personal_copy"] = True
         else:
             returned_info["has_personal_copy"] = False
 
         return returned_info
+
+    @classmethod
+    def user_article_infos(
+        cls, user: User, articles, with_content=False, with_translations=True
+    ):
+        """
+        user_article_info for every one of the articles; with what the user
+        did with them, and the articles themselves, loaded for all of them
+        at once, rather than with a few queries for each article
+        """
+        articles = list(articles)
+        if not articles:
+            return []
+
+        _load_what_article_info_needs(articles)
+        user_state = UserArticlesState(user, articles, with_translations)
+
+        return [
+            cls.user_article_info(
+                user, each, with_content, with_translations, user_state
+            )
+            for each in articles
+        ]
+
+
+class UserArticlesState(object):
+    """
+    What a user did with a list of articles: opened, starred, liked them,
+    gave feedback on their difficulty or their topics, made personal copies
+    of them, and translated words in them; loaded with one query per table,
+    for all the articles at once
+    """
+
+    def __init__(self, user: User, articles, with_translations=True):
+        from zeeguu.core.model import Bookmark, Text
+
+        self.user = user
+        article_ids = set(each.id for each in articles)
+
+        self.user_articles = {
+            each.article_id: each
+            for each in UserArticle.query.filter(UserArticle.user_id == user.id)
+            .filter(UserArticle.article_id.in_(article_ids))
+            .all()
+        }
+
+        # the latest feedback for every article
+        self.difficulty_feedback = {}
+        for each in (
+            ArticleDifficultyFeedback.query.filter(
+                ArticleDifficultyFeedback.user_id == user.id
+            )
+            .filter(ArticleDifficultyFeedback.article_id.in_(article_ids))
+            .order_by(ArticleDifficultyFeedback.date)
+        ):
+            self.difficulty_feedback[each.article_id] = each
+
+        self.topics_feedback = defaultdict(list)
+        for each in (
+            ArticleTopicUserFeedback.query.options(
+                joinedload(ArticleTopicUserFeedback.topic)
+            )
+            .filter(ArticleTopicUserFeedback.user_id == user.id)
+            .filter(ArticleTopicUserFeedback.article_id.in_(article_ids))
+        ):
+            self.topics_feedback[each.article_id].append(each)
+
+        self.personal_copies = set(
+            article_id
+            for (article_id,) in db.session.query(PersonalCopy.article_id)
+            .filter(PersonalCopy.user_id == user.id)
+            .filter(PersonalCopy.article_id.in_(article_ids))
+        )
+
+        # the translations are only needed for the articles the user opened
+        self._translations = None
+        translated_article_ids = article_ids & self.user_articles.keys()
+        if with_translations:
+            self._translations = defaultdict(list)
+            if translated_article_ids:
+                for each in (
+                    Bookmark.query.join(Text)
+                    .options(
+                        joinedload(Bookmark.origin),
+                        joinedload(Bookmark.translation),
+                        contains_eager(Bookmark.text),
+                    )
+                    .filter(Text.article_id.in_(translated_article_ids))
+                    .filter(Bookmark.user_id == user.id)
+                    .order_by(Bookmark.id)
+                ):
+                    self._translations[each.text.article_id].append(each)
+
+    def translations_in(self, article):
+        from zeeguu.core.model import Bookmark
+
+        if self._translations is None:
+            return Bookmark.find_all_for_user_and_article(self.user, article)
+        return self._translations[article.id]
+
+
+def _load_what_article_info_needs(articles):
+    # the articles are already in the session; querying them again
+    # with these options loads the relationships that they did not load yet
+    from zeeguu.core.model import ArticleTopicMap, Feed, Url
+
+    Article.query.options(
+        selectinload(Article.topics).joinedload(ArticleTopicMap.topic),
+        joinedload(Article.url).joinedload(Url.domain),
+        joinedload(Article.img_url).joinedload(Url.domain),
+        joinedload(Article.feed).joinedload(Feed.image_url).joinedload(Url.domain),
+        joinedload(Article.uploader),
+        joinedload(Article.language),
+    ).filter(Article.id.in_(set(each.id for each in articles))).all()
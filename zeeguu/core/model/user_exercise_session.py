@@ -2,6 +2,7 @@ import sqlalchemy
 import zeeguu.core
 
 from datetime import datetime, timedelta
+from zeeguu.core.model.language import Language
 from zeeguu.core.model.user import User
 
 from zeeguu.core.model import db
@@ -31,6 +32,12 @@ class UserExerciseSession(db.Model):
 
     is_active = db.Column(db.Boolean)
 
+    # the language of the words practiced in the session; set when the first
+    # exercise is recorded, such that the statistics for a language do
+    # not have to look at the exercises of a session to find its language
+    language_id = db.Column(db.Integer, db.ForeignKey(Language.id))
+    language = db.relationship(Language)
+
     def __init__(self, user_id, start_time, current_time=None):
         self.user_id = user_id
         self.is_active = False
@@ -80,6 +87,17 @@ class UserExerciseSession(db.Model):
         sessions = query.all()
         return sessions
 
+    @classmethod
+    def tag_with_language(cls, db_session, session_id, language_id):
+        """
+        Sets the language of the session, unless it already has one
+        """
+        db_session.execute(
+            sqlalchemy.update(cls)
+            .where(cls.id == session_id, cls.language_id == None)
+            .values(language_id=language_id)
+        )
+
     @classmethod
     def find_by_id(cls, id):
         query = cls.query
@@ -1,10 +1,10 @@
 import sqlalchemy.orm
 from sqlalchemy.orm.exc import NoResultFound
-from wordstats import Word
 
 import zeeguu.core
 
 from zeeguu.core.model.language import Language
+from zeeguu.core.word_stats import word_stats
 
 from zeeguu.core.model import db
 
@@ -32,9 +32,8 @@ class UserWord(db.Model):
         self.word = word
         self.language = language
 
-        # TODO: Performance
         try:
-            self.rank = Word.stats(self.word, self.language.code).rank
+            self.rank = word_stats(self.word, self.language.code).rank
         except FileNotFoundError:
             self.rank = None
         except Exception:
@@ -56,7 +55,7 @@ class UserWord(db.Model):
 
         :return: number between 0 and 10 as returned by the wordstats module
         """
-        stats = Word.stats(self.word, self.language.code)
+        stats = word_stats(self.word, self.language.code)
         return int(stats.importance)
 
     # we use this in the bookmarks.html to show the importance of a word
@@ -71,10 +70,17 @@ class UserWord(db.Model):
         )
 
     @classmethod
-    def find_or_create(cls, session, _word: str, language: Language):
+    def find_or_create(cls, session, _word: str, language: Language, commit=True):
+        """
+        :param commit: if False, a new word is only flushed (in a savepoint)
+        such that it can be created in the same transaction as the
+        bookmark that uses it; the caller is responsible for committing
+        """
         try:
             return cls.find(_word, language)
         except sqlalchemy.orm.exc.NoResultFound:
+            if not commit:
+                return cls._create_in_savepoint(session, _word, language)
             try:
                 new = cls(_word, language)
                 session.add(new)
@@ -94,6 +100,25 @@ class UserWord(db.Model):
                         continue
                     break
 
+    @classmethod
+    def _create_in_savepoint(cls, session, _word: str, language: Language):
+        try:
+            with session.begin_nested():
+                new = cls(_word, language)
+                session.add(new)
+            return new
+        except sqlalchemy.exc.IntegrityError:
+            # another request created the word in the meantime; only
+            # the savepoint was rolled back, not the ongoing transaction.
+            # The read must be a locking one: under REPEATABLE READ a plain
+            # one still sees the snapshot from before the word was created
+            return (
+                cls.query.filter(cls.word == _word)
+                .filter(cls.language == language)
+                .with_for_update(read=True)
+                .one()
+            )
+
     @classmethod
     def find_all(cls):
         return cls.query.all()
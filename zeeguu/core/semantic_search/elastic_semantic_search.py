@@ -13,6 +13,7 @@ from zeeguu.core.elastic.elastic_query_builder import (
 )
 from zeeguu.core.util.timer_logging_decorator import time_this
 from zeeguu.core.elastic.settings import ES_CONN_STRING, ES_ZINDEX
+from zeeguu.core.instrumentation import external_call
 from zeeguu.core.semantic_vector_api import (
     get_embedding_from_article,
     get_embedding_from_text,
@@ -32,7 +33,8 @@ def article_semantic_search_for_user(
 def articles_like_this_tfidf(article: Article):
     query_body = more_like_this_query(10, article.content, article.language)
     es = Elasticsearch(ES_CONN_STRING)
-    res = es.search(index=ES_ZINDEX, body=query_body)
+    with external_call("es"):
+        res = es.search(index=ES_ZINDEX, body=query_body)
     final_article_mix = []
     hit_list = res["hits"].get("hits")
     final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
@@ -49,7 +51,8 @@ def articles_like_this_semantic(article: Article):
 
     try:
         es = Elasticsearch(ES_CONN_STRING)
-        res = es.search(index=ES_ZINDEX, body=query_body)
+        with external_call("es"):
+            res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
         final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
@@ -75,7 +78,8 @@ def add_topics_based_on_semantic_hood_search(
 
     try:
         es = Elasticsearch(ES_CONN_STRING)
-        res = es.search(index=ES_ZINDEX, body=query_body)
+        with external_call("es"):
+            res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
         final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
@@ -99,7 +103,8 @@ def find_articles_based_on_text(text, k: int = 9):  # hood = (slang) neighborhoo
 
     try:
         es = Elasticsearch(ES_CONN_STRING)
-        res = es.search(index=ES_ZINDEX, body=query_body)
+        with external_call("es"):
+            res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
         final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
@@ -1,4 +1,5 @@
 from zeeguu.core.model import Bookmark
+from zeeguu.core.model.sorted_exercise_log import SortedExerciseLog
 from zeeguu.core.sql.query_building import list_of_dicts_from_query
 
 
@@ -81,13 +82,14 @@ def learned_words(user_id, language_id, from_date: str, to_date: str):
         },
     )
 
+    bookmarks = Bookmark.query.filter(
+        Bookmark.id.in_([each["bookmark_id"] for each in results])
+    ).all()
+    exercise_logs = SortedExerciseLog.for_bookmarks(bookmarks)
+
     for each in results:
-        bookmark = Bookmark.find(each["bookmark_id"])
-        each["self_reported"] = (
-            bookmark.sorted_exercise_log().last_exercise().is_too_easy()
-        )
-        each["most_recent_correct_dates"] = (
-            bookmark.sorted_exercise_log().str_most_recent_correct_dates()
-        )
+        exercise_log = exercise_logs[each["bookmark_id"]]
+        each["self_reported"] = exercise_log.last_exercise().is_too_easy()
+        each["most_recent_correct_dates"] = exercise_log.str_most_recent_correct_dates()
 
     return results
@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import sqlalchemy
+
 from zeeguu.core.test.model_test_mixin import ModelTestMixIn
 
 import zeeguu.core
@@ -8,6 +10,7 @@ from zeeguu.core.test.rules.article_rule import ArticleRule
 from zeeguu.core.test.rules.language_rule import LanguageRule
 from zeeguu.core.test.rules.topic_rule import TopicRule
 from zeeguu.core.model import Article, Topic
+from zeeguu.core.model.article import MAX_CHAR_COUNT_IN_SUMMARY
 from zeeguu.core.test.mocking_the_web import (
     URL_CNN_KATHMANDU,
     URL_SPIEGEL_VENEZUELA,
@@ -29,6 +32,22 @@ class ArticleTest(ModelTestMixIn, TestCase):
     def test_article_representation_does_not_error(self):
         assert self.article1.article_info()
 
+    def test_article_info_does_not_load_the_content(self):
+        article_id = self.article1.id
+        session.commit()
+        session.expire_all()
+
+        article = Article.find_by_id(article_id)
+        info = article.article_info()
+        assert "content" not in sqlalchemy.inspect(article).dict
+        assert "htmlContent" not in sqlalchemy.inspect(article).dict
+
+        assert info["summary"] == article.content[:MAX_CHAR_COUNT_IN_SUMMARY]
+
+    def test_content_preview_follows_the_content(self):
+        self.article1.content = "Ein ganz neuer Text."
+        assert self.article1.article_info()["summary"] == "Ein ganz neuer Text."
+
     def test_add_topic(self):
         sports = TopicRule.get_or_create_topic(1)
         health_society = TopicRule.get_or_create_topic(5)
@@ -0,0 +1,53 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from zeeguu.core.content_quality.article_analysis import ArticleAnalysis
+
+GERMAN = (
+    "Der Hund läuft jeden Morgen schnell über die Straße zum Park, "
+    "wo er mit den anderen Hunden spielt, bis es Zeit für das Frühstück ist. "
+)
+
+
+class ParsedArticle:
+    def __init__(self, text):
+        self.text = text
+
+
+class ArticleAnalysisTest(TestCase):
+    def test_language_is_detected_once(self):
+        analysis = ArticleAnalysis(GERMAN)
+        with patch(
+            "zeeguu.core.content_quality.article_analysis.detect", return_value="de"
+        ) as detect:
+            assert analysis.language_code == "de"
+            assert analysis.language_code == "de"
+            assert analysis.with_text(GERMAN.upper()).language_code == "de"
+
+        assert detect.call_count == 1
+
+    def test_word_count(self):
+        assert ArticleAnalysis("eins zwei\n drei ").word_count == 3
+
+    def test_analysis_of_parsed_article_is_reused_while_text_is_the_same(self):
+        article = ParsedArticle(GERMAN)
+        article.analysis = ArticleAnalysis(article.text)
+        assert ArticleAnalysis.of(article) is article.analysis
+
+        article.text = article.text + "Ende."
+        assert ArticleAnalysis.of(article) is not article.analysis
+        assert ArticleAnalysis.of(article).text == article.text
+
+    def test_sample_is_bounded(self):
+        text = GERMAN * 100
+        analysis = ArticleAnalysis(text, sample_size=600)
+
+        sample = analysis.sample()
+        assert len(sample) < 700
+        for each in sample.split():
+            assert each in text.split()
+
+        assert analysis.language_code == "de"
+
+    def test_short_text_is_its_own_sample(self):
+        assert ArticleAnalysis(GERMAN, sample_size=1000).sample() == GERMAN
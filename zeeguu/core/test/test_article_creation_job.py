@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from zeeguu.core.model import db
+from zeeguu.core.model.article_creation_job import ArticleCreationJob
+from zeeguu.core.test.model_test_mixin import ModelTestMixIn
+from zeeguu.core.test.rules.user_rule import UserRule
+
+URL = "https://www.example.com/article"
+
+
+class ArticleCreationJobTest(ModelTestMixIn):
+    def setUp(self):
+        super().setUp()
+        self.user = UserRule().user
+
+    def _find_or_create(self):
+        return ArticleCreationJob.find_or_create(
+            db.session, URL, "<p>Text</p>", "Title", "", self.user
+        )
+
+    def test_unfinished_job_is_reused(self):
+        job = self._find_or_create()
+        job.status = ArticleCreationJob.RUNNING
+        db.session.commit()
+
+        assert self._find_or_create() is job
+
+    def test_stale_job_is_not_reused(self):
+        # e.g. the worker that was running it died
+        job = self._find_or_create()
+        job.status = ArticleCreationJob.RUNNING
+        job.created_at = datetime.now() - ArticleCreationJob.STALE_AFTER
+        db.session.commit()
+
+        new = self._find_or_create()
+
+        assert new.id != job.id
+        assert new.status == ArticleCreationJob.PENDING
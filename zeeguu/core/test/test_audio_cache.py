@@ -0,0 +1,52 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from zeeguu.core.text_to_speech import AudioCache, FakeSynthesizer
+
+
+class AudioCacheTest(TestCase):
+    def setUp(self):
+        self.data_folder = tempfile.mkdtemp()
+        self.synthesizer = FakeSynthesizer()
+        self.cache = AudioCache(self.data_folder, self.synthesizer)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_folder)
+
+    def test_text_is_synthesized_only_once(self):
+        path = self.cache.path_for("das Haus", "de")
+
+        assert path.startswith("/speech/cache/de/")
+        assert os.path.isfile(self.data_folder + path)
+        assert self.cache.path_for("  das   Haus ", "de") == path
+        assert self.synthesizer.synthesized == [("das Haus", "de")]
+
+    def test_different_languages_have_different_files(self):
+        assert self.cache.path_for("pain", "fr") != self.cache.path_for("pain", "en")
+
+    def test_cached_path_does_not_synthesize(self):
+        assert self.cache.cached_path("hus", "da") is None
+        assert self.synthesizer.synthesized == []
+
+    def test_least_recently_used_files_are_evicted(self):
+        first = self.cache.path_for("første", "da")
+        size = os.path.getsize(self.data_folder + first)
+        self.cache.max_bytes = size * 2
+
+        second = self.cache.path_for("anden", "da")
+        third = self.cache.path_for("tredje", "da")
+
+        assert not os.path.isfile(self.data_folder + first)
+        assert os.path.isfile(self.data_folder + third)
+        assert self.cache.cached_path("første", "da") is None
+
+        self.cache.max_bytes = 10 * size
+        assert self.cache.rebuild_manifest() == len(
+            [p for p in [first, second, third] if os.path.isfile(self.data_folder + p)]
+        )
+
+    def test_language_id_can_not_escape_the_cache_folder(self):
+        with self.assertRaises(ValueError):
+            self.cache.path_for("hello", "../../etc")
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import zeeguu.core
+
+from zeeguu.core.background_jobs import (
+    enqueue,
+    retry_delay,
+    run_due_jobs,
+    task,
+)
+from zeeguu.core.model import db, BackgroundJob, UniqueCode
+from zeeguu.core.test.model_test_mixin import ModelTestMixIn
+
+db_session = db.session
+
+calls = []
+
+
+@task(max_attempts=3)
+def _remember(value, failures=0):
+    calls.append(value)
+    if len([each for each in calls if each == value]) <= failures:
+        raise ValueError("failing on purpose")
+
+
+class BackgroundJobsTest(ModelTestMixIn):
+    def setUp(self):
+        super().setUp()
+        calls.clear()
+
+    def test_job_runs_with_its_arguments(self):
+        # in testing the jobs are run right away
+        job = enqueue(db_session, _remember, value="a")
+
+        assert calls == ["a"]
+        assert job.status == BackgroundJob.DONE
+        assert job.attempts == 1
+
+    def test_same_idempotency_key_is_run_once(self):
+        first = enqueue(db_session, _remember, idempotency_key="x", value="b")
+        second = enqueue(db_session, _remember, idempotency_key="x", value="b")
+
+        assert first.id == second.id
+        assert calls == ["b"]
+
+    def test_failed_job_is_retried_with_backoff(self):
+        job = self._enqueue_for_the_worker(_remember, value="c", failures=1)
+        assert run_due_jobs(db_session) == 1
+        assert job.status == BackgroundJob.PENDING
+        assert "failing on purpose" in job.last_error
+        assert job.run_after > datetime.now() + retry_delay(1) - timedelta(seconds=5)
+
+        # not due yet
+        assert run_due_jobs(db_session) == 0
+
+        self._make_due(job)
+        assert run_due_jobs(db_session) == 1
+        assert job.status == BackgroundJob.DONE
+        assert job.attempts == 2
+        assert calls == ["c", "c"]
+
+    def test_job_fails_after_its_last_attempt(self):
+        job = self._enqueue_for_the_worker(_remember, value="d", failures=5)
+        for _ in range(3):
+            self._make_due(job)
+            run_due_jobs(db_session)
+
+        assert job.status == BackgroundJob.FAILED
+        assert len(calls) == 3
+        assert run_due_jobs(db_session) == 0
+
+    def test_failed_job_is_not_retried_without_a_worker(self):
+        job = enqueue(db_session, _remember, value="h", failures=1)
+
+        assert job.status == BackgroundJob.FAILED
+        assert job.attempts == 1
+        assert "failing on purpose" in job.last_error
+
+        db_session.commit()
+        assert run_due_jobs(db_session) == 0
+        assert calls == ["h"]
+
+    def test_job_is_saved_with_the_commit_of_the_caller(self):
+        # e.g. the code of a password reset, and the email that sends it
+        with patch.dict(zeeguu.core.app.config, BACKGROUND_JOBS_WORKER=True):
+            db_session.add(UniqueCode("learner@zeeguu.org"))
+            enqueue(db_session, _remember, value="e")
+            db_session.rollback()
+
+        assert BackgroundJob.query.count() == 0
+        assert UniqueCode.query.count() == 0
+
+    def test_job_is_left_to_the_worker_when_there_is_one(self):
+        with patch.dict(zeeguu.core.app.config, BACKGROUND_JOBS_WORKER=True):
+            job = enqueue(db_session, _remember, value="f")
+            db_session.commit()
+
+        assert calls == []
+        assert job.status == BackgroundJob.PENDING
+
+        assert run_due_jobs(db_session) == 1
+        assert job.status == BackgroundJob.DONE
+        assert calls == ["f"]
+
+    def test_stuck_job_is_released_until_it_has_no_attempts_left(self):
+        with patch.dict(zeeguu.core.app.config, BACKGROUND_JOBS_WORKER=True):
+            job = enqueue(db_session, _remember, value="g")
+            db_session.commit()
+
+        for attempt in range(1, 4):
+            # as if the worker died while running it
+            BackgroundJob.claim(db_session, job.id)
+            BackgroundJob.release_stuck(
+                db_session, datetime.now() + timedelta(seconds=1)
+            )
+            db_session.refresh(job)
+            assert job.attempts == attempt
+
+        assert job.status == BackgroundJob.FAILED
+        assert calls == []
+
+    def test_retry_delay_grows_up_to_a_limit(self):
+        assert retry_delay(1) < retry_delay(2) < retry_delay(3)
+        assert retry_delay(100) == retry_delay(101)
+
+    def _enqueue_for_the_worker(self, task_function, **arguments):
+        with patch.dict(zeeguu.core.app.config, BACKGROUND_JOBS_WORKER=True):
+            job = enqueue(db_session, task_function, **arguments)
+            db_session.commit()
+        return job
+
+    def _make_due(self, job):
+        job.run_after = datetime.now() - timedelta(seconds=1)
+        db_session.commit()
@@ -1,6 +1,8 @@
 import random
 
 from zeeguu.core.bookmark_quality import top_bookmarks, bad_quality_bookmark
+from zeeguu.core.bookmark_quality.bulk_fit_for_study import update_fit_for_study
+from zeeguu.core.bookmark_quality.fit_for_study import fit_for_study
 from zeeguu.core.definition_of_learned import is_learned_based_on_exercise_outcomes
 from zeeguu.core.model.sorted_exercise_log import SortedExerciseLog
 from zeeguu.core.test.model_test_mixin import ModelTestMixIn
@@ -86,6 +88,22 @@ class BookmarkTest(ModelTestMixIn):
         assert latest_exercise.outcome == random_exercise.outcome
         assert latest_exercise.solving_speed == random_exercise.solving_speed
 
+    def test_exercise_outcome_sets_the_language_of_the_session(self):
+        random_bookmark = BookmarkRule(self.user).bookmark
+        exercise_session = ExerciseSessionRule(self.user).exerciseSession
+        assert exercise_session.language_id is None
+
+        random_exercise = ExerciseRule(exercise_session).exercise
+        random_bookmark.add_new_exercise_result(
+            random_exercise.source,
+            random_exercise.outcome,
+            random_exercise.solving_speed,
+            exercise_session.id,
+        )
+        db.session.commit()
+
+        assert exercise_session.language_id == random_bookmark.origin.language_id
+
     def test_user_bookmark_count(self):
         assert len(self.user.all_bookmarks()) > 0
 
@@ -116,6 +134,26 @@ class BookmarkTest(ModelTestMixIn):
         for b in random_bookmarks:
             assert b.fit_for_study
 
+    def test_update_fit_for_study_in_bulk(self):
+        random_bookmarks = [BookmarkRule(self.user).bookmark for _ in range(0, 3)]
+        random_bookmarks[0].origin = random_bookmarks[0].translation
+        db.session.commit()
+
+        all_bookmarks = Bookmark.query.filter_by(user_id=self.user.id).all()
+        expected = {b.id: bool(fit_for_study(b)) for b in all_bookmarks}
+        for b in all_bookmarks:
+            b.fit_for_study = not expected[b.id]
+        db.session.commit()
+
+        changed_count = update_fit_for_study(
+            db.session, Bookmark.query.filter_by(user_id=self.user.id), batch_size=4
+        )
+
+        assert changed_count == len(all_bookmarks)
+        assert not expected[random_bookmarks[0].id]
+        for b in all_bookmarks:
+            assert b.fit_for_study == expected[b.id]
+
     def test_add_new_exercise_result(self):
         random_bookmark = BookmarkRule(self.user).bookmark
         exercise_count_before = len(random_bookmark.exercise_log)
@@ -133,6 +171,27 @@ class BookmarkTest(ModelTestMixIn):
 
         assert exercise_count_after > exercise_count_before
 
+    def test_exercise_logs_for_bookmarks(self):
+        bookmarks = self.user.all_bookmarks()
+        for bookmark in bookmarks[:2]:
+            for _ in range(random.randint(1, 3)):
+                self._helper_create_exercise(bookmark)
+
+        logs = SortedExerciseLog.for_bookmarks(bookmarks)
+
+        assert set(logs.keys()) == set(each.id for each in bookmarks)
+        for bookmark in bookmarks:
+            expected = bookmark.sorted_exercise_log()
+            assert logs[bookmark.id].exercises == expected.exercises
+            assert (
+                logs[bookmark.id].learning_cycle_length
+                == expected.learning_cycle_length
+            )
+            assert (
+                logs[bookmark.id].str_most_recent_correct_dates()
+                == expected.str_most_recent_correct_dates()
+            )
+
     def test_find_by_specific_user(self):
         list_should_be = self.user.all_bookmarks()
         list_to_check = Bookmark.find_by_specific_user(self.user)
@@ -6,6 +6,22 @@ import zeeguu.core
 from zeeguu.core.test.rules.cohort_rule import CohortRule
 from zeeguu.core.model.teacher import Teacher
 from zeeguu.core.model.teacher_cohort_map import TeacherCohortMap
+from zeeguu.core.model.user_reading_session import UserReadingSession
+from zeeguu.core.test.rules.article_rule import ArticleRule
+from zeeguu.core.test.rules.bookmark_rule import BookmarkRule
+from zeeguu.core.test.rules.exercise_rule import ExerciseRule
+from zeeguu.core.test.rules.exercise_session_rule import ExerciseSessionRule
+from zeeguu.core.user_statistics.cohort_statistics import cohort_activity_overview
+from zeeguu.core.user_statistics.exercise_corectness import (
+    exercise_count_and_correctness_percentage,
+    number_of_distinct_words_in_exercises,
+    number_of_words_translated_but_not_studied,
+    number_of_learned_words,
+)
+from zeeguu.core.user_statistics.exercise_sessions import (
+    total_time_in_exercise_sessions,
+)
+from datetime import datetime, timedelta
 
 db_session = zeeguu.core.model.db.session
 
@@ -47,3 +63,56 @@ class CohortTest(ModelTestMixIn, TestCase):
         # still_has_capacity allows an overflow of 10 so there
         # still will be capacity
         self.assertTrue(self.cohort.cohort_still_has_capacity())
+
+    def test_cohort_activity_overview_is_same_as_per_student(self):
+        students = self.cohort.get_students()
+        for i, student in enumerate(students):
+            student.learned_language = self.cohort.language
+            bookmarks = [BookmarkRule(student).bookmark for _ in range(3 + i)]
+            exercise_session = ExerciseSessionRule(student).exerciseSession
+            exercise_session.duration = 60000 * (i + 1)
+            exercise_session.language = self.cohort.language
+            for bookmark in bookmarks[1:]:
+                exercise = ExerciseRule(
+                    exercise_session, date=datetime.now() - timedelta(hours=1)
+                ).exercise
+                bookmark.add_new_exercise(exercise)
+            bookmarks[0].learned_time = datetime.now() - timedelta(hours=1)
+
+            article = ArticleRule().article
+            article.language = self.cohort.language
+            reading_session = UserReadingSession(
+                student.id, article.id, datetime.now() - timedelta(hours=2)
+            )
+            reading_session.duration = 120000
+            db_session.add_all([student, article, reading_session, exercise_session])
+        db_session.commit()
+
+        start = datetime.now() - timedelta(days=7)
+        end = datetime.now() + timedelta(days=1)
+        overview = cohort_activity_overview(
+            [s.id for s in students], self.cohort.id, start, end
+        )
+
+        for student in students:
+            article = (
+                UserReadingSession.query.filter_by(user_id=student.id).one().article
+            )
+            # summarize_reading_activity itself does not run on sqlite
+            expected = {
+                "number_of_texts": 1,
+                "reading_time": 120,
+                "average_text_length": article.word_count,
+                "average_text_difficulty": int(article.fk_difficulty),
+            }
+            for each in [
+                total_time_in_exercise_sessions,
+                exercise_count_and_correctness_percentage,
+                number_of_distinct_words_in_exercises,
+                number_of_words_translated_but_not_studied,
+                number_of_learned_words,
+            ]:
+                expected.update(each(student.id, self.cohort.id, start, end))
+            self.assertEqual(overview[student.id], expected)
+            self.assertGreater(overview[student.id]["number_of_exercises"], 0)
+            self.assertGreater(overview[student.id]["exercise_time"], 0)
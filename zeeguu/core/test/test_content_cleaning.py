@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from zeeguu.core.content_cleaning.content_cleaner import (
+    JUNK_PREFIXES,
+    cleanup_non_content_bits,
+    cleanup_non_content_bits_w_crawl_report,
+)
+from zeeguu.core.content_quality.quality_filter import sufficient_quality_html
+from zeeguu.core.model import LowQualityTypes
+from zeeguu.core.util.pattern_matcher import PatternMatcher
+
+TEXT = (
+    "Der Hund läuft schnell über die Straße.\n"
+    "Artiklen fortsætter efter annoncen\n"
+    "Die Katze schläft den ganzen Tag.\n"
+    f"{JUNK_PREFIXES[0]} Og mere.\n"
+)
+
+
+class SentRemovedReport:
+    def __init__(self):
+        self.sents_removed = []
+
+    def add_sent_removed(self, feed, sent_removed, url=None):
+        self.sents_removed.append(sent_removed)
+
+
+class ContentCleaningTest(TestCase):
+    def test_pattern_matcher(self):
+        matcher = PatternMatcher(["abc", "x", "abc"])
+
+        assert matcher.matches("xyz abc") == {"abc", "x"}
+        assert matcher.first_match("x abc") == "abc"
+        assert matcher.first_match("abc", start=1) is None
+        assert matcher.remove("1abc2x3") == ("123", ["abc", "x"])
+
+    def test_junk_is_removed_and_reported(self):
+        report = SentRemovedReport()
+        cleaned = cleanup_non_content_bits_w_crawl_report(TEXT, report, None, None)
+
+        assert "Artiklen" not in cleaned
+        assert JUNK_PREFIXES[0] not in cleaned
+        assert "Die Katze" in cleaned
+        assert "Artiklen fortsætter efter annoncen" in report.sents_removed
+        assert JUNK_PREFIXES[0] in report.sents_removed
+        assert cleanup_non_content_bits(TEXT) == cleaned
+
+    def test_read_more_pattern_in_html(self):
+        html = "<p>Text</p><div>Jetzt Gratismonat beginnen</div>"
+
+        quality, reason, code = sufficient_quality_html(html)
+        assert not quality
+        assert "Jetzt Gratismonat beginnen" in reason
+        assert code == LowQualityTypes.HTML_PATTERN
+        assert sufficient_quality_html("<p>Text</p>")[0]
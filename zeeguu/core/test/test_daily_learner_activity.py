@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+from zeeguu.core.model import (
+    Bookmark,
+    DailyLearnerActivity,
+    UserExerciseSession,
+    UserReadingSession,
+)
+from zeeguu.core.model import db
+from zeeguu.core.test.model_test_mixin import ModelTestMixIn
+from zeeguu.core.test.rules.article_rule import ArticleRule
+from zeeguu.core.test.rules.outcome_rule import OutcomeRule
+from zeeguu.core.test.rules.source_rule import SourceRule
+from zeeguu.core.test.rules.user_rule import UserRule
+from zeeguu.core.user_statistics.activity import activity_duration_by_day
+
+db_session = db.session
+
+
+class DailyLearnerActivityTest(ModelTestMixIn):
+    def setUp(self):
+        super().setUp()
+        self.user = UserRule().user
+        self.language = self.user.learned_language
+
+    def test_record_adds_up_within_a_day(self):
+        now = datetime.now()
+        for time in [now, now, now - timedelta(days=1)]:
+            DailyLearnerActivity.record(
+                db_session, self.user.id, self.language.id, time, exercises_done=1
+            )
+        db_session.commit()
+
+        totals = DailyLearnerActivity.totals_by_day(self.user.id, ["exercises_done"])
+        assert totals == [((now - timedelta(days=1)).date(), 1), (now.date(), 2)]
+
+    def test_recorded_activity_is_same_as_rebuilt(self):
+        article = ArticleRule().article
+        article.language = self.language
+        db_session.add(article)
+        db_session.commit()
+
+        exercise_session = UserExerciseSession(self.user.id, datetime.now())
+        db_session.add(exercise_session)
+        db_session.commit()
+
+        for word in ["Haus", "Baum", "Katze"]:
+            bookmark = Bookmark.find_or_create(
+                db_session,
+                self.user,
+                word,
+                self.language.code,
+                "translation",
+                "en",
+                f"Das ist ein {word}.",
+                article.id,
+            )
+            db_session.commit()
+            bookmark.add_new_exercise_result(
+                SourceRule().random, OutcomeRule().correct, 1000, exercise_session.id
+            )
+        db_session.commit()
+
+        self._update_duration(exercise_session, 30000)
+        reading_session = UserReadingSession(self.user.id, article.id)
+        db_session.add(reading_session)
+        db_session.commit()
+        self._update_duration(reading_session, 20000)
+        self._update_duration(reading_session, 50000)
+
+        recorded = self._all_totals()
+        DailyLearnerActivity.rebuild(db_session, self.user.id)
+
+        assert recorded == [(datetime.now().date(), 50000, 30000, 3, 3, 0)]
+        assert self._all_totals() == recorded
+        assert activity_duration_by_day(self.user) == {
+            "reading": [{"date": datetime.now().strftime("%Y-%m-%d"), "seconds": 50}],
+            "exercises": [{"date": datetime.now().strftime("%Y-%m-%d"), "seconds": 30}],
+        }
+
+    def _update_duration(self, session, duration):
+        previous_duration = session.duration
+        session.duration = duration
+        DailyLearnerActivity.record_session_duration(
+            db_session, session, previous_duration
+        )
+        db_session.commit()
+
+    def _all_totals(self):
+        return DailyLearnerActivity.totals_by_day(
+            self.user.id, DailyLearnerActivity.COUNTERS
+        )
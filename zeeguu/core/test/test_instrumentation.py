@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+from zeeguu.core.instrumentation import (
+    Histogram,
+    start_request,
+    finish_request,
+    current_request_metrics,
+    external_call,
+    metrics_report,
+    reset_metrics,
+)
+from zeeguu.core.instrumentation.request_metrics import N_PLUS_ONE_THRESHOLD
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        reset_metrics()
+
+    def test_histogram_percentiles(self):
+        h = Histogram()
+        for i in range(1, 101):
+            h.add(i)
+
+        assert h.count == 100
+        assert h.percentile(50) == 50
+        assert h.percentile(95) == 100
+        assert h.max == 100
+
+    def test_empty_histogram(self):
+        assert Histogram().as_dictionary()["p50"] is None
+
+    def test_metrics_are_aggregated_per_route(self):
+        for _ in range(3):
+            start_request("GET /bookmarks_in_pipeline")
+            with external_call("es"):
+                pass
+            finish_request(2048)
+
+        route_stats = metrics_report()["GET /bookmarks_in_pipeline"]
+        assert route_stats["wall_ms"]["count"] == 3
+        assert route_stats["es_ms"]["count"] == 3
+        assert route_stats["response_kb"]["max"] == 2
+
+    def test_repeated_statement_is_flagged(self):
+        start_request("GET /top_bookmarks_to_study")
+        metrics = current_request_metrics()
+        metrics.statements["SELECT * FROM bookmark WHERE id = ?"] = N_PLUS_ONE_THRESHOLD
+        metrics.statements["SELECT * FROM user WHERE id = ?"] = 1
+        finish_request()
+
+        n_plus_one = metrics_report()["GET /top_bookmarks_to_study"]["n_plus_one"]
+        assert len(n_plus_one) == 1
+        assert n_plus_one[0]["statement"] == "SELECT * FROM bookmark WHERE id = ?"
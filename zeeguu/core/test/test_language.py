@@ -1,4 +1,5 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 import zeeguu.core
 from sqlalchemy.orm.exc import NoResultFound
@@ -57,3 +58,32 @@ class LanguageTest(ModelTestMixIn, TestCase):
 
         self.user.set_native_language(language_should_be.code)
         assert self.user.native_language.id == language_should_be.id
+
+    def test_cached_language_survives_commit(self):
+        language_should_be = LanguageRule().random
+        code, _id = language_should_be.code, language_should_be.id
+        Language.find(code)
+
+        # after a commit all the session objects are expired;
+        # the cached language should still be usable
+        db_session.commit()
+        db_session.close()
+
+        language_to_check = Language.find_by_id(_id)
+        assert language_to_check.code == code
+
+    def test_a_missing_language_does_not_reload_all_languages(self):
+        Language.find(LanguageRule().random.code)
+
+        with patch.object(Language.cache, "_reload") as reload:
+            with self.assertRaises(NoResultFound):
+                Language.find("xx")
+            with self.assertRaises(NoResultFound):
+                Language.find("xx")
+
+            # one added meanwhile is found by itself
+            db_session.add(Language("xy", "Xylophonese"))
+            db_session.commit()
+            assert Language.find("xy").name == "Xylophonese"
+
+        assert reload.call_count == 0
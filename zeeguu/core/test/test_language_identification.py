@@ -0,0 +1,68 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from zeeguu.core.content_quality.language_identification import (
+    LanguageIdentifier,
+    html_text,
+)
+from zeeguu.core.test.mocking_the_web import TESTDATA_FOLDER
+
+
+def saved_page(file_name):
+    with open(os.path.join(TESTDATA_FOLDER, file_name), encoding="utf-8") as f:
+        return f.read()
+
+
+class LanguageIdentificationTest(TestCase):
+    def test_language_of_saved_pages(self):
+        identifier = LanguageIdentifier()
+
+        assert identifier.language_of_html(saved_page("der_kleine_prinz.html")) == "de"
+        assert identifier.language_of_html(saved_page("lemonde_formation.html")) == "fr"
+        # mostly scripts and styles; langdetect on all of it said "en"
+        assert (
+            identifier.language_of_html(saved_page("jp_article_example.html")) == "da"
+        )
+
+    def test_html_text_is_only_the_text_that_is_read(self):
+        page = """<html><head><title>Titel</title><style>p { color: red; }</style></head>
+            <body><script>var x = "<p>no</p>";</script><!-- kommentar -->
+            <p>Der Hund &amp; die   Katze</p>\n<p>spielen</p></body></html>"""
+
+        assert html_text(page) == "Der Hund & die Katze spielen"
+
+    def test_html_text_is_bounded(self):
+        page = "<p>Der Hund läuft.</p>" * 10000
+
+        assert len(html_text(page, max_length=1000)) == 1000
+
+    def test_the_language_of_the_same_content_is_identified_once(self):
+        identifier = LanguageIdentifier()
+        page = saved_page("der_kleine_prinz.html")
+
+        with patch.object(identifier, "_detect", return_value="de") as detect:
+            assert identifier.language_of_html(page) == "de"
+            assert identifier.language_of_html(page) == "de"
+            assert identifier.language_of_text(page) == "de"
+
+        # the text is not the same content as the page, even if it is equal
+        assert detect.call_count == 2
+
+    def test_identification_is_deterministic(self):
+        identifier = LanguageIdentifier(cache_size=0)
+        # short and ambiguous; langdetect alone answers differently at times
+        text = "Die Bank ist in der Stadt"
+
+        languages = {identifier.language_of_text(text) for _ in range(20)}
+
+        assert len(languages) == 1
+
+    def test_no_language_without_text(self):
+        identifier = LanguageIdentifier()
+
+        assert (
+            identifier.language_of_html("<html><body><img src='x.png'></body></html>")
+            is None
+        )
+        assert identifier.language_of_text("12345 !!!") is None
@@ -0,0 +1,39 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from zeeguu.core.word_filter import remove_words_based_on_list
+from zeeguu.core.word_filter.lexicon import Lexicon, save_lexicon
+
+WORDS = ["københavn", "aarhus", "odense", "aarhus", "zürich", ""]
+
+
+class LexiconTest(TestCase):
+    def test_words_are_sorted_and_distinct(self):
+        lexicon = Lexicon.of(WORDS)
+        assert len(lexicon) == 4
+        assert list(lexicon) == sorted(set(WORDS) - {""}, key=str.encode)
+
+    def test_lookup(self):
+        lexicon = Lexicon.of(WORDS)
+        for each in WORDS[:-1]:
+            assert each in lexicon
+        for each in ["", "a", "aarhu", "aarhuss", "zz", "københav"]:
+            assert each not in lexicon
+
+    def test_compiled_file_is_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "cities.lexicon")
+            save_lexicon(WORDS, path)
+            lexicon = Lexicon.open(path)
+            assert "zürich" in lexicon
+            assert list(lexicon) == list(Lexicon.of(WORDS))
+
+    def test_remove_words_based_on_lexicon_keeps_order(self):
+        candidates = ["zebra", "odense", "hund", "aarhus", "hund", "æble"]
+        assert remove_words_based_on_list(candidates, Lexicon.of(WORDS)) == [
+            "zebra",
+            "hund",
+            "hund",
+            "æble",
+        ]
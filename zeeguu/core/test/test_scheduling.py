@@ -445,6 +445,149 @@ class SchedulerTest(ModelTestMixIn):
 
         self.assert_schedule(schedule, 0, 2, 0, 0)
 
+    def test_bookmarks_priority_to_study(self):
+        from zeeguu.core.word_scheduling.basicSR.basicSR import BasicSRSchedule
+
+        user = self.two_cycles_user
+        frequent, frequent_and_close_to_learned, rare, not_scheduled = [
+            BookmarkRule(user).bookmark for _ in range(4)
+        ]
+        frequent.origin.rank = 10
+        frequent_and_close_to_learned.origin.rank = 10
+        rare.origin.rank = 500
+        not_scheduled.origin.rank = 20
+        for bookmark in [frequent, frequent_and_close_to_learned, rare, not_scheduled]:
+            bookmark.fit_for_study = 1
+            db_session.add(bookmark.origin)
+        for bookmark in [self.two_cycles_bookmark1, self.two_cycles_bookmark2]:
+            bookmark.fit_for_study = 0
+            db_session.add(bookmark)
+
+        for bookmark, cooling_interval in [
+            (frequent, ONE_DAY_COOLING),
+            (frequent_and_close_to_learned, FOUR_DAYS_COOLING),
+            (rare, EIGHT_DAYS_COOLING),
+        ]:
+            schedule = SchedulerRule(
+                bookmark.get_scheduler(), bookmark, db_session
+            ).schedule
+            schedule.cooling_interval = cooling_interval
+            schedule.next_practice_time = datetime.now() - ONE_DAY_LATER
+            db_session.add(schedule)
+        db_session.commit()
+
+        candidates = BasicSRSchedule.study_candidates(user, None)
+        self.assertEqual(
+            [each.Bookmark for each in candidates],
+            [frequent_and_close_to_learned, frequent, not_scheduled, rare],
+        )
+        self.assertEqual(candidates[0].cooling_interval, FOUR_DAYS_COOLING)
+        self.assertEqual(candidates[2].cooling_interval, None)
+
+        self.assertEqual(
+            BasicSRSchedule.all_bookmarks_priority_to_study(user, 2),
+            [frequent_and_close_to_learned, frequent],
+        )
+
+    def test_scheduling_snapshot_is_invalidated_by_exercise_outcome(self):
+        from zeeguu.core.word_scheduling.basicSR.basicSR import BasicSRSchedule
+        from zeeguu.core.word_scheduling.basicSR.scheduling_snapshot import (
+            SchedulingSnapshot,
+        )
+
+        user = self.two_cycles_user
+        bookmark = self.two_cycles_bookmark1
+        self.assertEqual(BasicSRSchedule.total_bookmarks_in_pipeline(user), 0)
+
+        snapshot = SchedulingSnapshot.of(user)
+        self.assertIs(SchedulingSnapshot.of(user), snapshot)
+
+        self._new_schedule_after_exercise(bookmark, OutcomeRule().correct)
+
+        self.assertIsNot(SchedulingSnapshot.of(user), snapshot)
+        self.assertEqual(BasicSRSchedule.total_bookmarks_in_pipeline(user), 1)
+        self.assertEqual(BasicSRSchedule.bookmarks_in_pipeline(user), [bookmark])
+
+    def test_scheduling_snapshot_is_invalidated_once_a_change_is_committed(self):
+        from zeeguu.core.model import UserWord
+        from zeeguu.core.word_scheduling.basicSR.scheduling_snapshot import (
+            SchedulingSnapshot,
+        )
+
+        user = self.two_cycles_user
+        bookmark = self.two_cycles_bookmark1
+        self._new_schedule_after_exercise(bookmark, OutcomeRule().correct)
+        snapshot = SchedulingSnapshot.of(user)
+
+        # e.g. /update_bookmark; the change is not seen before the commit
+        bookmark.origin = UserWord.find_or_create(
+            db_session, "Umgeschrieben", bookmark.origin.language, commit=False
+        )
+        db_session.flush()
+        self.assertIs(SchedulingSnapshot.of(user), snapshot)
+
+        db_session.commit()
+        self.assertIn(
+            "umgeschrieben",
+            [each.lowercase_word for each in SchedulingSnapshot.of(user).rows],
+        )
+
+    def test_scheduling_snapshot_is_kept_when_a_change_is_rolled_back(self):
+        from zeeguu.core.word_scheduling.basicSR.scheduling_snapshot import (
+            SchedulingSnapshot,
+        )
+
+        user = self.two_cycles_user
+        snapshot = SchedulingSnapshot.of(user)
+
+        self.two_cycles_bookmark1.starred = True
+        db_session.flush()
+        db_session.rollback()
+        db_session.commit()
+
+        self.assertIs(SchedulingSnapshot.of(user), snapshot)
+
+    def test_scheduling_snapshot_is_not_kept_if_invalidated_during_the_transaction(
+        self,
+    ):
+        from zeeguu.core.word_scheduling.basicSR.scheduling_snapshot import (
+            SchedulingSnapshot,
+            invalidate_scheduling_snapshot,
+        )
+
+        user = self.two_cycles_user
+        db_session.commit()
+        # the transaction begins, e.g. when the session user is loaded
+        db_session.refresh(user)
+        # another request commits a change to the schedule; with
+        # REPEATABLE READ this transaction would not see it
+        invalidate_scheduling_snapshot(user.id)
+
+        snapshot = SchedulingSnapshot.of(user)
+        self.assertIsNot(SchedulingSnapshot.of(user), snapshot)
+
+        db_session.commit()
+        snapshot = SchedulingSnapshot.of(user)
+        self.assertIs(SchedulingSnapshot.of(user), snapshot)
+
+    def test_scheduling_snapshot_of_uncommitted_changes_is_not_kept(self):
+        from zeeguu.core.word_scheduling.basicSR.scheduling_snapshot import (
+            SchedulingSnapshot,
+        )
+
+        user = self.two_cycles_user
+        self.two_cycles_bookmark1.fit_for_study = False
+        db_session.flush()
+
+        snapshot = SchedulingSnapshot.of(user)
+        self.assertIsNot(SchedulingSnapshot.of(user), snapshot)
+
+        db_session.rollback()
+        self.assertIn(
+            self.two_cycles_bookmark1.id,
+            [each.bookmark_id for each in SchedulingSnapshot.of(user).rows],
+        )
+
     # ================================================================================================================
     # A few helper functions
     # ================================================================================================================
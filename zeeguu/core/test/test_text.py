@@ -1,3 +1,5 @@
+from zeeguu.core.model import db
+from zeeguu.core.model.text import Text
 from zeeguu.core.test.model_test_mixin import ModelTestMixIn
 from zeeguu.core.test.rules.bookmark_rule import BookmarkRule
 from zeeguu.core.test.rules.text_rule import TextRule
@@ -14,3 +16,37 @@ class TextTest(ModelTestMixIn):
 
     def test_user_word_count(self):
         self.assertIsNotNone(self.text_rule.text.content_hash)
+
+    def test_find_or_create_without_commit(self):
+        existing = self.text_rule.text
+
+        text = Text.find_or_create(
+            db.session,
+            " " + existing.content + " ",
+            existing.language,
+            existing.url,
+            existing.article,
+            commit=False,
+        )
+
+        assert text is existing
+
+    def test_find_or_create_uses_the_oldest_of_duplicates(self):
+        # left by two requests that created the same text at the same time
+        existing = self.text_rule.text
+        duplicate = Text(
+            existing.content, existing.language, existing.url, existing.article
+        )
+        db.session.add(duplicate)
+        db.session.commit()
+
+        text = Text.find_or_create(
+            db.session,
+            existing.content,
+            existing.language,
+            existing.url,
+            existing.article,
+            commit=False,
+        )
+
+        assert text is existing
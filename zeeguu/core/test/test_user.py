@@ -1,4 +1,5 @@
 import json
+import os
 import random
 import uuid
 from collections import Counter
@@ -8,11 +9,17 @@ from dateutil.utils import today
 from zeeguu.core.test.model_test_mixin import ModelTestMixIn
 from zeeguu.core.test.rules.bookmark_rule import BookmarkRule
 from zeeguu.core.test.rules.user_rule import UserRule
-from zeeguu.core.model import User, Session
+from zeeguu.core.model import User, Session, DailyLearnerActivity
 from zeeguu.core.model import db
 from zeeguu.core.account_management.user_account_deletion import (
     delete_user_account_w_session,
 )
+from zeeguu.core.util import password_hash
+from zeeguu.core.util.password import (
+    PASSWORD_HASHERS,
+    password_needs_rehash,
+    verify_password,
+)
 
 
 class UserTest(ModelTestMixIn):
@@ -119,6 +126,7 @@ class UserTest(ModelTestMixIn):
             date_bookmark_pair.append(random_date)
 
         date_bookmark_count_pair = dict(Counter(date_bookmark_pair))
+        DailyLearnerActivity.rebuild(db.session, self.user.id)
 
         counts_by_date = json.loads(self.user.bookmark_counts_by_date())
 
@@ -139,6 +147,43 @@ class UserTest(ModelTestMixIn):
 
         assert result is not None and result == self.user
 
+    def test_authorize_upgrades_the_legacy_password_hash(self):
+        new_password = self.faker.password()
+        salt = os.urandom(32)
+        self.user.password = password_hash(new_password, salt)
+        self.user.password_salt = salt.hex()
+        db.session.commit()
+
+        assert User.authorize(self.user.email, new_password + "x") is None
+        assert password_needs_rehash(self.user.password)
+
+        assert User.authorize(self.user.email, new_password) == self.user
+        assert not password_needs_rehash(self.user.password)
+        assert User.authorize(self.user.email, new_password) == self.user
+
+    def test_password_hashers(self):
+        salt = os.urandom(32)
+        for hasher in PASSWORD_HASHERS.values():
+            encoded = hasher.encode("secret", salt)
+            assert encoded.startswith(hasher.scheme + "$")
+            assert verify_password("secret", salt, encoded)
+            assert not verify_password("Secret", salt, encoded)
+            assert not verify_password("secret", os.urandom(32), encoded)
+
+    def test_malformed_password_hash_does_not_verify(self):
+        salt = os.urandom(32)
+        for encoded in [
+            "pbkdf2_sha256$100000$abc$def",
+            "pbkdf2_sha256$many$abc",
+            "scrypt$16384,8$abc",
+            "scrypt$3,8,1$abc",
+        ]:
+            assert not verify_password("secret", salt, encoded)
+
+        self.user.password = "pbkdf2_sha256$100000"
+        db.session.commit()
+        assert User.authorize(self.user.email, "secret") is None
+
     def test_authorize_anonymous(self):
         random_uuid = str(uuid.uuid4())
         new_password = self.faker.password()
@@ -7,6 +7,13 @@ from zeeguu.core.test.rules.article_rule import ArticleRule
 from zeeguu.core.test.rules.language_rule import LanguageRule
 from zeeguu.core.test.rules.user_article_rule import UserArticleRule
 from zeeguu.core.test.rules.user_rule import UserRule
+from zeeguu.core.instrumentation import (
+    current_request_metrics,
+    finish_request,
+    start_request,
+)
+from zeeguu.core.instrumentation.request_metrics import install_sql_listeners
+from zeeguu.core.model import Article, PersonalCopy
 from zeeguu.core.model.user_article import UserArticle
 
 db_session = zeeguu.core.model.db.session
@@ -30,3 +37,24 @@ class UserArticleTest(ModelTestMixIn, TestCase):
     def test_all_starred_or_liked_articles(self):
         self.article.star_for_user(db_session, self.user)
         assert 1 == len(UserArticle.all_starred_or_liked_articles_of_user(self.user))
+
+    def test_user_article_infos_are_loaded_with_a_few_queries(self):
+        articles = [self.article] + [ArticleRule().article for _ in range(4)]
+        self.article.star_for_user(db_session, self.user)
+        PersonalCopy.make_for(self.user, articles[1], db_session)
+        expected = [UserArticle.user_article_info(self.user, a) for a in articles]
+
+        # without any of the relationships of the articles loaded
+        article_ids = [each.id for each in articles]
+        db_session.expunge_all()
+        articles = Article.query.filter(Article.id.in_(article_ids)).all()
+        articles.sort(key=lambda each: article_ids.index(each.id))
+
+        install_sql_listeners()
+        start_request("user_article_infos")
+        article_infos = UserArticle.user_article_infos(self.user, articles)
+        sql_count = current_request_metrics().sql_count
+        finish_request()
+
+        assert article_infos == expected
+        assert sql_count <= 8
@@ -1,4 +1,7 @@
 import random
+from unittest.mock import patch
+
+from sqlalchemy.orm.exc import NoResultFound
 
 from wordstats.loading_from_hermit import load_language_from_hermit
 
@@ -39,6 +42,36 @@ class UserWordTest(ModelTestMixIn):
 
         assert user_word_created == user_word_not_in_db
 
+    def test_find_or_create_without_commit(self):
+        random_word = self.faker.word()
+        random_language = LanguageRule().random
+
+        user_word = UserWord.find_or_create(
+            db.session, random_word, random_language, commit=False
+        )
+        assert user_word.id is not None
+        assert (
+            UserWord.find_or_create(
+                db.session, random_word, random_language, commit=False
+            )
+            is user_word
+        )
+
+        db.session.commit()
+        assert UserWord.exists(random_word, random_language)
+
+    def test_find_or_create_without_commit_when_another_request_created_it(self):
+        existing = UserWordRule().user_word
+
+        # like under REPEATABLE READ, where a plain read does not see a word
+        # that was committed after the transaction of this request started
+        with patch.object(UserWord, "find", side_effect=NoResultFound):
+            user_word = UserWord.find_or_create(
+                db.session, existing.word, existing.language, commit=False
+            )
+
+        assert user_word.id == existing.id
+
     def test_find_all(self):
         list_random_user_words = [
             UserWordRule().user_word for _ in range(random.randint(2, 5))
@@ -0,0 +1,44 @@
+"""
+
+The speech synthesized for the words and the articles, cached under the
+data folder (see AudioCache). The cache of the app is configured with:
+
+    - ZEEGUU_DATA_FOLDER (environment variable): where the files are saved
+    - TTS_SYNTHESIZER: "google" (default) or "fake" (no network calls)
+    - TTS_CACHE_MAX_BYTES: the size over which the least recently used
+      files are removed
+
+"""
+
+import os
+from threading import Lock
+
+from .audio_cache import AudioCache, DEFAULT_MAX_BYTES
+from .synthesizers import FakeSynthesizer, GoogleSynthesizer, voice_for_language
+
+_audio_cache = None
+_audio_cache_lock = Lock()
+
+
+def audio_cache():
+    """
+    :return: the AudioCache of the app; one per process, such that
+    all the requests share the synthesizer client
+    """
+    global _audio_cache
+    with _audio_cache_lock:
+        if _audio_cache is None:
+            import zeeguu.core
+
+            config = zeeguu.core.app.config
+            synthesizer = (
+                FakeSynthesizer()
+                if config.get("TTS_SYNTHESIZER", "google") == "fake"
+                else GoogleSynthesizer()
+            )
+            _audio_cache = AudioCache(
+                os.environ.get("ZEEGUU_DATA_FOLDER"),
+                synthesizer,
+                config.get("TTS_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES),
+            )
+        return _audio_cache
@@ -0,0 +1,225 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from zeeguu.core.text_to_speech.synthesizers import voice_for_language
+
+# relative to the data folder; this is also the prefix of the paths
+# that are sent to the clients, which find the files under it
+CACHE_FOLDER = "/speech/cache"
+
+MANIFEST_FILE_NAME = "manifest.sqlite"
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024 * 1024
+
+# the eviction removes more than strictly necessary, such that
+# it does not have to run again after every new file
+EVICT_DOWN_TO = 0.9
+
+# reading a cached file updates its last use only if it was
+# not already updated recently; saves a write for most hits
+LAST_USE_RESOLUTION_IN_SECONDS = 60 * 60
+
+
+# the language is part of the path of the file
+LANGUAGE_ID = re.compile(r"[a-z]{2,3}(-[A-Z]{2})?")
+
+
+def normalized(text):
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(language_id, voice, text):
+    return hashlib.sha256(
+        f"{language_id}\n{voice}\n{normalized(text)}".encode("utf-8")
+    ).hexdigest()
+
+
+class AudioCache(object):
+    """
+
+    The synthesized speech, saved as mp3 files under the data folder.
+
+    A file is identified by the language, the voice, and the hash of the
+    normalized text (so the same text is only synthesized once, whoever
+    asks for it); the files are spread over 256 subfolders per language,
+    named by the first two characters of the hash.
+
+    The manifest (an sqlite DB next to the files) knows the size and
+    the last use of every file, such that when the cache grows over
+    max_bytes the least recently used files can be removed.
+
+    """
+
+    def __init__(self, data_folder, synthesizer, max_bytes=DEFAULT_MAX_BYTES):
+        self.data_folder = data_folder
+        self.synthesizer = synthesizer
+        self.max_bytes = max_bytes
+
+        os.makedirs(self.data_folder + CACHE_FOLDER, exist_ok=True)
+        self.manifest_path = os.path.join(
+            self.data_folder + CACHE_FOLDER, MANIFEST_FILE_NAME
+        )
+        with self._manifest() as manifest:
+            manifest.execute(
+                "create table if not exists audio ("
+                " key text primary key,"
+                " path text not null,"
+                " bytes integer not null,"
+                " last_used real not null)"
+            )
+            manifest.execute(
+                "create index if not exists audio_last_used on audio (last_used)"
+            )
+
+    def path_for(self, text, language_id):
+        """
+        :return: the path, relative to the data folder, of the mp3 of the
+        text spoken in the language; synthesized if it is not cached yet
+        """
+        relative_path = self.cached_path(text, language_id)
+        if relative_path:
+            return relative_path
+
+        key = cache_key(language_id, voice_for_language(language_id), text)
+        relative_path = self._relative_path(language_id, key)
+        audio = self.synthesizer.synthesize(normalized(text), language_id)
+        self._save(relative_path, audio)
+
+        with self._manifest() as manifest:
+            manifest.execute(
+                "insert or replace into audio values (?, ?, ?, ?)",
+                (key, relative_path, len(audio), time.time()),
+            )
+        self.evict_if_needed()
+
+        return relative_path
+
+    def cached_path(self, text, language_id):
+        """
+        :return: the path of the mp3 if it is in the cache, None otherwise
+        """
+        key = cache_key(language_id, voice_for_language(language_id), text)
+        relative_path = self._relative_path(language_id, key)
+        if not os.path.isfile(self.data_folder + relative_path):
+            return None
+
+        self._record_use(key, relative_path)
+        return relative_path
+
+    def evict_if_needed(self):
+        """
+        Removes the least recently used files if the cache is too big
+
+        :return: the number of removed files
+        """
+        with self._manifest() as manifest:
+            (total_bytes,) = manifest.execute(
+                "select coalesce(sum(bytes), 0) from audio"
+            ).fetchone()
+            if total_bytes <= self.max_bytes:
+                return 0
+
+            evicted = []
+            for key, relative_path, size in manifest.execute(
+                "select key, path, bytes from audio order by last_used"
+            ):
+                if total_bytes <= self.max_bytes * EVICT_DOWN_TO:
+                    break
+                try:
+                    os.remove(self.data_folder + relative_path)
+                except FileNotFoundError:
+                    pass
+                evicted.append((key,))
+                total_bytes -= size
+
+            manifest.executemany("delete from audio where key = ?", evicted)
+            return len(evicted)
+
+    def rebuild_manifest(self):
+        """
+        Recreates the manifest from the files in the cache folder
+
+        :return: the number of files
+        """
+        rows = []
+        now = time.time()
+        cache_folder = self.data_folder + CACHE_FOLDER
+        for folder, _, file_names in os.walk(cache_folder):
+            for file_name in file_names:
+                if not file_name.endswith(".mp3"):
+                    continue
+                absolute_path = os.path.join(folder, file_name)
+                relative_path = absolute_path[len(self.data_folder) :]
+                rows.append(
+                    (
+                        file_name[: -len(".mp3")],
+                        relative_path,
+                        os.path.getsize(absolute_path),
+                        now,
+                    )
+                )
+
+        with self._manifest() as manifest:
+            manifest.execute("delete from audio")
+            manifest.executemany("insert into audio values (?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def _record_use(self, key, relative_path):
+        now = time.time()
+        with self._manifest() as manifest:
+            row = manifest.execute(
+                "select last_used from audio where key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                # e.g. the file was added by another process before the
+                # manifest was (re)created
+                size = os.path.getsize(self.data_folder + relative_path)
+                manifest.execute(
+                    "insert or ignore into audio values (?, ?, ?, ?)",
+                    (key, relative_path, size, now),
+                )
+            elif row[0] < now - LAST_USE_RESOLUTION_IN_SECONDS:
+                manifest.execute(
+                    "update audio set last_used = ? where key = ?", (now, key)
+                )
+
+    def _save(self, relative_path, audio):
+        absolute_path = self.data_folder + relative_path
+        os.makedirs(os.path.dirname(absolute_path), exist_ok=True)
+
+        # written under a temporary name first, such that another request
+        # never finds a half written file
+        temporary_path = f"{absolute_path}.{os.getpid()}.{threading.get_ident()}"
+        with open(temporary_path, "wb") as out:
+            out.write(audio)
+        os.replace(temporary_path, absolute_path)
+
+    def _relative_path(self, language_id, key):
+        if not LANGUAGE_ID.fullmatch(language_id):
+            raise ValueError(f"Not a language id: {language_id}")
+        return f"{CACHE_FOLDER}/{language_id}/{key[:2]}/{key}.mp3"
+
+    def _manifest(self):
+        return _Manifest(self.manifest_path)
+
+
+class _Manifest(object):
+    # a connection per use: the cache is shared by the threads of the API,
+    # and sqlite connections can not be shared between threads
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self.connection = sqlite3.connect(self.path, timeout=10)
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.connection.commit()
+        self.connection.close()
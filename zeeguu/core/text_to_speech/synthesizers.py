@@ -0,0 +1,80 @@
+from threading import Lock
+
+# See: https://cloud.google.com/text-to-speech/docs/voices
+PREFERRED_VOICES = {
+    "da": "da-DK-Wavenet-D",
+    "fr": "fr-FR-Neural2-C",
+    "en": "en-US",
+    "nl": "nl-NL-Wavenet-B",
+    "de": "de-DE-Neural2-C",
+    "it": "it-IT-Neural2-A",
+    "pt": "pt-PT-Wavenet-A",
+}
+
+
+def voice_for_language(language_id):
+    if PREFERRED_VOICES.get(language_id):
+        return PREFERRED_VOICES[language_id]
+    return code_from_id(language_id) + "-Standard-A"
+
+
+def code_from_id(language_id):
+    # If they're not here, we assume the xy-XY form
+    irregular_language_codes = {
+        "da": "da-DK",
+        "en": "en-US",
+    }
+    if irregular_language_codes.get(language_id):
+        return irregular_language_codes[language_id]
+    return f"{language_id}-{language_id.upper()}"
+
+
+class GoogleSynthesizer(object):
+    """
+    Synthesizes with the Google Text-to-Speech API; the client is
+    created once and shared by all the threads (it is thread safe)
+    """
+
+    def __init__(self):
+        self._client = None
+        self._client_lock = Lock()
+
+    def synthesize(self, text, language_id):
+        """
+        :return: the mp3 bytes of the text spoken in the language
+        """
+        from google.cloud import texttospeech
+
+        response = self._get_client().synthesize_speech(
+            input=texttospeech.SynthesisInput(text=text),
+            voice=texttospeech.VoiceSelectionParams(
+                language_code=code_from_id(language_id),
+                name=voice_for_language(language_id),
+            ),
+            audio_config=texttospeech.AudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.MP3
+            ),
+        )
+        return response.audio_content
+
+    def _get_client(self):
+        with self._client_lock:
+            if self._client is None:
+                from google.cloud import texttospeech
+
+                self._client = texttospeech.TextToSpeechClient()
+            return self._client
+
+
+class FakeSynthesizer(object):
+    """
+    Does not call any service; for the tests and for running locally
+    without Google credentials. Remembers what it was asked to synthesize
+    """
+
+    def __init__(self):
+        self.synthesized = []
+
+    def synthesize(self, text, language_id):
+        self.synthesized.append((text, language_id))
+        return f"FAKE MP3 {voice_for_language(language_id)}: {text}".encode("utf-8")
@@ -71,6 +71,7 @@ def article_feedback(session, article_id, user, event_value):
         article.url.as_string(),
         article.id,
     )
+    session.commit()
 
 
 def article_liked(session, article_id, user, like_value):
@@ -85,6 +86,7 @@ def article_liked(session, article_id, user, like_value):
     send_notification_article_feedback(
         "Liked", user, article.title, article.url.as_string(), article.id
     )
+    session.commit()
 
 
 def article_opened(session, article_id, user):
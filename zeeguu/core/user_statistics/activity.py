@@ -1,17 +1,13 @@
-import json
-
-from sqlalchemy import text
-
-import zeeguu.core
 from zeeguu.core.constants import SIMPLE_DATE_FORMAT
+from zeeguu.core.model import DailyLearnerActivity
 
 
 def reading_duration_by_day(user):
-    return _time_by_day(user, "user_reading_session", "start_time", "duration")
+    return _time_by_day(user, "reading_ms")
 
 
 def exercises_duration_by_day(user):
-    return _time_by_day(user, "user_exercise_session", "start_time", "duration")
+    return _time_by_day(user, "exercise_ms")
 
 
 def activity_duration_by_day(user):
@@ -24,25 +20,19 @@ def activity_duration_by_day(user):
 def convert_to_date_seconds(result_raw):
     result_array = [
         {
-            "date": (each._mapping["date"]).strftime(SIMPLE_DATE_FORMAT),
-            "seconds": (int(each._mapping["duration"])),
+            "date": day.strftime(SIMPLE_DATE_FORMAT),
+            "seconds": int(milliseconds / 1000),
         }
-        for each in result_raw
+        for day, milliseconds in result_raw
     ]
 
     return result_array
 
 
-def _time_by_day(user, table_name, date_field, duration_field):
-    query = (
-            f" SELECT date({date_field}) as date, "
-            + f" SUM({duration_field}) / 1000 as duration "
-            + f" FROM {table_name}"
-            + " WHERE user_id = :uid GROUP BY date;"
-    )
-    result_raw = zeeguu.core.model.db.session.execute(
-        text(query),
-        {"uid": user.id, "table_name": table_name},
-    )
-
-    return result_raw
+def _time_by_day(user, counter):
+    # read from the daily aggregates instead of summing up all the sessions
+    return [
+        (day, milliseconds)
+        for day, milliseconds in DailyLearnerActivity.totals_by_day(user.id, [counter])
+        if milliseconds > 0
+    ]
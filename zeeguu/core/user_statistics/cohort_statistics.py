@@ -0,0 +1,279 @@
+"""
+
+The same per-student statistics as summarize_reading_activity,
+total_time_in_exercise_sessions, exercise_count_and_correctness_percentage,
+etc. but computed for a whole group of students at once: every metric
+is one query grouped by user_id, instead of one (or more) queries per student.
+
+"""
+
+from collections import defaultdict
+
+from sqlalchemy import text, bindparam
+
+from zeeguu.core.model import db
+from zeeguu.core.model.cohort import Cohort
+from .exercise_sessions import same_language_as_cohort_condition
+from .reading_sessions import summarize_reading_sessions
+
+
+def cohort_student_statistics(user_ids, cohort_id, start_date, end_date):
+    """
+    :return: dictionary user_id -> the statistics shown in the teacher
+    dashboard for that student; the keys are the same as the ones of
+    summarize_reading_activity, total_time_in_exercise_sessions, and
+    exercise_count_and_correctness_percentage together
+    """
+    statistics = {user_id: {} for user_id in user_ids}
+    if not user_ids:
+        return statistics
+
+    for metric in [
+        reading_activity_per_user,
+        exercise_time_per_user,
+        exercise_correctness_per_user,
+    ]:
+        for user_id, values in metric(
+            user_ids, cohort_id, start_date, end_date
+        ).items():
+            statistics[user_id].update(values)
+
+    return statistics
+
+
+def cohort_activity_overview(user_ids, cohort_id, start_date, end_date):
+    """
+    :return: dictionary user_id -> same as student_activity_overview
+    """
+    statistics = cohort_student_statistics(user_ids, cohort_id, start_date, end_date)
+    if not user_ids:
+        return statistics
+
+    for metric in [
+        practiced_words_count_per_user,
+        translated_but_not_practiced_words_count_per_user,
+        learned_words_count_per_user,
+    ]:
+        for user_id, values in metric(
+            user_ids, cohort_id, start_date, end_date
+        ).items():
+            statistics[user_id].update(values)
+
+    return statistics
+
+
+def reading_activity_per_user(user_ids, cohort_id, start_date, end_date):
+    # the distinct texts and their lengths can not be aggregated
+    # in SQL the way summarize_reading_sessions does it, so we fetch the
+    # (narrow) session rows of all the users and summarize them here
+    query = """
+        select  u.user_id,
+                (u.duration / 1000) as duration_in_sec,
+                a.title,
+                a.word_count,
+                a.fk_difficulty as difficulty
+
+        from user_reading_session as u
+
+        join article as a
+            on u.article_id = a.id
+
+        where
+            u.user_id in :user_ids
+            and u.start_time > :startDate
+            and u.last_action_time <= :endDate
+            and u.duration > 0
+            and a.language_id = (select language_id from `cohort` where cohort.id=:cohortId)
+
+        order by u.start_time desc
+    """
+
+    sessions = defaultdict(list)
+    for row in _execute(query, user_ids, cohort_id, start_date, end_date):
+        sessions[row.user_id].append(row._mapping)
+
+    return {
+        user_id: summarize_reading_sessions(sessions[user_id]) for user_id in user_ids
+    }
+
+
+def exercise_time_per_user(user_ids, cohort_id, start_date, end_date):
+    cohort = Cohort.find(cohort_id)
+
+    query = f"""
+        select ues.user_id, sum(ues.duration)
+        from user_exercise_session as ues
+        WHERE ues.user_id in :user_ids
+        and ues.start_time > :startDate
+        and ues.last_action_time < :endDate
+        and {same_language_as_cohort_condition(cohort)}
+        group by ues.user_id
+    """
+
+    durations = dict(
+        _execute(
+            query, user_ids, cohort_id, start_date, end_date, cohort.language_id
+        ).all()
+    )
+
+    result = {}
+    for user_id in user_ids:
+        exercise_time_in_sec = 0
+        if durations.get(user_id):
+            exercise_time_in_sec = int(durations[user_id] / 1000)
+        result[user_id] = {
+            "exercise_time_in_sec": exercise_time_in_sec,
+            "exercise_time": exercise_time_in_sec,
+        }
+    return result
+
+
+def exercise_correctness_per_user(user_ids, cohort_id, start_date, end_date):
+    query = """
+        select b.user_id, o.outcome, count(o.outcome)
+
+        from exercise as e
+        join bookmark_exercise_mapping as bem
+            on bem.`exercise_id`=e.id
+        join bookmark as b
+            on bem.bookmark_id=b.id
+        join exercise_outcome as o
+            on e.outcome_id = o.id
+        join user_word as uw
+            on b.origin_id = uw.id
+
+        where b.user_id in :user_ids
+            and e.time > '2021-05-24' -- before this date data is saved in a different format...
+            and	e.time > :startDate
+            and	e.time < :endDate
+            and uw.language_id = (select language_id from cohort where cohort.id=:cohortId)
+
+        group by b.user_id, o.outcome
+    """
+
+    outcome_stats = defaultdict(dict)
+    for user_id, outcome, count in _execute(
+        query, user_ids, cohort_id, start_date, end_date
+    ):
+        outcome_stats[user_id][outcome] = count
+
+    result = {}
+    for user_id in user_ids:
+        stats = outcome_stats[user_id]
+        total = sum(stats.values())
+
+        correct_on_1st_try = "0"
+        if total != 0:
+            correct_count = stats.get("C", 0) + stats.get("Correct", 0)
+            correct_on_1st_try = int(correct_count / total * 100) / 100
+
+        result[user_id] = {
+            "correct_on_1st_try": correct_on_1st_try,
+            "number_of_exercises": total,
+        }
+    return result
+
+
+def practiced_words_count_per_user(user_ids, cohort_id, start_date, end_date):
+    query = """
+        select b.user_id, count(distinct(uw.word))
+
+        from exercise as e
+        join bookmark_exercise_mapping as bem
+            on bem.`exercise_id`=e.id
+        join bookmark as b
+            on bem.bookmark_id=b.id
+        join exercise_outcome as o
+            on e.outcome_id = o.id
+        join user_word as uw
+            on b.origin_id = uw.id
+
+        where b.user_id in :user_ids
+            and e.time > '2021-05-24' -- before this date data is saved in a different format...
+            and	e.time > :startDate
+            and	e.time < :endDate
+            and uw.language_id = (select language_id from cohort where cohort.id=:cohortId)
+
+        group by b.user_id
+    """
+
+    return _counts_per_user(
+        "practiced_words_count", query, user_ids, cohort_id, start_date, end_date
+    )
+
+
+def translated_but_not_practiced_words_count_per_user(
+    user_ids, cohort_id, start_date, end_date
+):
+    query = """
+        select b.user_id, count(b.id)
+
+        from bookmark as b
+        join user_word as uw
+            on b.origin_id = uw.id
+
+        where b.user_id in :user_ids
+            and	b.time > :startDate
+            and	b.time < :endDate
+            and uw.language_id = (select language_id from cohort where cohort.id=:cohortId)
+            and not exists
+                (select bem.bookmark_id
+                from bookmark_exercise_mapping as bem
+                join exercise as e
+                    on bem.exercise_id = e.id
+                join exercise_outcome as o
+                    on e.outcome_id = o.id
+                where bem.bookmark_id = b.id
+                    and	e.time > :startDate
+                    and	e.time < :endDate)
+
+        group by b.user_id
+    """
+
+    return _counts_per_user(
+        "translated_but_not_practiced_words_count",
+        query,
+        user_ids,
+        cohort_id,
+        start_date,
+        end_date,
+    )
+
+
+def learned_words_count_per_user(user_ids, cohort_id, start_date, end_date):
+    query = """
+        select b.user_id, count(b.id)
+
+        from bookmark as b
+        join user_word as uw
+            on b.origin_id = uw.id
+
+        where b.user_id in :user_ids
+            and	b.learned_time > :startDate
+            and	b.learned_time < :endDate
+            and uw.language_id = (select language_id from cohort where cohort.id=:cohortId)
+
+        group by b.user_id
+    """
+
+    return _counts_per_user(
+        "learned_words_count", query, user_ids, cohort_id, start_date, end_date
+    )
+
+
+def _counts_per_user(key, query, user_ids, cohort_id, start_date, end_date):
+    counts = dict(_execute(query, user_ids, cohort_id, start_date, end_date).all())
+    return {user_id: {key: counts.get(user_id, 0)} for user_id in user_ids}
+
+
+def _execute(query, user_ids, cohort_id, start_date, end_date, language_id=None):
+    return db.session.execute(
+        text(query).bindparams(bindparam("user_ids", expanding=True)),
+        {
+            "user_ids": list(user_ids),
+            "startDate": start_date,
+            "endDate": end_date,
+            "cohortId": cohort_id,
+            "language_id": language_id,
+        },
+    )
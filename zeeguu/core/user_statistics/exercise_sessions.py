@@ -10,23 +10,13 @@ def total_time_in_exercise_sessions(user_id, cohort_id, start_time, end_time):
     # TODO: use also the cohort_id somehow
     cohort = Cohort.find(cohort_id)
 
-    same_language_as_cohort_condition = ""
-    if cohort.language_id:
-        same_language_as_cohort_condition = (
-            f" WHERE uw.language_id = {cohort.language_id} "
-        )
-
     query = f"""
         select sum(duration)
         from user_exercise_session as ues
-        WHERE ues.id in (SELECT e.session_id from exercise e
-                        INNER JOIN bookmark_exercise_mapping bem on e.id = bem.exercise_id
-                        INNER JOIN bookmark b ON bem.bookmark_id = b.id
-                        INNER JOIN user_word uw ON b.origin_id = uw.id
-                        {same_language_as_cohort_condition})
+        WHERE ues.user_id = :user_id
         and ues.start_time > :start_time
         and ues.last_action_time < :end_time
-        and ues.user_id = :user_id
+        and {same_language_as_cohort_condition(cohort)}
     """
 
     rows = db.session.execute(
@@ -35,6 +25,7 @@ def total_time_in_exercise_sessions(user_id, cohort_id, start_time, end_time):
             "user_id": user_id,
             "start_time": start_time,
             "end_time": end_time,
+            "language_id": cohort.language_id,
         },
     )
     result = rows.first()[0]
@@ -47,3 +38,11 @@ def total_time_in_exercise_sessions(user_id, cohort_id, start_time, end_time):
         "exercise_time_in_sec": exercise_time_in_sec,
         "exercise_time": exercise_time_in_sec,
     }
+
+
+def same_language_as_cohort_condition(cohort):
+    # sessions without a language have no exercises
+    # and thus do not count, not even for a cohort without language
+    if cohort.language_id:
+        return " ues.language_id = :language_id "
+    return " ues.language_id is not NULL "
@@ -8,13 +8,21 @@ from zeeguu.core.model import db
 
 
 def summarize_reading_activity(user_id, cohort_id, start_date, end_date):
+    r_sessions = reading_sessions(user_id, cohort_id, start_date, end_date)
+    return summarize_reading_sessions(r_sessions)
+
+
+def summarize_reading_sessions(r_sessions):
+    """
+    :param r_sessions: the reading sessions of one user, most recent first;
+    each with at least title, word_count, difficulty, and duration_in_sec
+    """
+
     def _mean(l):
         if len(l) == 0:
             return 0
         return int(mean(l))
 
-    r_sessions = reading_sessions(user_id, cohort_id, start_date, end_date)
-
     distinct_texts = set()
     reading_time = 0
     text_lengths = []
@@ -0,0 +1,90 @@
+import hmac
+from hashlib import pbkdf2_hmac, scrypt
+
+from zeeguu.core.util.hash import password_hash
+
+# a password is saved (in user.password) as: scheme$parameters$digest
+# where the parameters are the work factors the digest was computed with;
+# the hashes saved before there were schemes are the hex digest alone,
+# computed with password_hash
+
+
+class PBKDF2PasswordHasher(object):
+    scheme = "pbkdf2_sha256"
+
+    def __init__(self, iterations=100000):
+        self.iterations = iterations
+
+    def encode(self, password: str, salt: bytes) -> str:
+        return self._encode(password, salt, self.iterations)
+
+    def verify(self, password: str, salt: bytes, encoded: str) -> bool:
+        _, iterations, _ = encoded.split("$")
+        return hmac.compare_digest(
+            encoded, self._encode(password, salt, int(iterations))
+        )
+
+    def is_current(self, encoded: str) -> bool:
+        return encoded.startswith(f"{self.scheme}${self.iterations}$")
+
+    def _encode(self, password, salt, iterations):
+        digest = pbkdf2_hmac("sha256", password.encode("utf8"), salt, iterations)
+        return f"{self.scheme}${iterations}${digest.hex()}"
+
+
+class ScryptPasswordHasher(object):
+    scheme = "scrypt"
+
+    def __init__(self, n=2**14, r=8, p=1):
+        self.parameters = (n, r, p)
+
+    def encode(self, password: str, salt: bytes) -> str:
+        return self._encode(password, salt, self.parameters)
+
+    def verify(self, password: str, salt: bytes, encoded: str) -> bool:
+        _, parameters, _ = encoded.split("$")
+        n, r, p = (int(each) for each in parameters.split(","))
+        return hmac.compare_digest(encoded, self._encode(password, salt, (n, r, p)))
+
+    def is_current(self, encoded: str) -> bool:
+        return encoded.startswith(f"{self.scheme}${self._parameters_str()}$")
+
+    def _encode(self, password, salt, parameters):
+        n, r, p = parameters
+        digest = scrypt(password.encode("utf8"), salt=salt, n=n, r=r, p=p)
+        return f"{self.scheme}${self._parameters_str(parameters)}${digest.hex()}"
+
+    def _parameters_str(self, parameters=None):
+        return ",".join(str(each) for each in parameters or self.parameters)
+
+
+PASSWORD_HASHERS = {
+    each.scheme: each for each in [PBKDF2PasswordHasher(), ScryptPasswordHasher()]
+}
+
+# the hasher of the new passwords; the passwords saved with any
+# other one are hashed again with this one at the next login
+DEFAULT_PASSWORD_HASHER = PASSWORD_HASHERS["pbkdf2_sha256"]
+
+
+def hash_password(password: str, salt: bytes) -> str:
+    return DEFAULT_PASSWORD_HASHER.encode(password, salt)
+
+
+def verify_password(password: str, salt: bytes, encoded: str) -> bool:
+    if "$" not in encoded:
+        return hmac.compare_digest(encoded, password_hash(password, salt))
+
+    scheme = encoded.split("$", 1)[0]
+    if scheme not in PASSWORD_HASHERS:
+        return False
+    try:
+        return PASSWORD_HASHERS[scheme].verify(password, salt, encoded)
+    except ValueError:
+        # a malformed hash, e.g. with a stray $ or parameters that are
+        # not numbers; nobody can log in with it
+        return False
+
+
+def password_needs_rehash(encoded: str) -> bool:
+    return not DEFAULT_PASSWORD_HASHER.is_current(encoded)
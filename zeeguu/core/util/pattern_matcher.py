@@ -0,0 +1,44 @@
+class PatternMatcher(object):
+    """
+    Finds which of a list of literal patterns occur in a text
+
+    Built once per process for every list of patterns. For lists of a
+    few dozen patterns, the substring search of str (in C) is faster than
+    a single scan with one regular expression that combines all of them,
+    so every pattern is searched for on its own
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._distinct_patterns = list(dict.fromkeys(self.patterns))
+
+    def matches(self, text, start=0):
+        """
+        :param start: the position at which the search starts
+        :return: the set of the patterns that occur in the text
+        """
+        return set(
+            each for each in self._distinct_patterns if text.find(each, start) >= 0
+        )
+
+    def first_match(self, text, start=0):
+        """
+        :return: the first pattern, in the order of the list of patterns,
+        that occurs in the text; None if there's none
+        """
+        for each in self._distinct_patterns:
+            if text.find(each, start) >= 0:
+                return each
+        return None
+
+    def remove(self, text):
+        """
+        :return: the text without any of the patterns (removed in the order
+        of the list) and the list of the patterns that were removed
+        """
+        removed = []
+        for each in self._distinct_patterns:
+            if each in text:
+                text = text.replace(each, "")
+                removed.append(each)
+        return text, removed
@@ -1,9 +1,13 @@
-from .profanity_filter import load_bad_words
-from .proper_noun_filter import load_proper_name_list
+from .lexicon import Lexicon
+from .profanity_filter import load_bad_words_lexicon
+from .proper_noun_filter import load_proper_names_lexicon
 
-BAD_WORD_LIST = load_bad_words()
-PROPER_NAMES_LIST = load_proper_name_list()
+# compiled lexicons, memory mapped; see tools/compile_lexicons.py
+BAD_WORD_LIST = load_bad_words_lexicon()
+PROPER_NAMES_LIST = load_proper_names_lexicon()
 
 
 def remove_words_based_on_list(candidates, words_to_remove_list):
+    if isinstance(words_to_remove_list, Lexicon):
+        return words_to_remove_list.without(candidates)
     return list(set(candidates) - set(words_to_remove_list))
@@ -0,0 +1,135 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left
+
+from zeeguu.logging import warning
+
+# a compiled lexicon is:
+#   MAGIC
+#   the number of words, n (uint32)
+#   n + 1 offsets (uint32) of the words, relative to the start of the words
+#   the words, utf-8 encoded, sorted by their bytes, and without duplicates
+# the integers are in the byte order of the machine that compiles the file,
+# since it's compiled on the machine that uses it (see tools/compile_lexicons.py)
+MAGIC = b"ZEEGULX1"
+_UINT = struct.Struct("=I")
+_HEADER_SIZE = len(MAGIC) + _UINT.size
+
+
+def compile_lexicon(words):
+    """
+    :return: the bytes of the compiled lexicon with the (non empty) words
+    """
+    encoded = sorted(set(each.encode("utf-8") for each in words if each))
+
+    offsets = [0]
+    for each in encoded:
+        offsets.append(offsets[-1] + len(each))
+
+    return b"".join(
+        [
+            MAGIC,
+            _UINT.pack(len(encoded)),
+            struct.pack(f"={len(offsets)}I", *offsets),
+        ]
+        + encoded
+    )
+
+
+def save_lexicon(words, path):
+    # written next to the old file and then renamed, such that a process
+    # that opens the lexicon in the meantime never sees half of a file
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(compile_lexicon(words))
+    os.replace(temporary_path, path)
+
+
+class Lexicon(object):
+    """
+    A set of words that lives in a compiled lexicon file rather than in
+    the heap of the process; the file is memory mapped, so all the processes
+    on a machine (API, crawlers, etc.) share its pages, and opening it costs
+    nothing, no matter how many words it has
+
+    Looking up a word is a binary search in the sorted words
+    """
+
+    def __init__(self, buffer):
+        """
+        :param buffer: the compiled lexicon; usually an mmap of the
+        file (see open), but any bytes-like object works
+        """
+        if bytes(buffer[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a compiled lexicon")
+
+        (self._count,) = _UINT.unpack_from(buffer, len(MAGIC))
+        words_start = _HEADER_SIZE + (self._count + 1) * _UINT.size
+        self._offsets = memoryview(buffer)[_HEADER_SIZE:words_start].cast("I")
+        self._words = memoryview(buffer)[words_start:]
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def of(cls, words):
+        # an in memory lexicon; e.g. for when the compiled file is missing
+        return cls(compile_lexicon(words))
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        # the index-th word in the order of the bytes, as bytes;
+        # together with __len__ this is what bisect needs
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return bytes(self._words[self._offsets[index] : self._offsets[index + 1]])
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield str(self[index], "utf-8")
+
+    def __contains__(self, word):
+        encoded = word.encode("utf-8")
+        index = bisect_left(self, encoded)
+        return index < self._count and self[index] == encoded
+
+    def without(self, words):
+        """
+        :return: the list of the words that are not in the lexicon,
+        in their original order
+
+        Faster than a lookup for each of the words, when there are many of
+        them: the words are sorted and then merged with the lexicon, so every
+        word of the lexicon is read at most once
+        """
+        distinct = sorted(set(each.encode("utf-8") for each in words))
+        found = set()
+        index = 0
+        for each in distinct:
+            while index < self._count and self[index] < each:
+                index += 1
+            if index == self._count:
+                break
+            if self[index] == each:
+                found.add(str(each, "utf-8"))
+        return [each for each in words if each not in found]
+
+
+def open_lexicon(path, source_paths, load_words):
+    """
+    :return: the compiled lexicon at path; or, if it was not compiled
+    yet, or its sources changed since, a lexicon, in the memory of this
+    process, of the words returned by load_words
+    """
+    if os.path.exists(path) and os.path.getmtime(path) >= max(
+        os.path.getmtime(each) for each in source_paths
+    ):
+        return Lexicon.open(path)
+
+    warning(f"{path} is missing or outdated; run: python -m tools.compile_lexicons")
+    return Lexicon.of(load_words())
@@ -1,18 +1,34 @@
 from pathlib import Path
 import os
 
+from .lexicon import open_lexicon
+
 SKIP_FILES = set(["README.md", "USERS.md", "LICENSE"])
 MODULE_PATH = Path(__file__).parent.absolute()
 BAD_WORDS_FOLDER = os.path.join(MODULE_PATH, "data", "bad-words")
+PATH_TO_BAD_WORDS_LEXICON = os.path.join(MODULE_PATH, "data", "bad-words.lexicon")
 
 
-def load_bad_words():
-    bad_word_list = set()
+def _bad_word_files():
     for f in os.listdir(BAD_WORDS_FOLDER):
         path_to_file = os.path.join(BAD_WORDS_FOLDER, f)
         if os.path.isfile(path_to_file) and f not in SKIP_FILES:
-            with open(path_to_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                for line in lines:
-                    bad_word_list.add(line.strip().lower())
+            yield path_to_file
+
+
+def load_bad_words():
+    bad_word_list = set()
+    for path_to_file in _bad_word_files():
+        with open(path_to_file, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+            for line in lines:
+                bad_word_list.add(line.strip().lower())
     return bad_word_list
+
+
+def load_bad_words_lexicon():
+    return open_lexicon(
+        PATH_TO_BAD_WORDS_LEXICON,
+        [BAD_WORDS_FOLDER] + list(_bad_word_files()),
+        load_bad_words,
+    )
@@ -1,9 +1,12 @@
 from pathlib import Path
 import os
 
+from .lexicon import open_lexicon
+
 MODULE_PATH = Path(__file__).parent.absolute()
 PATH_TO_NAME_FILE = os.path.join(MODULE_PATH, "data", "person-names.txt")
 PATH_TO_CITY_FILE = os.path.join(MODULE_PATH, "data", "city-names.txt")
+PATH_TO_PROPER_NAMES_LEXICON = os.path.join(MODULE_PATH, "data", "proper-names.lexicon")
 
 
 def load_proper_name_list():
@@ -14,3 +17,11 @@ def load_proper_name_list():
             for line in lines:
                 proper_name_list.add(line.strip().lower())
     return proper_name_list
+
+
+def load_proper_names_lexicon():
+    return open_lexicon(
+        PATH_TO_PROPER_NAMES_LEXICON,
+        [PATH_TO_NAME_FILE, PATH_TO_CITY_FILE],
+        load_proper_name_list,
+    )
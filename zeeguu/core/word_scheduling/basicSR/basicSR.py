@@ -3,13 +3,22 @@ from zeeguu.core.model import Bookmark, UserWord, ExerciseOutcome
 from zeeguu.core.model.bookmark import Bookmark
 from zeeguu.core.model.learning_cycle import LearningCycle
 from zeeguu.core.model import UserPreference
+from zeeguu.core.model import DailyLearnerActivity
 
 from zeeguu.core.model import db
 
 from datetime import datetime, timedelta
+from collections import namedtuple
+
+from zeeguu.core.word_scheduling.basicSR.scheduling_snapshot import (
+    SchedulingSnapshot,
+    first_distinct_words,
+)
 
 ONE_DAY = 60 * 24
 
+StudyCandidate = namedtuple("StudyCandidate", ["Bookmark", "rank", "cooling_interval"])
+
 
 class BasicSRSchedule(db.Model):
     __table_args__ = {"mysql_collate": "utf8_bin"}
@@ -35,9 +44,15 @@ class BasicSRSchedule(db.Model):
 
     def set_bookmark_as_learned(self, db_session):
         self.bookmark.learned_time = datetime.now()
+        DailyLearnerActivity.record(
+            db_session,
+            self.bookmark.user_id,
+            self.bookmark.origin.language_id,
+            self.bookmark.learned_time,
+            words_learned=1,
+        )
         db_session.add(self.bookmark)
         db_session.delete(self)
-        db_session.commit()
 
     def there_was_no_need_for_practice_on_date(self, date: datetime = None):
         # a user might have arrived here by doing the
@@ -89,7 +104,11 @@ class BasicSRSchedule(db.Model):
             return None
 
     @classmethod
-    def find_or_create(cls, db_session, bookmark):
+    def find_or_create(cls, db_session, bookmark, commit=True):
+        """
+        :param commit: if False, a new schedule is only flushed, and
+        the caller must commit
+        """
         raise NotImplementedError
 
     @classmethod
@@ -107,30 +126,36 @@ class BasicSRSchedule(db.Model):
         return None
 
     @classmethod
-    def update(cls, db_session, bookmark, outcome, time: datetime = None):
+    def update(cls, db_session, bookmark, outcome, time: datetime = None, commit=True):
+        """
+        :param commit: if False, the caller must commit; e.g. when the
+        outcomes of several exercises are saved together
+        """
         if not time:
             time = datetime.now()
 
         if outcome == ExerciseOutcome.OTHER_FEEDBACK:
             from zeeguu.core.model.bookmark_user_preference import UserWordExPreference
 
-            schedule = cls.find_or_create(db_session, bookmark)
+            schedule = cls.find_or_create(db_session, bookmark, commit)
             bookmark.fit_for_study = 0
             ## Since the user has explicitly given feedback, this should
             # be recorded as a user preference.
             bookmark.user_preference = UserWordExPreference.DONT_USE_IN_EXERCISES
             db_session.add(bookmark)
             db_session.delete(schedule)
-            db_session.commit()
+            if commit:
+                db_session.commit()
             return
 
         correctness = ExerciseOutcome.is_correct(outcome)
-        schedule = cls.find_or_create(db_session, bookmark)
+        schedule = cls.find_or_create(db_session, bookmark, commit)
         if schedule.there_was_no_need_for_practice_on_date(time):
             return
 
         schedule.update_schedule(db_session, correctness, time)
-        db_session.commit()
+        if commit:
+            db_session.commit()
 
     @classmethod
     def get_scheduled_bookmarks_for_user(cls, user, limit):
@@ -152,7 +177,7 @@ class BasicSRSchedule(db.Model):
         # The scheduled bookmarks are sorted by the most common in the language and
         # then by cooling interval, meaning the words that are closest to being learned
         # come before the ones that are just learned.
-        scheduled_candidates_query.order_by(
+        scheduled_candidates_query = scheduled_candidates_query.order_by(
             -UserWord.rank.desc(), cls.cooling_interval.desc()
         )  # By using the negative for rank, we ensure NULL is last.
         if limit is None:
@@ -211,28 +236,62 @@ class BasicSRSchedule(db.Model):
          1. Words that are most common in the language (utilizing the word rank in the db
          2. Words that are closest to being learned (indicated by `cooling_interval`,
         the highest the closest it is)
+
+        To update the order of bookmarks look at SchedulingSnapshot.study_candidates
         """
+        return [each.Bookmark for each in cls.study_candidates(user, limit)]
 
-        def priority_by_rank(bookmark):
-            # If this is updated remember to update the order_by in
-            # get_scheduled_bookmarks_for_user and get_unscheduled_bookmarks_for_user
-            bookmark_info = bookmark.json_serializable_dict()
-            cooling_interval = bookmark_info["cooling_interval"]
-            cooling_interval = cooling_interval if cooling_interval is not None else -1
-            word_rank = bookmark_info["origin_rank"]
-            if word_rank == "":
-                word_rank = UserWord.IMPOSSIBLE_RANK
-            return word_rank, -cooling_interval
-
-        scheduled_candidates = cls.get_scheduled_bookmarks_for_user(user, limit)
-        unscheduled_bookmarks = cls.get_unscheduled_bookmarks_for_user(user, limit)
-
-        all_possible_bookmarks = scheduled_candidates + unscheduled_bookmarks
-        no_duplicate_bookmarks = cls.remove_duplicated_bookmarks(all_possible_bookmarks)
-        sorted_candidates = sorted(
-            no_duplicate_bookmarks, key=lambda x: priority_by_rank(x)
+    @classmethod
+    def study_candidates(cls, user, limit):
+        """
+        The bookmarks that are due today together with the ones that are
+        not yet in the pipeline, in the order in which they should be studied,
+        with only one bookmark per (lowercased) word.
+
+        Computed from the SchedulingSnapshot of the user; only the
+        returned bookmarks are loaded from the DB.
+
+        :param limit: If None all the candidates are returned
+        :return: list of rows with the attributes Bookmark, rank, and
+        cooling_interval (None for the bookmarks that are not scheduled)
+        """
+        snapshot = SchedulingSnapshot.of(user)
+        candidates = first_distinct_words(
+            snapshot.study_candidates(
+                cls.get_end_of_today(),
+                UserPreference.is_productive_exercises_preference_enabled(user),
+            ),
+            limit,
         )
-        return sorted_candidates
+        bookmarks = cls._bookmarks_by_id([each.bookmark_id for each in candidates])
+        return [
+            StudyCandidate(
+                bookmarks[each.bookmark_id], each.rank, each.cooling_interval
+            )
+            for each in candidates
+            if each.bookmark_id in bookmarks
+        ]
+
+    @classmethod
+    def _bookmarks_by_id(cls, bookmark_ids):
+        if not bookmark_ids:
+            return {}
+        return {
+            each.id: each
+            for each in Bookmark.query.filter(Bookmark.id.in_(bookmark_ids)).all()
+        }
+
+    @classmethod
+    def _bookmarks_in_order(cls, schedulable_bookmarks):
+        bookmarks = cls._bookmarks_by_id(
+            [each.bookmark_id for each in schedulable_bookmarks]
+        )
+        # a bookmark might have been deleted since the snapshot was taken
+        return [
+            bookmarks[each.bookmark_id]
+            for each in schedulable_bookmarks
+            if each.bookmark_id in bookmarks
+        ]
 
     @classmethod
     def priority_scheduled_bookmarks_to_study(cls, user, limit):
@@ -243,14 +302,17 @@ class BasicSRSchedule(db.Model):
         The original logic is kept in bookmarks_to_study as it is called to
         get similar_words to function as distractors in the exercises.
 
-        To update the order of bookmarks look at the order_by in
-        get_scheduled_bookmarks_for_user
+        To update the order of bookmarks look at
+        SchedulingSnapshot.scheduled_before
         """
-
-        scheduled_candidates = cls.get_scheduled_bookmarks_for_user(user, limit)
-        no_duplicate_bookmarks = cls.remove_duplicated_bookmarks(scheduled_candidates)
-
-        return no_duplicate_bookmarks
+        snapshot = SchedulingSnapshot.of(user)
+        scheduled_candidates = snapshot.scheduled_before(
+            cls.get_end_of_today(),
+            UserPreference.is_productive_exercises_preference_enabled(user),
+        )
+        return cls._bookmarks_in_order(
+            first_distinct_words(scheduled_candidates, limit)
+        )
 
     @classmethod
     def bookmarks_to_study(cls, user, required_count):
@@ -269,26 +331,12 @@ class BasicSRSchedule(db.Model):
 
     @classmethod
     def bookmarks_in_pipeline(cls, user):
-        # Get the candidates, words that are to practice
-        scheduled = (
-            Bookmark.query.join(cls)
-            .filter(Bookmark.user_id == user.id)
-            .join(UserWord, Bookmark.origin_id == UserWord.id)
-            .filter(UserWord.language_id == user.learned_language_id)
-            .all()
-        )
-        return scheduled
+        in_pipeline = SchedulingSnapshot.of(user).in_pipeline()
+        return cls._bookmarks_in_order(in_pipeline)
 
     @classmethod
     def total_bookmarks_in_pipeline(cls, user) -> int:
-        total_pipeline_bookmarks = (
-            Bookmark.query.join(cls)
-            .filter(Bookmark.user_id == user.id)
-            .join(UserWord, Bookmark.origin_id == UserWord.id)
-            .filter(UserWord.language_id == user.learned_language_id)
-            .count()
-        )
-        return total_pipeline_bookmarks
+        return len(SchedulingSnapshot.of(user).in_pipeline())
 
     @classmethod
     def schedule_for_user(cls, user_id):
@@ -38,7 +38,7 @@ class FourLevelsPerWord(BasicSRSchedule):
     def __init__(self, bookmark=None, bookmark_id=None):
         super(FourLevelsPerWord, self).__init__(bookmark, bookmark_id)
 
-    def is_about_to_be_learned(self):
+    def is_about_to_be_learned(self, productive_exercises_enabled=None):
         level_before_this_exercises = self.bookmark.level
         return (
             self.cooling_interval == self.MAX_INTERVAL
@@ -121,7 +121,7 @@ class FourLevelsPerWord(BasicSRSchedule):
         return len(cls.NEXT_COOLING_INTERVAL_ON_SUCCESS)
 
     @classmethod
-    def find_or_create(cls, db_session, bookmark):
+    def find_or_create(cls, db_session, bookmark, commit=True):
 
         schedule = super(FourLevelsPerWord, cls).find(bookmark)
 
@@ -129,6 +129,9 @@ class FourLevelsPerWord(BasicSRSchedule):
             schedule = cls(bookmark)
             bookmark.level = 1
             db_session.add_all([schedule, bookmark])
-            db_session.commit()
+            if commit:
+                db_session.commit()
+            else:
+                db_session.flush()
 
         return schedule
@@ -0,0 +1,257 @@
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, event, func, or_
+from sqlalchemy.orm import Session
+
+from zeeguu.core.model import Bookmark, UserWord, db
+from zeeguu.core.model.learning_cycle import LearningCycle
+
+# the exercise UI asks for the bookmarks to study, the bookmarks in the
+# pipeline, their count, etc. one right after the other; they are all
+# answered from the same snapshot, as long as it's not older than this
+MAX_AGE = timedelta(minutes=1)
+
+SchedulableBookmark = namedtuple(
+    "SchedulableBookmark",
+    [
+        "bookmark_id",
+        "lowercase_word",
+        "rank",
+        "learning_cycle",
+        "schedule_id",
+        "next_practice_time",
+        "cooling_interval",
+    ],
+)
+
+_snapshots = {}
+# a snapshot that was being taken while the snapshots were
+# invalidated might be stale already, so it's not kept
+_invalidation_count = 0
+_lock = threading.Lock()
+
+
+class SchedulingSnapshot:
+    """
+    The bookmarks of a user, in the language they learn, that the exercises
+    can be built from: the ones in the pipeline (i.e. with a schedule), and
+    the ones that are fit for study but not scheduled yet; together with
+    their schedules and ranks, as they were when the snapshot was taken.
+
+    Loaded with a single query, and kept in memory for MAX_AGE, or until
+    a transaction that changed a bookmark or a schedule of the user is
+    committed (see _changed_schedules_of). The snapshot only holds plain
+    values, not model objects, so it can be shared between the requests.
+    """
+
+    def __init__(self, user_id, language_id, rows):
+        self.user_id = user_id
+        self.language_id = language_id
+        self.rows = rows
+        self.taken_at = datetime.now()
+
+    @classmethod
+    def of(cls, user):
+        user_id = user.id
+        with _lock:
+            snapshot = _snapshots.get(user_id)
+        if (
+            snapshot is None
+            or snapshot.language_id != user.learned_language_id
+            or datetime.now() - snapshot.taken_at > MAX_AGE
+        ):
+            snapshot = cls._take(user)
+            # the snapshot sees the DB as it was when the transaction began
+            # (e.g. with REPEATABLE READ), and the changes of the transaction
+            # that are not committed yet; so it's not kept if a snapshot was
+            # invalidated since the transaction began, or if it changed
+            # the schedule of the user itself
+            began_at_count = db.session.info.get(_INVALIDATION_COUNT)
+            changed_by_the_transaction = snapshot.user_id in db.session.info.get(
+                _CHANGED_USERS, ()
+            )
+            with _lock:
+                if (
+                    began_at_count == _invalidation_count
+                    and not changed_by_the_transaction
+                ):
+                    _snapshots[snapshot.user_id] = snapshot
+        return snapshot
+
+    @classmethod
+    def _take(cls, user):
+        from zeeguu.core.word_scheduling.basicSR.basicSR import BasicSRSchedule
+
+        unscheduled = and_(
+            BasicSRSchedule.id == None,
+            Bookmark.learned_time == None,
+            Bookmark.fit_for_study == 1,
+        )
+        rows = (
+            db.session.query(
+                Bookmark.id,
+                func.lower(UserWord.word),
+                UserWord.rank,
+                Bookmark.learning_cycle,
+                BasicSRSchedule.id,
+                BasicSRSchedule.next_practice_time,
+                BasicSRSchedule.cooling_interval,
+            )
+            .join(UserWord, Bookmark.origin_id == UserWord.id)
+            .outerjoin(BasicSRSchedule, BasicSRSchedule.bookmark_id == Bookmark.id)
+            .filter(Bookmark.user_id == user.id)
+            .filter(UserWord.language_id == user.learned_language_id)
+            .filter(or_(BasicSRSchedule.id != None, unscheduled))
+            .all()
+        )
+        return cls(
+            user.id,
+            user.learned_language_id,
+            [SchedulableBookmark(*each) for each in rows],
+        )
+
+    def in_pipeline(self):
+        return [each for each in self.rows if each.schedule_id is not None]
+
+    def scheduled_before(self, end_of_day, productive_exercises_enabled):
+        """
+        :return: the bookmarks in the pipeline that are due before end_of_day;
+        the most common words first, and then the ones closest to being learned
+        """
+        due = [
+            each
+            for each in self.in_pipeline()
+            if each.next_practice_time < end_of_day
+            and (
+                productive_exercises_enabled
+                or each.learning_cycle == LearningCycle.RECEPTIVE
+            )
+        ]
+        # the words without a rank come last
+        return sorted(
+            due,
+            key=lambda each: (
+                each.rank is None,
+                each.rank or 0,
+                -(each.cooling_interval or 0),
+                each.bookmark_id,
+            ),
+        )
+
+    def study_candidates(self, end_of_day, productive_exercises_enabled):
+        """
+        :return: the bookmarks that are due before end_of_day together
+        with the ones that are not yet in the pipeline, ordered like in
+        BasicSRSchedule.all_bookmarks_priority_to_study
+        """
+        due_ids = set(
+            each.bookmark_id
+            for each in self.scheduled_before(end_of_day, productive_exercises_enabled)
+        )
+        candidates = [
+            each
+            for each in self.rows
+            if each.bookmark_id in due_ids or each.schedule_id is None
+        ]
+        return sorted(
+            candidates,
+            key=lambda each: (
+                UserWord.IMPOSSIBLE_RANK if each.rank is None else each.rank,
+                -(-1 if each.cooling_interval is None else each.cooling_interval),
+                each.bookmark_id,
+            ),
+        )
+
+
+def first_distinct_words(schedulable_bookmarks, limit):
+    """
+    :return: the first limit (or all, if limit is None) of the bookmarks,
+    with only one bookmark per (lowercased) word; a user might have
+    translated the same word in several contexts, but in a session
+    a word should only show up once
+    """
+    result = []
+    seen_words = set()
+    for each in schedulable_bookmarks:
+        if limit is not None and len(result) == limit:
+            break
+        if each.lowercase_word not in seen_words:
+            seen_words.add(each.lowercase_word)
+            result.append(each)
+    return result
+
+
+def invalidate_scheduling_snapshot(user_id):
+    global _invalidation_count
+    with _lock:
+        _snapshots.pop(user_id, None)
+        _invalidation_count += 1
+
+
+def invalidate_all_scheduling_snapshots():
+    """
+    Must be called when the model gets bound to a different
+    database, e.g. every time an app is created in the tests
+    """
+    global _invalidation_count
+    with _lock:
+        _snapshots.clear()
+        _invalidation_count += 1
+
+
+# the ids of the users whose bookmarks or schedules were changed in the
+# transaction of the session; their snapshots are invalidated once it
+# is committed, such that no snapshot is taken from the state before
+_CHANGED_USERS = "scheduling_snapshot_changed_users"
+
+# the invalidation count when the transaction of the session began
+_INVALIDATION_COUNT = "scheduling_snapshot_invalidation_count"
+
+
+@event.listens_for(Session, "after_begin")
+def _remember_invalidation_count(session, transaction, connection):
+    # not with the lock; a transaction can begin while it is held, e.g.
+    # when an expired user is loaded again
+    if not transaction.nested:
+        session.info[_INVALIDATION_COUNT] = _invalidation_count
+
+
+@event.listens_for(Session, "before_flush")
+def _changed_schedules_of(session, flush_context, instances):
+    from zeeguu.core.word_scheduling.basicSR.basicSR import BasicSRSchedule
+
+    changed_users = session.info.setdefault(_CHANGED_USERS, set())
+    for each in session.new | session.dirty | session.deleted:
+        if isinstance(each, Bookmark):
+            bookmark = each
+        elif isinstance(each, BasicSRSchedule):
+            bookmark = each.bookmark or session.get(Bookmark, each.bookmark_id)
+        else:
+            continue
+        if bookmark is None:
+            continue
+        if bookmark.user_id is not None:
+            changed_users.add(bookmark.user_id)
+        elif bookmark.user is not None:
+            changed_users.add(bookmark.user.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_snapshots(session):
+    if session.in_nested_transaction():
+        # only a savepoint was released
+        return
+    session.info.pop(_INVALIDATION_COUNT, None)
+    for user_id in session.info.pop(_CHANGED_USERS, ()):
+        invalidate_scheduling_snapshot(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_changed_schedules(session, previous_transaction):
+    # when only a savepoint is rolled back, the users stay; at worst
+    # a snapshot is invalidated that did not have to be
+    if not previous_transaction.nested:
+        session.info.pop(_INVALIDATION_COUNT, None)
+        session.info.pop(_CHANGED_USERS, None)
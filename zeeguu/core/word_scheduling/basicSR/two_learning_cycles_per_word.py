@@ -26,13 +26,16 @@ class TwoLearningCyclesPerWord(BasicSRSchedule):
     def __init__(self, bookmark=None, bookmark_id=None):
         super(TwoLearningCyclesPerWord, self).__init__(bookmark, bookmark_id)
 
-    def is_last_cycle(self):
+    def is_last_cycle(self, productive_exercises_enabled=None):
+        # the preference can be passed by callers that
+        # look at many bookmarks of the same user
         learning_cycle = self.bookmark.learning_cycle
-        productive_exercises_enabled = (
-            UserPreference.is_productive_exercises_preference_enabled(
-                self.bookmark.user
+        if productive_exercises_enabled is None:
+            productive_exercises_enabled = (
+                UserPreference.is_productive_exercises_preference_enabled(
+                    self.bookmark.user
+                )
             )
-        )
         return not (
             learning_cycle == LearningCycle.RECEPTIVE and productive_exercises_enabled
         )
@@ -40,8 +43,11 @@ class TwoLearningCyclesPerWord(BasicSRSchedule):
     def is_last_exercise_in_cycle(self):
         return self.cooling_interval == self.MAX_INTERVAL
 
-    def is_about_to_be_learned(self):
-        return self.is_last_cycle() and self.is_last_exercise_in_cycle()
+    def is_about_to_be_learned(self, productive_exercises_enabled=None):
+        return (
+            self.is_last_cycle(productive_exercises_enabled)
+            and self.is_last_exercise_in_cycle()
+        )
 
     def update_schedule(self, db_session, correctness, exercise_time: datetime = None):
 
@@ -101,7 +107,7 @@ class TwoLearningCyclesPerWord(BasicSRSchedule):
         return len(cls.NEXT_COOLING_INTERVAL_ON_SUCCESS)
 
     @classmethod
-    def find_or_create(cls, db_session, bookmark):
+    def find_or_create(cls, db_session, bookmark, commit=True):
 
         schedule = super(TwoLearningCyclesPerWord, cls).find(bookmark)
 
@@ -109,6 +115,9 @@ class TwoLearningCyclesPerWord(BasicSRSchedule):
             schedule = cls(bookmark)
             bookmark.learning_cycle = LearningCycle.RECEPTIVE
             db_session.add_all([schedule, bookmark])
-            db_session.commit()
+            if commit:
+                db_session.commit()
+            else:
+                db_session.flush()
 
         return schedule
@@ -1,7 +1,12 @@
-from wordstats import LanguageInfo
+from functools import lru_cache
+
+from wordstats import LanguageInfo, Word
 
 lang_cache = {}
 
+# every entry is a small slotted object; 100k of them are a few MB
+WORD_STATS_CACHE_SIZE = 100000
+
 
 def lang_info(lang_code):
     if not lang_cache.get(lang_code):
@@ -10,6 +15,27 @@ def lang_info(lang_code):
     return lang_cache[lang_code]
 
 
+@lru_cache(maxsize=WORD_STATS_CACHE_SIZE)
+def word_stats(word: str, lang_code: str):
+    """
+    Word.stats, memoized for the lifetime of the process;
+    the stats are read-only data that ships with wordstats
+    """
+    return Word.stats(word, lang_code)
+
+
+def word_stats_for(words_and_languages):
+    """
+    :param words_and_languages: iterable of (word, lang_code)
+    :return: dictionary (word, lang_code) -> WordInfo, with every
+    distinct pair looked up only once
+    """
+    return {
+        (word, lang_code): word_stats(word, lang_code)
+        for word, lang_code in set(words_and_languages)
+    }
+
+
 # lang_info("da")
 # lang_info("de")
 # lang_info("nl")